@@ -1,12 +1,492 @@
 #!/usr/bin/env python3
-# Auto-generated on 2025-11-04T23:49:43
+# Auto-generated on 2026-10-17T05:46:45
 # Source: asdf-equations.tex
-# NOTE: This file is standalone; it reconstructs SymPy expressions from srepr strings.
+# NOTE: This file is standalone; expressions are rebuilt by the _build_* constructor
+# functions below (the srepr strings in _SREPR are kept as the canonical record).
 from __future__ import annotations
-from typing import Dict, List
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import os
+import time
 import sympy as sp
 
-__all__ = ["asdf_Core"]
+__all__ = ["asdf_Core", "NumericOnlyError"]
+
+# Every plain Symbol used by the equations, created once at import.
+_SYM: Dict[str, sp.Symbol] = {n: sp.Symbol(n) for n in (
+    'A_e',
+    'A_i',
+    'A_t',
+    'A_x',
+    'C_p',
+    'J',
+    'M_i',
+    'M_x',
+    'R',
+    'RT_x',
+    'T_i',
+    'T_x',
+    'T_{cns}',
+    'V_i',
+    'V_x',
+    'Wdot',
+    'g',
+    'gamma',
+    'p_e',
+    'p_i',
+    'p_t',
+    'p_x',
+    'p_{cinj}',
+    'p_{cns}',
+    'p_{inj}',
+    'v_e',
+    'v_i',
+    'v_t',
+    'v_x',
+)}
+
+def _build_t_1_10_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), _SYM['C_p'], sp.Add(_SYM['T_i'], sp.Mul(sp.Integer(-1), _SYM['T_x']))), sp.Mul(sp.Pow(sp.Mul(sp.Integer(2), _SYM['J'], _SYM['g']), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Pow(_SYM['v_x'], sp.Integer(2)))))
+
+def _build_t_1_11_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(144), _SYM['V_x']), sp.Integer(-1)), sp.Mul(_SYM['A_x'], _SYM['v_x'])), sp.Mul(sp.Pow(sp.Mul(sp.Integer(144), _SYM['V_i']), sp.Integer(-1)), sp.Mul(_SYM['A_i'], _SYM['v_i'])))
+
+def _build_t_1_12_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Pow(_SYM['V_i'], _SYM['gamma']), _SYM['p_i']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['V_x'], _SYM['gamma']), _SYM['p_x']))
+
+def _build_t_1_14_0() -> sp.Expr:
+    return sp.Add(sp.Mul(_SYM['p_{cinj}'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(1)), sp.Pow(sp.Pow(sp.Add(sp.Mul(sp.Pow(sp.Integer(2), sp.Integer(-1)), sp.Pow(_SYM['M_i'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1))), sp.Integer(1)), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Integer(-1))))
+
+def _build_t_1_15_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(-1), sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), _SYM['p_{inj}']))
+
+def _build_t_1_16_0() -> sp.Expr:
+    return sp.Add(sp.Mul(_SYM['p_t'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))))))
+
+def _build_t_1_17_0() -> sp.Expr:
+    return sp.Add(_SYM['v_e'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(sp.Mul(_SYM['R'], _SYM['T_i'], sp.Mul(sp.Integer(2), _SYM['g'], _SYM['gamma']), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e'], sp.Pow(_SYM['p_i'], sp.Integer(-1))), sp.Integer(1)), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Rational(1, 2))))
+
+def _build_t_1_18_0() -> sp.Expr:
+    return sp.Add(_SYM['v_e'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Integer(1)), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Rational(1, 2))))
+
+def _build_t_1_19_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), _SYM['A_t'], _SYM['p_{cns}'], sp.Pow(sp.Mul(sp.Pow(sp.Mul(_SYM['R'], _SYM['T_{cns}']), sp.Integer(-1)), sp.Mul(_SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))), sp.Rational(1, 2))), _SYM['Wdot'])
+
+def _build_t_1_20_0() -> sp.Expr:
+    return sp.Add(sp.Mul(_SYM['A_e'], sp.Pow(_SYM['A_t'], sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Mul(sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_e'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Mul(sp.Integer(1), sp.Pow(_SYM['gamma'], sp.Integer(-1))))), sp.Pow(sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Integer(1)), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Rational(1, 2)), sp.Integer(-1))))
+
+def _build_t_1_21_0() -> sp.Expr:
+    return sp.Add(_SYM['p_t'], sp.Mul(sp.Integer(-1), _SYM['p_{cns}'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))))))
+
+def _build_t_1_22_0() -> sp.Expr:
+    return sp.Add(_SYM['v_t'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Rational(1, 2))))
+
+def _build_t_1_24_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_x'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Pow(sp.Integer(2), sp.Integer(-1)), sp.Pow(_SYM['M_x'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1))), sp.Integer(1))), sp.Mul(sp.Pow(sp.Mul(sp.Integer(2), sp.Add(_SYM['gamma'], sp.Integer(-1))), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))))), sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(-1)), _SYM['A_x']))
+
+def _build_t_1_25_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), sp.Mul(sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_x'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Mul(sp.Integer(1), sp.Pow(_SYM['gamma'], sp.Integer(-1))))), sp.Pow(sp.Pow(sp.Mul(sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))), sp.Rational(1, 2)), sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(-1)), _SYM['A_x']))
+
+def _build_t_1_26_0() -> sp.Expr:
+    return sp.Add(_SYM['v_x'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))), sp.Rational(1, 2))))
+
+def _build_t_1_27_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Integer(1)), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Rational(1, 2))), sp.Mul(sp.Pow(_SYM['v_t'], sp.Integer(-1)), _SYM['v_x']))
+
+def _build_t_1_9_0() -> sp.Expr:
+    return sp.Add(sp.Mul(sp.Integer(-1), _SYM['RT_x']), sp.Mul(sp.Integer(144), _SYM['V_x'], _SYM['p_x']))
+
+def _inv_t_1_10_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['J'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(sp.Add(_SYM['T_i'], sp.Mul(sp.Integer(-1), _SYM['T_x'])), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Pow(_SYM['v_x'], sp.Integer(2))))]
+
+def _inv_t_1_10_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['C_p'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(sp.Add(_SYM['T_i'], sp.Mul(sp.Integer(-1), _SYM['T_x'])), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Pow(_SYM['v_x'], sp.Integer(2))))]
+
+def _inv_t_1_10_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['C_p'], sp.Integer(-1)), sp.Pow(_SYM['J'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_x'], _SYM['g']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Pow(_SYM['v_x'], sp.Integer(2))))]
+
+def _inv_t_1_10_0_3() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['C_p'], sp.Integer(-1)), sp.Pow(_SYM['J'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_i'], _SYM['g']), sp.Pow(_SYM['v_i'], sp.Integer(2)), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_x'], sp.Integer(2)))))]
+
+def _inv_t_1_10_0_4() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['C_p'], sp.Integer(-1)), sp.Pow(_SYM['J'], sp.Integer(-1)), sp.Pow(sp.Add(_SYM['T_i'], sp.Mul(sp.Integer(-1), _SYM['T_x'])), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Pow(_SYM['v_x'], sp.Integer(2))))]
+
+def _inv_t_1_10_0_5() -> List[sp.Expr]:
+    return [sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_i'], _SYM['g']), sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_x'], _SYM['g']), sp.Pow(_SYM['v_x'], sp.Integer(2))), sp.Rational(1, 2))), sp.Pow(sp.Add(sp.Mul(sp.Integer(-1), sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_i'], _SYM['g']), sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_x'], _SYM['g']), sp.Pow(_SYM['v_x'], sp.Integer(2))), sp.Rational(1, 2))]
+
+def _inv_t_1_10_0_6() -> List[sp.Expr]:
+    return [sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_i'], _SYM['g']), sp.Mul(sp.Integer(-1), sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_x'], _SYM['g']), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Rational(1, 2))), sp.Pow(sp.Add(sp.Mul(sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_i'], _SYM['g']), sp.Mul(sp.Integer(-1), sp.Integer(2), _SYM['C_p'], _SYM['J'], _SYM['T_x'], _SYM['g']), sp.Pow(_SYM['v_i'], sp.Integer(2))), sp.Rational(1, 2))]
+
+def _inv_t_1_11_0_0() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_x'], _SYM['V_i'], sp.Pow(_SYM['V_x'], sp.Integer(-1)), sp.Pow(_SYM['v_i'], sp.Integer(-1)), _SYM['v_x'])]
+
+def _inv_t_1_11_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_i'], sp.Pow(_SYM['V_i'], sp.Integer(-1)), _SYM['V_x'], _SYM['v_i'], sp.Pow(_SYM['v_x'], sp.Integer(-1)))]
+
+def _inv_t_1_11_0_2() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_i'], sp.Pow(_SYM['A_x'], sp.Integer(-1)), _SYM['V_x'], _SYM['v_i'], sp.Pow(_SYM['v_x'], sp.Integer(-1)))]
+
+def _inv_t_1_11_0_3() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_i'], sp.Integer(-1)), _SYM['A_x'], _SYM['V_i'], sp.Pow(_SYM['v_i'], sp.Integer(-1)), _SYM['v_x'])]
+
+def _inv_t_1_11_0_4() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_i'], sp.Integer(-1)), _SYM['A_x'], _SYM['V_i'], sp.Pow(_SYM['V_x'], sp.Integer(-1)), _SYM['v_x'])]
+
+def _inv_t_1_11_0_5() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_i'], sp.Pow(_SYM['A_x'], sp.Integer(-1)), sp.Pow(_SYM['V_i'], sp.Integer(-1)), _SYM['V_x'], _SYM['v_i'])]
+
+def _inv_t_1_12_0_0() -> List[sp.Expr]:
+    return [sp.Pow(sp.Mul(sp.Pow(_SYM['V_x'], _SYM['gamma']), sp.Pow(_SYM['p_i'], sp.Integer(-1)), _SYM['p_x']), sp.Pow(_SYM['gamma'], sp.Integer(-1)))]
+
+def _inv_t_1_12_0_1() -> List[sp.Expr]:
+    return [sp.Pow(sp.Mul(sp.Pow(_SYM['V_i'], _SYM['gamma']), _SYM['p_i'], sp.Pow(_SYM['p_x'], sp.Integer(-1))), sp.Pow(_SYM['gamma'], sp.Integer(-1)))]
+
+def _inv_t_1_12_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Add(sp.log(_SYM['V_i']), sp.Mul(sp.Integer(-1), sp.log(_SYM['V_x']))), sp.Integer(-1)), sp.log(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), _SYM['p_x'])))]
+
+def _inv_t_1_12_0_3() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['V_i'], sp.Mul(sp.Integer(-1), _SYM['gamma'])), sp.Pow(_SYM['V_x'], _SYM['gamma']), _SYM['p_x'])]
+
+def _inv_t_1_12_0_4() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['V_i'], _SYM['gamma']), sp.Pow(_SYM['V_x'], sp.Mul(sp.Integer(-1), _SYM['gamma'])), _SYM['p_i'])]
+
+def _inv_t_1_14_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Integer(2), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), _SYM['p_{cns}'], sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(1)), sp.Pow(sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_i'], sp.Integer(2))), sp.Integer(2)), sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_14_0_3() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Integer(2), sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), _SYM['p_{cinj}'], sp.Pow(sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(1)), sp.Integer(-1)), sp.Pow(sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_i'], sp.Integer(2))), sp.Integer(2)), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_15_0_0() -> List[sp.Expr]:
+    return [sp.Pow(sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_i']), _SYM['p_{inj}'])), sp.Rational(1, 2)), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(_SYM['p_i'], sp.Mul(sp.Integer(-1), _SYM['p_{inj}']))), sp.Rational(1, 2)))]
+
+def _inv_t_1_15_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(-2)), sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_i']), _SYM['p_{inj}']))]
+
+def _inv_t_1_15_0_2() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_{inj}'], sp.Pow(sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(1)), sp.Integer(-1)))]
+
+def _inv_t_1_15_0_3() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_i'], sp.Add(sp.Mul(sp.Pow(_SYM['M_i'], sp.Integer(2)), _SYM['gamma']), sp.Integer(1)))]
+
+def _inv_t_1_16_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_{cns}'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_16_0_2() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_t'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_17_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['T_i'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_i'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(sp.Mul(_SYM['gamma'], sp.Add(sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))))), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_e'], sp.Integer(2))), sp.Pow(_SYM['v_i'], sp.Integer(2))))]
+
+def _inv_t_1_17_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_i'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(sp.Mul(_SYM['gamma'], sp.Add(sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))))), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_e'], sp.Integer(2))), sp.Pow(_SYM['v_i'], sp.Integer(2))))]
+
+def _inv_t_1_17_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_i'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_i'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(sp.Mul(_SYM['gamma'], sp.Add(sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_i'], sp.Integer(2))))), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_e'], sp.Integer(2))), sp.Pow(_SYM['v_i'], sp.Integer(2))))]
+
+def _inv_t_1_17_0_6() -> List[sp.Expr]:
+    return [sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_i'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_i'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Mul(sp.Pow(_SYM['v_i'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Rational(1, 2))]
+
+def _inv_t_1_17_0_7() -> List[sp.Expr]:
+    return [sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), sp.Integer(2), _SYM['R'], _SYM['T_i'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_i'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Mul(_SYM['gamma'], sp.Pow(_SYM['v_e'], sp.Integer(2))), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_e'], sp.Integer(2))))), sp.Rational(1, 2)), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_i'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Integer(-1), sp.Pow(_SYM['p_i'], sp.Integer(-1)), sp.Add(_SYM['p_e'], sp.Mul(sp.Integer(-1), _SYM['p_i']))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(_SYM['v_e'], sp.Integer(2))), sp.Pow(_SYM['v_e'], sp.Integer(2)))), sp.Rational(1, 2)))]
+
+def _inv_t_1_18_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(_SYM['gamma'], sp.Integer(-1)))]
+
+def _inv_t_1_18_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(_SYM['gamma'], sp.Integer(-1)))]
+
+def _inv_t_1_18_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])))), sp.Add(_SYM['gamma'], sp.Integer(-1)))]
+
+def _inv_t_1_18_0_4() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_{cns}'], sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))))]
+
+def _inv_t_1_18_0_5() -> List[sp.Expr]:
+    return [sp.Mul(sp.Integer(-1), _SYM['p_e'], sp.Pow(sp.Add(sp.Pow(sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_e'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Integer(-1)), sp.Integer(-1)))]
+
+def _inv_t_1_18_0_6() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Integer(2), sp.Rational(1, 2)), sp.Pow(sp.Mul(_SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_19_0_0() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['Wdot'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))))), sp.Rational(-1, 2)))]
+
+def _inv_t_1_19_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(2)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['Wdot'], sp.Integer(-2)), _SYM['g'], _SYM['gamma'], sp.Pow(_SYM['p_{cns}'], sp.Integer(2)), sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))]
+
+def _inv_t_1_19_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(2)), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['Wdot'], sp.Integer(-2)), _SYM['g'], _SYM['gamma'], sp.Pow(_SYM['p_{cns}'], sp.Integer(2)), sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))]
+
+def _inv_t_1_19_0_3() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_t'], _SYM['p_{cns}'], sp.Pow(sp.Mul(sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))))), sp.Rational(1, 2)))]
+
+def _inv_t_1_19_0_4() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(-2)), _SYM['R'], _SYM['T_{cns}'], sp.Pow(_SYM['Wdot'], sp.Integer(2)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['p_{cns}'], sp.Integer(-2)), sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))]
+
+def _inv_t_1_19_0_6() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['A_t'], sp.Integer(-1)), _SYM['Wdot'], sp.Pow(sp.Mul(sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), _SYM['g'], _SYM['gamma'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))))), sp.Rational(-1, 2)))]
+
+def _inv_t_1_20_0_0() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_t'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_e'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Pow(_SYM['gamma'], sp.Integer(-1))), sp.Pow(sp.Mul(sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))), sp.Rational(-1, 2)))]
+
+def _inv_t_1_20_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_e'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_e'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_e']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_21_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_{cns}'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_21_0_2() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_t'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))]
+
+def _inv_t_1_22_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_t'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(1)))]
+
+def _inv_t_1_22_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_t'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(1)))]
+
+def _inv_t_1_22_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_t'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(1)))]
+
+def _inv_t_1_22_0_3() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(_SYM['v_t'], sp.Integer(2)), sp.Pow(sp.Add(sp.Mul(sp.Integer(2), _SYM['R'], _SYM['T_{cns}'], _SYM['g']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['v_t'], sp.Integer(2)))), sp.Integer(-1)))]
+
+def _inv_t_1_22_0_4() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Integer(2), sp.Rational(1, 2)), sp.Pow(sp.Mul(_SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_24_0_0() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_x'], _SYM['M_x'], sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Pow(_SYM['M_x'], sp.Integer(2)), _SYM['gamma']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_x'], sp.Integer(2))), sp.Integer(2))), sp.Mul(sp.Integer(-1), sp.Rational(1, 2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))]
+
+def _inv_t_1_24_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_t'], sp.Pow(_SYM['M_x'], sp.Integer(-1)), sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Pow(_SYM['M_x'], sp.Integer(2)), _SYM['gamma']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['M_x'], sp.Integer(2))), sp.Integer(2))), sp.Mul(sp.Rational(1, 2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1)))))]
+
+def _inv_t_1_25_0_0() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_x'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(sp.Integer(-1), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_x'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Mul(sp.Integer(-1), sp.Pow(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), _SYM['gamma'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Integer(1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_25_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['A_t'], sp.Pow(sp.Mul(sp.Integer(2), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))), sp.Pow(sp.Mul(sp.Pow(_SYM['p_x'], sp.Integer(-1)), _SYM['p_{cns}']), sp.Pow(_SYM['gamma'], sp.Integer(-1))), sp.Pow(sp.Mul(sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['gamma'], sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), _SYM['gamma'], sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1))))), sp.Integer(1))), sp.Rational(-1, 2)))]
+
+def _inv_t_1_26_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_x'], sp.Integer(2)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])), sp.Pow(sp.Add(sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Integer(-1)), sp.Integer(-1)))]
+
+def _inv_t_1_26_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['g'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_x'], sp.Integer(2)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])), sp.Pow(sp.Add(sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Integer(-1)), sp.Integer(-1)))]
+
+def _inv_t_1_26_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 2), sp.Pow(_SYM['R'], sp.Integer(-1)), sp.Pow(_SYM['T_{cns}'], sp.Integer(-1)), sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Pow(_SYM['v_x'], sp.Integer(2)), sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), _SYM['gamma'])), sp.Pow(sp.Add(sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Integer(-1)), sp.Integer(-1)))]
+
+def _inv_t_1_26_0_6() -> List[sp.Expr]:
+    return [sp.Mul(sp.Pow(sp.Integer(2), sp.Rational(1, 2)), sp.Pow(sp.Mul(_SYM['R'], _SYM['T_{cns}'], _SYM['g'], _SYM['gamma'], sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(_SYM['p_x'], sp.Pow(_SYM['p_{cns}'], sp.Integer(-1))), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_27_0_1() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['p_{cns}'], sp.Add(sp.Integer(1), sp.Mul(sp.Integer(-1), sp.Pow(sp.Mul(sp.Pow(_SYM['v_t'], sp.Integer(-2)), sp.Pow(_SYM['v_x'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))))))]
+
+def _inv_t_1_27_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Integer(-1), _SYM['p_x'], sp.Pow(sp.Add(sp.Pow(sp.Mul(sp.Pow(_SYM['v_t'], sp.Integer(-2)), sp.Pow(_SYM['v_x'], sp.Integer(2)), sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(1)), sp.Integer(-1))), sp.Mul(_SYM['gamma'], sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)))), sp.Integer(-1)), sp.Integer(-1)))]
+
+def _inv_t_1_27_0_3() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['v_x'], sp.Pow(sp.Mul(sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_x']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))), sp.Rational(-1, 2)))]
+
+def _inv_t_1_27_0_4() -> List[sp.Expr]:
+    return [sp.Mul(_SYM['v_t'], sp.Pow(sp.Mul(sp.Pow(sp.Mul(sp.Pow(_SYM['p_{cns}'], sp.Integer(-1)), sp.Add(sp.Mul(sp.Integer(-1), _SYM['p_x']), _SYM['p_{cns}'])), sp.Mul(sp.Pow(_SYM['gamma'], sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(-1)))), sp.Pow(sp.Add(_SYM['gamma'], sp.Integer(-1)), sp.Integer(-1)), sp.Add(_SYM['gamma'], sp.Integer(1))), sp.Rational(1, 2)))]
+
+def _inv_t_1_9_0_0() -> List[sp.Expr]:
+    return [sp.Mul(sp.Integer(144), _SYM['V_x'], _SYM['p_x'])]
+
+def _inv_t_1_9_0_1() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 144), _SYM['RT_x'], sp.Pow(_SYM['p_x'], sp.Integer(-1)))]
+
+def _inv_t_1_9_0_2() -> List[sp.Expr]:
+    return [sp.Mul(sp.Rational(1, 144), _SYM['RT_x'], sp.Pow(_SYM['V_x'], sp.Integer(-1)))]
+
+def _kernel_args(names: List[str], arrays: dict, where: str) -> Tuple[list, tuple]:
+    # float arrays for `names` in order, and the shape they broadcast to
+    import numpy as np
+    missing = [n for n in names if n not in arrays]
+    if missing:
+        raise KeyError(f"Missing values for {missing} in {where}")
+    args = [np.asarray(arrays[n], dtype=float) for n in names]
+    return args, (np.broadcast_shapes(*(a.shape for a in args)) if args else ())
+
+# Inputs with more points than this are evaluated _CHUNK points at a time, so the
+# temporaries of one slice stay in cache between the operations that reuse them.
+_CHUNK = 16384
+
+def _chunked(fn: Callable, args: list, shape: tuple, n_out: int) -> list:
+    import numpy as np
+    size = int(np.prod(shape))
+    if size <= _CHUNK:
+        return [np.broadcast_to(np.asarray(v, dtype=float), shape).copy() for v in fn(*args)]
+    flat = [a.reshape(()) if a.size == 1 else np.broadcast_to(a, shape).reshape(-1) for a in args]
+    outs = [np.empty(size) for _ in range(n_out)]
+    for s in range(0, size, _CHUNK):
+        for o, v in zip(outs, fn(*[a if a.ndim == 0 else a[s:s + _CHUNK] for a in flat])):
+            o[s:s + _CHUNK] = v
+    return [o.reshape(shape) for o in outs]
+
+class NumericOnlyError(ValueError):
+    """
+    solve() has no closed form for `var` in line i of `tag`: solve it numerically.
+
+    `reason` is why the codegen, or solve()'s own bounded sp.solve, found none (timeout,
+    solver error, no solution); numeric_only() returns the codegen's. `numeric_only` is
+    always True.
+    """
+
+    numeric_only = True
+
+    def __init__(self, tag: str, i: int, var: str, reason: str) -> None:
+        super().__init__(f"No closed form for {var!r} in tag '{tag}' i={i} ({reason}); solve numerically")
+        self.tag = tag
+        self.i = i
+        self.var = var
+        self.reason = reason
+
+class BoundResidual:
+    """
+    One residual with some of its symbols fixed, from bind(). core_codegen.py emits
+    this class's source (inspect.getsource) into the generated modules, whose bind()
+    returns it as well.
+
+    expr:   the residual with the fixed values substituted (done once, with xreplace)
+    fixed:  name -> value that was substituted
+    free:   names of the symbols still to be supplied, sorted
+
+    Calling it with values for (some of) the free names substitutes just those into
+    ``expr``; evaluate() runs ``expr`` over NumPy arrays with a kernel lambdified once.
+    Names that are not free symbols of the residual are ignored in both.
+    """
+
+    def __init__(self, tag: str, i: int, expr: sp.Expr, symbols: Dict[str, sp.Symbol],
+                 fixed: dict):
+        self.tag = tag
+        self.i = i
+        self.fixed = dict(fixed)
+        self._symbols = {n: s for n, s in symbols.items() if n not in fixed}
+        subs = {symbols[n]: sp.sympify(v) for n, v in fixed.items()}
+        self.expr = expr.xreplace(subs) if subs else expr
+        self.free = sorted(self._symbols)
+        self._kernel = None
+
+    def __call__(self, **values) -> sp.Expr:
+        syms = self._symbols
+        subs = {syms[n]: sp.sympify(v) for n, v in values.items() if n in syms}
+        return self.expr.xreplace(subs) if subs else self.expr
+
+    def evaluate(self, **arrays):
+        """expr over NumPy arrays for the free names (they broadcast against each other)."""
+        import numpy as np
+        if self._kernel is None:
+            self._kernel = sp.lambdify([self._symbols[n] for n in self.free], self.expr,
+                                       modules='numpy')
+        args, shape = _kernel_args(self.free, arrays, f"tag {self.tag!r} i={self.i}")
+        out = np.asarray(self._kernel(*args), dtype=float)
+        return out if out.shape == shape else np.broadcast_to(out, shape).copy()
+
+    def __repr__(self) -> str:
+        return f'BoundResidual({self.tag!r}, {self.i}, fixed={sorted(self.fixed)}, free={self.free})'
+
+def _solve_worker_main(conn) -> None:
+    import signal
+    # Ctrl-C is the parent's to handle; SIGTERM must work even when the parent is the
+    # daemon, whose asyncio handlers were inherited with the fork
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        eqs, unknowns = job
+        try:
+            sols = sp.solve(eqs, unknowns, dict=True)
+            conn.send(('ok', sols))
+        except Exception as e:
+            conn.send(('error', f'{type(e).__name__}: {e}'))
+
+class SolveWorker:
+    """
+    One child process running ``sp.solve`` jobs in turn (calls from several threads
+    queue on a lock). ``solve`` returns ('ok', solutions), ('timeout', None) or
+    ('error', 'Type: message'); on a timeout the child is killed and the next call
+    starts a new one (``restarts`` counts them).
+    """
+
+    def __init__(self):
+        import threading
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn = None
+        self.restarts = 0
+
+    def _start(self) -> None:
+        import multiprocessing as mp
+        # fork: the child starts with SymPy loaded and does not need to re-import this
+        # module by name
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork') if 'fork' in methods else mp.get_context()
+        parent, child = ctx.Pipe()
+        proc = ctx.Process(target=_solve_worker_main, args=(child,), name='core_eqs-solve',
+                           daemon=True)
+        proc.start()
+        child.close()
+        self._proc, self._conn = proc, parent
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.join()
+            self._conn.close()
+            self._proc = self._conn = None
+            self.restarts += 1
+
+    def solve(self, eqs, unknowns, timeout: float) -> Tuple[str, object]:
+        with self._lock:
+            if self._proc is None or not self._proc.is_alive():
+                self._kill()
+                self._start()
+            try:
+                self._conn.send((eqs, unknowns))
+            except OSError:
+                self._kill()
+                self._start()
+                self._conn.send((eqs, unknowns))
+            if not self._conn.poll(max(timeout, 0.0)):
+                self._kill()
+                return 'timeout', None
+            try:
+                return self._conn.recv()
+            except (EOFError, OSError):
+                self._kill()
+                return 'error', 'solver process died'
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._conn.send(None)
+                self._proc.join(1.0)
+            except OSError:
+                pass
+            if self._proc.is_alive():
+                self._proc.kill()
+                self._proc.join()
+            self._conn.close()
+            self._proc = self._conn = None
+
+_SOLVE_WORKER: Optional[SolveWorker] = None
+
+def solve_worker() -> SolveWorker:
+    """The process-wide SolveWorker bounded solves share (started on first use)."""
+    global _SOLVE_WORKER
+    if _SOLVE_WORKER is None:
+        import atexit
+        import multiprocessing.util  # noqa: F401 -- its exit hook must run after close()
+        _SOLVE_WORKER = SolveWorker()
+        atexit.register(_SOLVE_WORKER.close)
+    return _SOLVE_WORKER
 
 class asdf_Core:
     """Callable symbolic core equations.
@@ -14,8 +494,22 @@ class asdf_Core:
     Access:
       - tags() -> List[str]
       - residual(tag: str, i: int, **subs) -> sp.Expr
+      - bind(tag: str, i: int, **fixed) -> BoundResidual  (substitute constants once, then
+        call it with the remaining values; LRU-cached per fixed values)
       - symbols(tag: str, i: int) -> List[sp.Symbol]
       - eq_all(tag: str) -> List[sp.Expr]
+      - equations_with(name: str | sp.Symbol) -> List[(tag, i)]  (every line using a symbol)
+      - warm(tags: List[str] | None = None) -> None  (build expressions up front)
+      - evaluate(tag: str, i: int, **arrays) -> np.ndarray  (compiled, broadcasting)
+      - evaluate_all(**arrays) / evaluate_tags(tags, **arrays) -> Dict[tag, List[np.ndarray]]
+        (every residual of the tags in one kernel, shared subexpressions computed once)
+      - jacobian(eqs, wrt=None) -> sp.Matrix  (eqs: a tag, a (tag, i) or a list of them)
+      - evaluate_jacobian(eqs, wrt=None, **arrays) -> np.ndarray  (rows, len(wrt), *shape)
+      - solve(tag: str, i: int, var: str | sp.Symbol, timeout=None, **params) -> List[sp.Expr]
+        (precomputed closed forms; raises NumericOnlyError for numeric-only symbols)
+      - numeric_only(tag: str, i: int, var: str | sp.Symbol) -> str | None  (why not)
+      - call_stats(top: int | None = None) -> per-line call counts/time, hottest first
+        (recorded only with asdf_Core(stats=True) or CORE_EQS_STATS=1)
       - Convenience per-line methods: eq_<tag>_<i>(**subs)
     """
 
@@ -93,9 +587,107 @@ class asdf_Core:
         '1.9': [['RT_x', 'V_x', 'p_x']],
     }
 
+    _INDEX: Dict[str, List[tuple]] = {
+        'A_e': [('1.20', 0)],
+        'A_i': [('1.11', 0)],
+        'A_t': [('1.19', 0), ('1.20', 0), ('1.24', 0), ('1.25', 0)],
+        'A_x': [('1.11', 0), ('1.24', 0), ('1.25', 0)],
+        'C_p': [('1.10', 0)],
+        'J': [('1.10', 0)],
+        'M_i': [('1.14', 0), ('1.15', 0)],
+        'M_x': [('1.24', 0)],
+        'R': [('1.17', 0), ('1.18', 0), ('1.19', 0), ('1.22', 0), ('1.26', 0)],
+        'RT_x': [('1.9', 0)],
+        'T_i': [('1.10', 0), ('1.17', 0)],
+        'T_x': [('1.10', 0)],
+        'T_{cns}': [('1.18', 0), ('1.19', 0), ('1.22', 0), ('1.26', 0)],
+        'V_i': [('1.11', 0), ('1.12', 0)],
+        'V_x': [('1.11', 0), ('1.12', 0), ('1.9', 0)],
+        'Wdot': [('1.19', 0)],
+        'g': [('1.10', 0), ('1.17', 0), ('1.18', 0), ('1.19', 0), ('1.22', 0), ('1.26', 0)],
+        'gamma': [('1.12', 0), ('1.14', 0), ('1.15', 0), ('1.16', 0), ('1.17', 0), ('1.18', 0), ('1.19', 0), ('1.20', 0), ('1.21', 0), ('1.22', 0), ('1.24', 0), ('1.25', 0), ('1.26', 0), ('1.27', 0)],
+        'p_e': [('1.17', 0), ('1.18', 0), ('1.20', 0)],
+        'p_i': [('1.12', 0), ('1.15', 0), ('1.17', 0)],
+        'p_t': [('1.16', 0), ('1.21', 0)],
+        'p_x': [('1.12', 0), ('1.25', 0), ('1.26', 0), ('1.27', 0), ('1.9', 0)],
+        'p_{cinj}': [('1.14', 0)],
+        'p_{cns}': [('1.14', 0), ('1.16', 0), ('1.18', 0), ('1.19', 0), ('1.20', 0), ('1.21', 0), ('1.25', 0), ('1.26', 0), ('1.27', 0)],
+        'p_{inj}': [('1.15', 0)],
+        'v_e': [('1.17', 0), ('1.18', 0)],
+        'v_i': [('1.10', 0), ('1.11', 0), ('1.17', 0)],
+        'v_t': [('1.22', 0), ('1.27', 0)],
+        'v_x': [('1.10', 0), ('1.11', 0), ('1.26', 0), ('1.27', 0)],
+    }
+
+    _BUILD: Dict[str, List[Callable[[], sp.Expr]]] = {
+        '1.10': [_build_t_1_10_0],
+        '1.11': [_build_t_1_11_0],
+        '1.12': [_build_t_1_12_0],
+        '1.14': [_build_t_1_14_0],
+        '1.15': [_build_t_1_15_0],
+        '1.16': [_build_t_1_16_0],
+        '1.17': [_build_t_1_17_0],
+        '1.18': [_build_t_1_18_0],
+        '1.19': [_build_t_1_19_0],
+        '1.20': [_build_t_1_20_0],
+        '1.21': [_build_t_1_21_0],
+        '1.22': [_build_t_1_22_0],
+        '1.24': [_build_t_1_24_0],
+        '1.25': [_build_t_1_25_0],
+        '1.26': [_build_t_1_26_0],
+        '1.27': [_build_t_1_27_0],
+        '1.9': [_build_t_1_9_0],
+    }
+
+    _INVERSE: Dict[str, List[Dict[str, Callable[[], List[sp.Expr]]]]] = {
+        '1.10': [{'C_p': _inv_t_1_10_0_0, 'J': _inv_t_1_10_0_1, 'T_i': _inv_t_1_10_0_2, 'T_x': _inv_t_1_10_0_3, 'g': _inv_t_1_10_0_4, 'v_i': _inv_t_1_10_0_5, 'v_x': _inv_t_1_10_0_6}],
+        '1.11': [{'A_i': _inv_t_1_11_0_0, 'A_x': _inv_t_1_11_0_1, 'V_i': _inv_t_1_11_0_2, 'V_x': _inv_t_1_11_0_3, 'v_i': _inv_t_1_11_0_4, 'v_x': _inv_t_1_11_0_5}],
+        '1.12': [{'V_i': _inv_t_1_12_0_0, 'V_x': _inv_t_1_12_0_1, 'gamma': _inv_t_1_12_0_2, 'p_i': _inv_t_1_12_0_3, 'p_x': _inv_t_1_12_0_4}],
+        '1.14': [{'p_{cinj}': _inv_t_1_14_0_2, 'p_{cns}': _inv_t_1_14_0_3}],
+        '1.15': [{'M_i': _inv_t_1_15_0_0, 'gamma': _inv_t_1_15_0_1, 'p_i': _inv_t_1_15_0_2, 'p_{inj}': _inv_t_1_15_0_3}],
+        '1.16': [{'p_t': _inv_t_1_16_0_1, 'p_{cns}': _inv_t_1_16_0_2}],
+        '1.17': [{'R': _inv_t_1_17_0_0, 'T_i': _inv_t_1_17_0_1, 'g': _inv_t_1_17_0_2, 'v_e': _inv_t_1_17_0_6, 'v_i': _inv_t_1_17_0_7}],
+        '1.18': [{'R': _inv_t_1_18_0_0, 'T_{cns}': _inv_t_1_18_0_1, 'g': _inv_t_1_18_0_2, 'p_e': _inv_t_1_18_0_4, 'p_{cns}': _inv_t_1_18_0_5, 'v_e': _inv_t_1_18_0_6}],
+        '1.19': [{'A_t': _inv_t_1_19_0_0, 'R': _inv_t_1_19_0_1, 'T_{cns}': _inv_t_1_19_0_2, 'Wdot': _inv_t_1_19_0_3, 'g': _inv_t_1_19_0_4, 'p_{cns}': _inv_t_1_19_0_6}],
+        '1.20': [{'A_e': _inv_t_1_20_0_0, 'A_t': _inv_t_1_20_0_1}],
+        '1.21': [{'p_t': _inv_t_1_21_0_1, 'p_{cns}': _inv_t_1_21_0_2}],
+        '1.22': [{'R': _inv_t_1_22_0_0, 'T_{cns}': _inv_t_1_22_0_1, 'g': _inv_t_1_22_0_2, 'gamma': _inv_t_1_22_0_3, 'v_t': _inv_t_1_22_0_4}],
+        '1.24': [{'A_t': _inv_t_1_24_0_0, 'A_x': _inv_t_1_24_0_1}],
+        '1.25': [{'A_t': _inv_t_1_25_0_0, 'A_x': _inv_t_1_25_0_1}],
+        '1.26': [{'R': _inv_t_1_26_0_0, 'T_{cns}': _inv_t_1_26_0_1, 'g': _inv_t_1_26_0_2, 'v_x': _inv_t_1_26_0_6}],
+        '1.27': [{'p_x': _inv_t_1_27_0_1, 'p_{cns}': _inv_t_1_27_0_2, 'v_t': _inv_t_1_27_0_3, 'v_x': _inv_t_1_27_0_4}],
+        '1.9': [{'RT_x': _inv_t_1_9_0_0, 'V_x': _inv_t_1_9_0_1, 'p_x': _inv_t_1_9_0_2}],
+    }
 
-    def __init__(self) -> None:
+    _NUMERIC_ONLY: Dict[str, List[Dict[str, str]]] = {
+        '1.10': [{}],
+        '1.11': [{}],
+        '1.12': [{}],
+        '1.14': [{'M_i': 'NotImplementedError: multiple generators [(M_i**2*gamma - M_i**2 + 2)**(gamma/(gamma - 1)), M_i]', 'gamma': 'NotImplementedError: multiple generators [(M_i**2*gamma - M_i**2 + 2)**(gamma/(gamma - 1)), 2**(gamma/(gamma - 1)), gamma]'}],
+        '1.15': [{}],
+        '1.16': [{'gamma': 'sympy found no closed form'}],
+        '1.17': [{'gamma': 'timed out after 2s', 'p_e': 'timed out after 2s', 'p_i': 'timed out after 2s'}],
+        '1.18': [{'gamma': 'timed out after 2s'}],
+        '1.19': [{'gamma': 'timed out after 2s'}],
+        '1.20': [{'gamma': 'timed out after 2s', 'p_e': 'timed out after 2s', 'p_{cns}': 'timed out after 2s'}],
+        '1.21': [{'gamma': 'sympy found no closed form'}],
+        '1.22': [{}],
+        '1.24': [{'M_x': 'timed out after 2s', 'gamma': 'sympy found no closed form'}],
+        '1.25': [{'gamma': 'timed out after 2s', 'p_x': 'timed out after 2s', 'p_{cns}': 'timed out after 2s'}],
+        '1.26': [{'gamma': 'timed out after 2s', 'p_x': 'timed out after 2s', 'p_{cns}': 'timed out after 2s'}],
+        '1.27': [{'gamma': 'timed out after 2s'}],
+        '1.9': [{}],
+    }
+
+
+    def __init__(self, stats: bool = False) -> None:
         self._cache: Dict[tuple, sp.Expr] = {}
+        self._kernels: Dict[tuple, tuple] = {}
+        self._bound: OrderedDict[tuple, BoundResidual] = OrderedDict()
+        # (tag, i, var) -> (seconds, reason) for solves that timed out or failed in solve()
+        self._unsolved: Dict[tuple, tuple] = {}
+        # (method, tag, i) -> [calls, seconds]; None keeps residual()/evaluate() untimed
+        self._stats: Optional[Dict[tuple, list]] = {} if stats or os.environ.get("CORE_EQS_STATS") else None
 
     def tags(self) -> List[str]:
         return sorted(self._SREPR.keys())
@@ -105,26 +697,234 @@ class asdf_Core:
         if key in self._cache:
             return self._cache[key]
         try:
-            s = self._SREPR[tag][i]
+            build = self._BUILD[tag][i]
         except (KeyError, IndexError) as e:
             raise KeyError(f"Unknown equation index for tag '{tag}' i={i}") from e
-        expr = eval(s, {}, vars(sp))   # reconstruct SymPy expr from srepr
+        with sp.evaluate(False):
+            expr = build()
         self._cache[key] = expr
         return expr
 
+    def warm(self, tags: Optional[List[str]] = None) -> None:
+        """Build every expression (of `tags`, default all) now instead of on first use."""
+        for tag in (self.tags() if tags is None else tags):
+            for i in range(len(self._BUILD.get(tag, []))):
+                self._expr(tag, i)
+
     def symbols(self, tag: str, i: int) -> List[sp.Symbol]:
         names = self._SYMNAMES.get(tag, [])
         if i < 0 or i >= len(names):
             raise KeyError(f"Unknown equation index for tag '{tag}' i={i}")
-        return [sp.Symbol(n) for n in names[i]]
+        return [_SYM[n] for n in names[i]]
 
     def residual(self, tag: str, i: int, **subs) -> sp.Expr:
+        t0 = time.perf_counter() if self._stats is not None else 0.0
         expr = self._expr(tag, i)
-        return expr.subs(subs) if subs else expr
+        out = expr.subs(subs) if subs else expr
+        if self._stats is not None:
+            self._record("residual", tag, i, t0)
+        return out
+
+    # bind() keeps this many BoundResidual objects, least recently used dropped first
+    BIND_CACHE_SIZE = 256
+
+    def bind(self, tag: str, i: int, **fixed) -> BoundResidual:
+        """Residual i of `tag` with `fixed` (values by symbol name) substituted once.
+
+        Call the result with the remaining values only. Names that are not symbols of the
+        line are ignored, so one dict of constants can be bound to every line; the result
+        is cached per (tag, i, the fixed values it uses).
+        """
+        t0 = time.perf_counter() if self._stats is not None else 0.0
+        names = [s.name for s in self.symbols(tag, i)]
+        fixed = {n: v for n, v in fixed.items() if n in names}
+        try:
+            key = (tag, i, frozenset(fixed.items()))
+            hash(key)
+        except TypeError:
+            key = None
+        bound = self._bound.get(key) if key is not None else None
+        if bound is not None:
+            self._bound.move_to_end(key)
+        else:
+            bound = BoundResidual(tag, i, self._expr(tag, i), {n: _SYM[n] for n in names}, fixed)
+            if key is not None:
+                self._bound[key] = bound
+                if len(self._bound) > self.BIND_CACHE_SIZE:
+                    self._bound.popitem(last=False)
+        if self._stats is not None:
+            self._record("bind", tag, i, t0)
+        return bound
+
+    def _record(self, method: str, tag: str, i: int, t0: float) -> None:
+        rec = self._stats.setdefault((method, tag, i), [0, 0.0])
+        rec[0] += 1
+        rec[1] += time.perf_counter() - t0
+
+    def call_stats(self, top: Optional[int] = None) -> List[tuple]:
+        """(method, tag, i, calls, seconds) rows, most total time first."""
+        rows = [(m, tag, i, n, t) for (m, tag, i), (n, t) in (self._stats or {}).items()]
+        rows.sort(key=lambda r: -r[4])
+        return rows[:top] if top is not None else rows
+
+    def _inverse_row(self, table, tag: str, i: int, var) -> tuple:
+        name = var if isinstance(var, str) else var.name
+        if name not in [s.name for s in self.symbols(tag, i)]:
+            raise KeyError(f"{name!r} is not a symbol of tag '{tag}' i={i}")
+        rows = table.get(tag)
+        return name, (rows[i] if rows else {})
+
+    def numeric_only(self, tag: str, i: int, var) -> Optional[str]:
+        """Why `var` has no precomputed closed form in line i of `tag`, or None if it has one."""
+        name, row = self._inverse_row(self._NUMERIC_ONLY, tag, i, var)
+        return row.get(name)
+
+    # solve() gives sp.solve this many seconds for a symbol the codegen did not invert
+    SOLVE_TIMEOUT = 30.0
+
+    def solve(self, tag: str, i: int, var, timeout: Optional[float] = None, **params) -> List[sp.Expr]:
+        """Solutions of residual i of `tag` for `var`, with `params` (by symbol name) substituted.
+
+        Closed forms were found at codegen time; symbols whose inversion timed out or failed
+        raise NumericOnlyError, a ValueError carrying the reason (see numeric_only()).
+        Symbols never attempted (codegen run without CORE_EQS_SOLVE_BUDGET) are solved on
+        first use by sp.solve in a SolveWorker process, for at most `timeout` seconds
+        (default SOLVE_TIMEOUT), and cached; if it times out or fails, NumericOnlyError is
+        raised as well, and again by later calls with no larger timeout.
+        """
+        reason = self.numeric_only(tag, i, var)
+        name, row = self._inverse_row(self._INVERSE, tag, i, var)
+        if reason is not None:
+            raise NumericOnlyError(tag, i, name, reason)
+        key = ("solve", tag, i, name)
+        if key not in self._cache:
+            if name in row:
+                with sp.evaluate(False):
+                    self._cache[key] = row[name]()
+            else:
+                limit = self.SOLVE_TIMEOUT if timeout is None else timeout
+                spent, reason = self._unsolved.get((tag, i, name), (0.0, None))
+                if reason is not None and spent >= limit:
+                    raise NumericOnlyError(tag, i, name, reason)
+                # the same attempt, and reasons, as the codegen's
+                sym = _SYM[name]
+                status, out = solve_worker().solve(self._expr(tag, i), sym, limit)
+                sols = [d[sym] for d in out if sym in d] if status == "ok" else []
+                if not sols:
+                    if status == "timeout":
+                        reason = f"timed out after {limit:g}s"
+                    else:
+                        reason = out.splitlines()[0].rstrip(": ") if status == "error" else "sympy found no closed form"
+                        limit = float("inf")
+                    self._unsolved[(tag, i, name)] = (limit, reason)
+                    raise NumericOnlyError(tag, i, name, reason)
+                self._cache[key] = sols
+        sols = self._cache[key]
+        if not params:
+            return list(sols)
+        subs = {_SYM.get(k, k): v for k, v in params.items()}
+        return [s.subs(subs) for s in sols]
+
+    def equations_with(self, name) -> List[tuple]:
+        return list(self._INDEX.get(name if isinstance(name, str) else name.name, []))
 
     def eq_all(self, tag: str) -> List[sp.Expr]:
         return [ self._expr(tag, i) for i in range(len(self._SREPR.get(tag, []))) ]
 
+    def _refs(self, eqs) -> List[tuple]:
+        # a tag (all its lines), one (tag, i) or a list of (tag, i)
+        if isinstance(eqs, str):
+            if eqs not in self._BUILD:
+                raise KeyError(f"Unknown tag '{eqs}'")
+            return [(eqs, i) for i in range(len(self._BUILD[eqs]))]
+        if isinstance(eqs, tuple) and len(eqs) == 2 and isinstance(eqs[0], str):
+            return [eqs]
+        return [tuple(ref) for ref in eqs]
+
+    def _wrt_names(self, refs: List[tuple], wrt) -> List[str]:
+        if wrt is None:
+            return sorted({n for tag, i in refs for n in self._SYMNAMES[tag][i]})
+        return [v if isinstance(v, str) else v.name for v in ([wrt] if isinstance(wrt, (str, sp.Symbol)) else wrt)]
+
+    def jacobian(self, eqs, wrt=None) -> sp.Matrix:
+        """d(residual)/d(wrt), one row per residual of `eqs` (a tag, a (tag, i) or a list of them).
+
+        `wrt` lists symbols or names (default: every symbol of those residuals); derived once
+        per (eqs, wrt) and cached.
+        """
+        refs = self._refs(eqs)
+        names = self._wrt_names(refs, wrt)
+        key = ("jacobian", tuple(refs), tuple(names))
+        if key not in self._cache:
+            exprs = [self._expr(tag, i) for tag, i in refs]
+            self._cache[key] = sp.Matrix([[sp.diff(e, _SYM.get(n, sp.Symbol(n))) for n in names] for e in exprs])
+        return self._cache[key]
+
+    def evaluate_jacobian(self, eqs, wrt=None, **arrays):
+        """jacobian(eqs, wrt) over NumPy arrays: shape (rows, len(wrt)) + broadcast shape."""
+        import numpy as np
+        refs = self._refs(eqs)
+        names = self._wrt_names(refs, wrt)
+        key = ("jacobian", tuple(refs), tuple(names))
+        if key not in self._kernels:
+            jac = self.jacobian(refs, names)
+            args = sorted({n for tag, i in refs for n in self._SYMNAMES[tag][i]})
+            fn = sp.lambdify([_SYM[n] for n in args], list(jac), modules="numpy")
+            self._kernels[key] = (fn, args, jac.shape)
+        fn, args_names, (m, k) = self._kernels[key]
+        args, shape = _kernel_args(args_names, arrays, str(refs))
+        out = np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*args)])
+        return out.reshape((m, k) + shape)
+
+    def evaluate_tags(self, tags: List[str], **arrays) -> Dict[str, list]:
+        """Every residual of `tags` over NumPy arrays, as {tag: [line 0, line 1, ...]}.
+
+        The lines are lambdified together with cse=True, so subexpressions they share are
+        computed once; the kernel is cached per tag list.
+        """
+        key = ("tags",) + tuple(tags)
+        if key not in self._kernels:
+            unknown = [tag for tag in tags if tag not in self._BUILD]
+            if unknown:
+                raise KeyError(f"Unknown tags {unknown}")
+            refs = [(tag, i) for tag in tags for i in range(len(self._BUILD[tag]))]
+            names = sorted({n for tag, i in refs for n in self._SYMNAMES[tag][i]})
+            fn = sp.lambdify([_SYM[n] for n in names], [self._expr(tag, i) for tag, i in refs],
+                             modules="numpy", cse=True)
+            self._kernels[key] = (fn, names, refs)
+        fn, names, refs = self._kernels[key]
+        args, shape = _kernel_args(names, arrays, f"tags {list(tags)}")
+        out: Dict[str, list] = {tag: [] for tag in tags}
+        for (tag, i), v in zip(refs, _chunked(fn, args, shape, len(refs))):
+            out[tag].append(v)
+        return out
+
+    def evaluate_all(self, **arrays) -> Dict[str, list]:
+        """evaluate_tags() over every tag."""
+        return self.evaluate_tags(self.tags(), **arrays)
+
+    def _kernel(self, tag: str, i: int):
+        key = (tag, i)
+        if key not in self._kernels:
+            expr = self._expr(tag, i)
+            names = self._SYMNAMES[tag][i]
+            fn = sp.lambdify([_SYM[n] for n in names], expr, modules="numpy")
+            self._kernels[key] = (fn, names)
+        return self._kernels[key]
+
+    def evaluate(self, tag: str, i: int, **arrays):
+        """Residual evaluated over NumPy arrays; lambdified once and cached per line."""
+        import numpy as np
+        t0 = time.perf_counter() if self._stats is not None else 0.0
+        fn, names = self._kernel(tag, i)
+        args, shape = _kernel_args(names, arrays, f"tag '{tag}' i={i}")
+        out = np.asarray(fn(*args), dtype=float)
+        if out.shape != shape:
+            out = np.broadcast_to(out, shape).copy()
+        if self._stats is not None:
+            self._record("evaluate", tag, i, t0)
+        return out
+
     def eq_t_1_10_0(self, **subs) -> sp.Expr:
         """Residual for tag 1.10, line 0."""
         return self.residual('1.10', 0, **subs)
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+# Auto-generated on 2026-10-17T05:48:30
+# Source: asdf-equations.tex
+# NOTE: SymPy-free numeric companion of asdf_core.py: each residual is a
+# plain `math` function (NumPy versions are built on first use of evaluate()).
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Tuple
+import math
+
+__all__ = ["asdf_Numeric"]
+
+def _r_t_1_10_0(C_p, J, T_i, T_x, g, v_i, v_x):
+    return -C_p*(T_i - T_x) + (1/2)*(-v_i**2 + v_x**2)/(J*g)
+
+def _r_t_1_11_0(A_i, A_x, V_i, V_x, v_i, v_x):
+    return (1/144)*A_i*v_i/V_i - 1/144*A_x*v_x/V_x
+
+def _r_t_1_12_0(V_i, V_x, gamma, p_i, p_x):
+    return math.pow(V_i, gamma)*p_i - math.pow(V_x, gamma)*p_x
+
+def _r_t_1_14_0(M_i, gamma, p_cinj, p_cns):
+    return p_cinj/p_cns - (M_i**2*gamma + 1)*math.pow((1/2)*M_i**2*(gamma - 1) + 1, -gamma/(gamma - 1))
+
+def _r_t_1_15_0(M_i, gamma, p_i, p_inj):
+    return -M_i**2*gamma - 1 + p_inj/p_i
+
+def _r_t_1_16_0(gamma, p_t, p_cns):
+    return -math.pow(2/(gamma + 1), gamma/(gamma - 1)) + p_t/p_cns
+
+def _r_t_1_17_0(R, T_i, g, gamma, p_e, p_i, v_e, v_i):
+    return v_e - math.sqrt(2*R*T_i*g*gamma*math.pow(-p_e/p_i + 1, (gamma - 1)/gamma)/(gamma - 1) + v_i**2)
+
+def _r_t_1_18_0(R, T_cns, g, gamma, p_e, p_cns, v_e):
+    return v_e - math.sqrt(2)*math.sqrt(R*T_cns*g*gamma*math.pow(1 - p_e/p_cns, (gamma - 1)/gamma)/(gamma - 1))
+
+def _r_t_1_19_0(A_t, R, T_cns, Wdot, g, gamma, p_cns):
+    return -A_t*p_cns*math.sqrt(g*gamma*math.pow(2/(gamma + 1), (gamma + 1)/(gamma - 1))/(R*T_cns)) + Wdot
+
+def _r_t_1_20_0(A_e, A_t, gamma, p_e, p_cns):
+    return A_e/A_t - math.pow(2/(gamma + 1), 1/(gamma - 1))*math.pow(p_cns/p_e, 1/gamma)/math.sqrt(math.pow(1 - p_e/p_cns, (gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))
+
+def _r_t_1_21_0(gamma, p_t, p_cns):
+    return -p_cns*math.pow(2/(gamma + 1), gamma/(gamma - 1)) + p_t
+
+def _r_t_1_22_0(R, T_cns, g, gamma, v_t):
+    return v_t - math.sqrt(2)*math.sqrt(R*T_cns*g*gamma/(gamma + 1))
+
+def _r_t_1_24_0(A_t, A_x, M_x, gamma):
+    return -math.pow(2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1), (gamma + 1)/(2*gamma - 2))/M_x + A_x/A_t
+
+def _r_t_1_25_0(A_t, A_x, gamma, p_x, p_cns):
+    return -math.pow(2/(gamma + 1), 1/(gamma - 1))*math.pow(p_cns/p_x, 1/gamma)/math.sqrt((1 - math.pow(p_x/p_cns, (gamma - 1)/gamma))*(gamma + 1)/(gamma - 1)) + A_x/A_t
+
+def _r_t_1_26_0(R, T_cns, g, gamma, p_x, p_cns, v_x):
+    return v_x - math.sqrt(2)*math.sqrt(R*T_cns*g*gamma*(1 - math.pow(p_x/p_cns, (gamma - 1)/gamma))/(gamma - 1))
+
+def _r_t_1_27_0(gamma, p_x, p_cns, v_t, v_x):
+    return -math.sqrt(math.pow(1 - p_x/p_cns, (gamma - 1)/gamma)*(gamma + 1)/(gamma - 1)) + v_x/v_t
+
+def _r_t_1_9_0(RT_x, V_x, p_x):
+    return -RT_x + 144*V_x*p_x
+
+def _numpy_kernels() -> Dict[str, List[Callable]]:
+    import numpy
+
+    def _r_t_1_10_0(C_p, J, T_i, T_x, g, v_i, v_x):
+        return -C_p*(T_i - T_x) + (1/2)*(-v_i**2 + v_x**2)/(J*g)
+
+    def _r_t_1_11_0(A_i, A_x, V_i, V_x, v_i, v_x):
+        return (1/144)*A_i*v_i/V_i - 1/144*A_x*v_x/V_x
+
+    def _r_t_1_12_0(V_i, V_x, gamma, p_i, p_x):
+        return V_i**gamma*p_i - V_x**gamma*p_x
+
+    def _r_t_1_14_0(M_i, gamma, p_cinj, p_cns):
+        return p_cinj/p_cns - (M_i**2*gamma + 1)*((1/2)*M_i**2*(gamma - 1) + 1)**(-gamma/(gamma - 1))
+
+    def _r_t_1_15_0(M_i, gamma, p_i, p_inj):
+        return -M_i**2*gamma - 1 + p_inj/p_i
+
+    def _r_t_1_16_0(gamma, p_t, p_cns):
+        return -(2/(gamma + 1))**(gamma/(gamma - 1)) + p_t/p_cns
+
+    def _r_t_1_17_0(R, T_i, g, gamma, p_e, p_i, v_e, v_i):
+        return v_e - numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)
+
+    def _r_t_1_18_0(R, T_cns, g, gamma, p_e, p_cns, v_e):
+        return v_e - numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))
+
+    def _r_t_1_19_0(A_t, R, T_cns, Wdot, g, gamma, p_cns):
+        return -A_t*p_cns*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns)) + Wdot
+
+    def _r_t_1_20_0(A_e, A_t, gamma, p_e, p_cns):
+        return A_e/A_t - (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))/numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))
+
+    def _r_t_1_21_0(gamma, p_t, p_cns):
+        return -p_cns*(2/(gamma + 1))**(gamma/(gamma - 1)) + p_t
+
+    def _r_t_1_22_0(R, T_cns, g, gamma, v_t):
+        return v_t - numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma/(gamma + 1))
+
+    def _r_t_1_24_0(A_t, A_x, M_x, gamma):
+        return -(2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1))**((gamma + 1)/(2*gamma - 2))/M_x + A_x/A_t
+
+    def _r_t_1_25_0(A_t, A_x, gamma, p_x, p_cns):
+        return -(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))/numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1)) + A_x/A_t
+
+    def _r_t_1_26_0(R, T_cns, g, gamma, p_x, p_cns, v_x):
+        return v_x - numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))
+
+    def _r_t_1_27_0(gamma, p_x, p_cns, v_t, v_x):
+        return -numpy.sqrt((1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1)) + v_x/v_t
+
+    def _r_t_1_9_0(RT_x, V_x, p_x):
+        return -RT_x + 144*V_x*p_x
+
+    return {
+        '1.10': [_r_t_1_10_0],
+        '1.11': [_r_t_1_11_0],
+        '1.12': [_r_t_1_12_0],
+        '1.14': [_r_t_1_14_0],
+        '1.15': [_r_t_1_15_0],
+        '1.16': [_r_t_1_16_0],
+        '1.17': [_r_t_1_17_0],
+        '1.18': [_r_t_1_18_0],
+        '1.19': [_r_t_1_19_0],
+        '1.20': [_r_t_1_20_0],
+        '1.21': [_r_t_1_21_0],
+        '1.22': [_r_t_1_22_0],
+        '1.24': [_r_t_1_24_0],
+        '1.25': [_r_t_1_25_0],
+        '1.26': [_r_t_1_26_0],
+        '1.27': [_r_t_1_27_0],
+        '1.9': [_r_t_1_9_0],
+    }
+
+def _numpy_gradients() -> Dict[str, List[Callable]]:
+    import numpy
+
+    def _g_t_1_10_0(C_p, J, T_i, T_x, g, v_i, v_x):
+        return (-T_i + T_x, -1/2*(-v_i**2 + v_x**2)/(J**2*g), -C_p, C_p, -1/2*(-v_i**2 + v_x**2)/(J*g**2), -v_i/(J*g), v_x/(J*g), )
+
+    def _g_t_1_11_0(A_i, A_x, V_i, V_x, v_i, v_x):
+        return ((1/144)*v_i/V_i, -1/144*v_x/V_x, -1/144*A_i*v_i/V_i**2, (1/144)*A_x*v_x/V_x**2, (1/144)*A_i/V_i, -1/144*A_x/V_x, )
+
+    def _g_t_1_12_0(V_i, V_x, gamma, p_i, p_x):
+        return (V_i**gamma*gamma*p_i/V_i, -V_x**gamma*gamma*p_x/V_x, V_i**gamma*p_i*numpy.log(V_i) - V_x**gamma*p_x*numpy.log(V_x), V_i**gamma, -V_x**gamma, )
+
+    def _g_t_1_14_0(M_i, gamma, p_cinj, p_cns):
+        return (M_i*gamma*(M_i**2*gamma + 1)*((1/2)*M_i**2*(gamma - 1) + 1)**(-gamma/(gamma - 1))/((1/2)*M_i**2*(gamma - 1) + 1) - 2*M_i*gamma*((1/2)*M_i**2*(gamma - 1) + 1)**(-gamma/(gamma - 1)), -M_i**2*((1/2)*M_i**2*(gamma - 1) + 1)**(-gamma/(gamma - 1)) - (M_i**2*gamma + 1)*((1/2)*M_i**2*(gamma - 1) + 1)**(-gamma/(gamma - 1))*(-1/2*M_i**2*gamma/((gamma - 1)*((1/2)*M_i**2*(gamma - 1) + 1)) + (gamma/(gamma - 1)**2 - 1/(gamma - 1))*numpy.log((1/2)*M_i**2*(gamma - 1) + 1)), p_cns**(-1.0), -p_cinj/p_cns**2, )
+
+    def _g_t_1_15_0(M_i, gamma, p_i, p_inj):
+        return (-2*M_i*gamma, -M_i**2, -p_inj/p_i**2, p_i**(-1.0), )
+
+    def _g_t_1_16_0(gamma, p_t, p_cns):
+        return (-(2/(gamma + 1))**(gamma/(gamma - 1))*(-2*gamma*((1/2)*gamma + 1/2)/((gamma - 1)*(gamma + 1)**2) + (-gamma/(gamma - 1)**2 + (gamma - 1)**(-1.0))*numpy.log(2/(gamma + 1))), p_cns**(-1.0), -p_t/p_cns**2, )
+
+    def _g_t_1_17_0(R, T_i, g, gamma, p_e, p_i, v_e, v_i):
+        return (-T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/((gamma - 1)*numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)), -R*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/((gamma - 1)*numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)), -R*T_i*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/((gamma - 1)*numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)), -(R*T_i*g*gamma*(gamma**(-1.0) - (gamma - 1)/gamma**2)*(-p_e/p_i + 1)**((gamma - 1)/gamma)*numpy.log(-p_e/p_i + 1)/(gamma - 1) - R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1)**2 + R*T_i*g*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1))/numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2), R*T_i*g*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(p_i*(-p_e/p_i + 1)*numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)), -R*T_i*g*p_e*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(p_i**2*(-p_e/p_i + 1)*numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2)), 1, -v_i/numpy.sqrt(2*R*T_i*g*gamma*(-p_e/p_i + 1)**((gamma - 1)/gamma)/(gamma - 1) + v_i**2), )
+
+    def _g_t_1_18_0(R, T_cns, g, gamma, p_e, p_cns, v_e):
+        return (-1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))/R, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))/T_cns, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))/g, -numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))*(1 - p_e/p_cns)**(-(gamma - 1)/gamma)*(gamma - 1)*((1/2)*R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma**(-1.0) - (gamma - 1)/gamma**2)*numpy.log(1 - p_e/p_cns)/(gamma - 1) - 1/2*R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1)**2 + (1/2)*R*T_cns*g*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))/(R*T_cns*g*gamma), (1/2)*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))*(gamma - 1)/(gamma*p_cns*(1 - p_e/p_cns)), -1/2*numpy.sqrt(2)*p_e*numpy.sqrt(R*T_cns*g*gamma*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1))*(gamma - 1)/(gamma*p_cns**2*(1 - p_e/p_cns)), 1, )
+
+    def _g_t_1_19_0(A_t, R, T_cns, Wdot, g, gamma, p_cns):
+        return (-p_cns*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns)), (1/2)*A_t*p_cns*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns))/R, (1/2)*A_t*p_cns*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns))/T_cns, 1, -1/2*A_t*p_cns*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns))/g, -A_t*R*T_cns*p_cns*(2/(gamma + 1))**(-(gamma + 1)/(gamma - 1))*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns))*((1/2)*g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))*(-2*((1/2)*gamma + 1/2)/((gamma - 1)*(gamma + 1)) + ((gamma - 1)**(-1.0) - (gamma + 1)/(gamma - 1)**2)*numpy.log(2/(gamma + 1)))/(R*T_cns) + (1/2)*g*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns))/(g*gamma), -A_t*numpy.sqrt(g*gamma*(2/(gamma + 1))**((gamma + 1)/(gamma - 1))/(R*T_cns)), )
+
+    def _g_t_1_20_0(A_e, A_t, gamma, p_e, p_cns):
+        return (A_t**(-1.0), -A_e/A_t**2, -(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))*(-2*((1/2)*gamma + 1/2)/((gamma - 1)*(gamma + 1)**2) - numpy.log(2/(gamma + 1))/(gamma - 1)**2)/numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1)) - (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))*(1 - p_e/p_cns)**(-(gamma - 1)/gamma)*(gamma - 1)*(-1/2*(1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma**(-1.0) - (gamma - 1)/gamma**2)*(gamma + 1)*numpy.log(1 - p_e/p_cns)/(gamma - 1) - 1/2*(1 - p_e/p_cns)**((gamma - 1)/gamma)/(gamma - 1) + (1/2)*(1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1)**2)/(numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(gamma + 1)) + (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))*numpy.log(p_cns/p_e)/(gamma**2*numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))), (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))/(gamma*p_e*numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))) - 1/2*(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))*(gamma - 1)/(gamma*p_cns*numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(1 - p_e/p_cns)), -(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))/(gamma*p_cns*numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))) + (1/2)*p_e*(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_e)**(gamma**(-1.0))*(gamma - 1)/(gamma*p_cns**2*numpy.sqrt((1 - p_e/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(1 - p_e/p_cns)), )
+
+    def _g_t_1_21_0(gamma, p_t, p_cns):
+        return (-p_cns*(2/(gamma + 1))**(gamma/(gamma - 1))*(-2*gamma*((1/2)*gamma + 1/2)/((gamma - 1)*(gamma + 1)**2) + (-gamma/(gamma - 1)**2 + (gamma - 1)**(-1.0))*numpy.log(2/(gamma + 1))), 1, -(2/(gamma + 1))**(gamma/(gamma - 1)), )
+
+    def _g_t_1_22_0(R, T_cns, g, gamma, v_t):
+        return (-1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma/(gamma + 1))/R, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma/(gamma + 1))/T_cns, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma/(gamma + 1))/g, -numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma/(gamma + 1))*(gamma + 1)*(-1/2*R*T_cns*g*gamma/(gamma + 1)**2 + (1/2)*R*T_cns*g/(gamma + 1))/(R*T_cns*g*gamma), 1, )
+
+    def _g_t_1_24_0(A_t, A_x, M_x, gamma):
+        return (-A_x/A_t**2, A_t**(-1.0), -(2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1))**((gamma + 1)/(2*gamma - 2))*(gamma - 1)*(gamma + 1)/((2*gamma - 2)*((1/2)*M_x**2*(gamma - 1) + 1)) + (2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1))**((gamma + 1)/(2*gamma - 2))/M_x**2, -(2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1))**((gamma + 1)/(2*gamma - 2))*((1/2)*(gamma + 1)**2*(M_x**2/(gamma + 1) - 2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1)**2)/((2*gamma - 2)*((1/2)*M_x**2*(gamma - 1) + 1)) + (-2*(gamma + 1)/(2*gamma - 2)**2 + (2*gamma - 2)**(-1.0))*numpy.log(2*((1/2)*M_x**2*(gamma - 1) + 1)/(gamma + 1)))/M_x, )
+
+    def _g_t_1_25_0(A_t, A_x, gamma, p_x, p_cns):
+        return (-A_x/A_t**2, A_t**(-1.0), -(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))*(-2*((1/2)*gamma + 1/2)/((gamma - 1)*(gamma + 1)**2) - numpy.log(2/(gamma + 1))/(gamma - 1)**2)/numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1)) - (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))*(gamma - 1)*((1/2)*(p_x/p_cns)**((gamma - 1)/gamma)*(gamma**(-1.0) - (gamma - 1)/gamma**2)*(gamma + 1)*numpy.log(p_x/p_cns)/(gamma - 1) - 1/2*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1) + (1/2)*(1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1)**2)/(numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))*(1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)) + (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))*numpy.log(p_cns/p_x)/(gamma**2*numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))), -1/2*(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_x/p_cns)**((gamma - 1)/gamma)*(p_cns/p_x)**(gamma**(-1.0))*(gamma - 1)/(gamma*p_x*numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))*(1 - (p_x/p_cns)**((gamma - 1)/gamma))) + (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))/(gamma*p_x*numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))), (1/2)*(2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_x/p_cns)**((gamma - 1)/gamma)*(p_cns/p_x)**(gamma**(-1.0))*(gamma - 1)/(gamma*p_cns*numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))*(1 - (p_x/p_cns)**((gamma - 1)/gamma))) - (2/(gamma + 1))**((gamma - 1)**(-1.0))*(p_cns/p_x)**(gamma**(-1.0))/(gamma*p_cns*numpy.sqrt((1 - (p_x/p_cns)**((gamma - 1)/gamma))*(gamma + 1)/(gamma - 1))), )
+
+    def _g_t_1_26_0(R, T_cns, g, gamma, p_x, p_cns, v_x):
+        return (-1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))/R, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))/T_cns, -1/2*numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))/g, -numpy.sqrt(2)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))*(gamma - 1)*(-1/2*R*T_cns*g*gamma*(p_x/p_cns)**((gamma - 1)/gamma)*(gamma**(-1.0) - (gamma - 1)/gamma**2)*numpy.log(p_x/p_cns)/(gamma - 1) - 1/2*R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1)**2 + (1/2)*R*T_cns*g*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))/(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))), (1/2)*numpy.sqrt(2)*(p_x/p_cns)**((gamma - 1)/gamma)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))*(gamma - 1)/(gamma*p_x*(1 - (p_x/p_cns)**((gamma - 1)/gamma))), -1/2*numpy.sqrt(2)*(p_x/p_cns)**((gamma - 1)/gamma)*numpy.sqrt(R*T_cns*g*gamma*(1 - (p_x/p_cns)**((gamma - 1)/gamma))/(gamma - 1))*(gamma - 1)/(gamma*p_cns*(1 - (p_x/p_cns)**((gamma - 1)/gamma))), 1, )
+
+    def _g_t_1_27_0(gamma, p_x, p_cns, v_t, v_x):
+        return (-numpy.sqrt((1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(1 - p_x/p_cns)**(-(gamma - 1)/gamma)*(gamma - 1)*((1/2)*(1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma**(-1.0) - (gamma - 1)/gamma**2)*(gamma + 1)*numpy.log(1 - p_x/p_cns)/(gamma - 1) + (1/2)*(1 - p_x/p_cns)**((gamma - 1)/gamma)/(gamma - 1) - 1/2*(1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1)**2)/(gamma + 1), (1/2)*numpy.sqrt((1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(gamma - 1)/(gamma*p_cns*(1 - p_x/p_cns)), -1/2*p_x*numpy.sqrt((1 - p_x/p_cns)**((gamma - 1)/gamma)*(gamma + 1)/(gamma - 1))*(gamma - 1)/(gamma*p_cns**2*(1 - p_x/p_cns)), -v_x/v_t**2, v_t**(-1.0), )
+
+    def _g_t_1_9_0(RT_x, V_x, p_x):
+        return (-1, 144*p_x, 144*V_x, )
+
+    return {
+        '1.10': [_g_t_1_10_0],
+        '1.11': [_g_t_1_11_0],
+        '1.12': [_g_t_1_12_0],
+        '1.14': [_g_t_1_14_0],
+        '1.15': [_g_t_1_15_0],
+        '1.16': [_g_t_1_16_0],
+        '1.17': [_g_t_1_17_0],
+        '1.18': [_g_t_1_18_0],
+        '1.19': [_g_t_1_19_0],
+        '1.20': [_g_t_1_20_0],
+        '1.21': [_g_t_1_21_0],
+        '1.22': [_g_t_1_22_0],
+        '1.24': [_g_t_1_24_0],
+        '1.25': [_g_t_1_25_0],
+        '1.26': [_g_t_1_26_0],
+        '1.27': [_g_t_1_27_0],
+        '1.9': [_g_t_1_9_0],
+    }
+
+def _kernel_args(names: List[str], arrays: dict, where: str) -> Tuple[list, tuple]:
+    # float arrays for `names` in order, and the shape they broadcast to
+    import numpy as np
+    missing = [n for n in names if n not in arrays]
+    if missing:
+        raise KeyError(f"Missing values for {missing} in {where}")
+    args = [np.asarray(arrays[n], dtype=float) for n in names]
+    return args, (np.broadcast_shapes(*(a.shape for a in args)) if args else ())
+
+# Inputs with more points than this are evaluated _CHUNK points at a time, so the
+# temporaries of one slice stay in cache between the operations that reuse them.
+_CHUNK = 16384
+
+def _chunked(fn: Callable, args: list, shape: tuple, n_out: int) -> list:
+    import numpy as np
+    size = int(np.prod(shape))
+    if size <= _CHUNK:
+        return [np.broadcast_to(np.asarray(v, dtype=float), shape).copy() for v in fn(*args)]
+    flat = [a.reshape(()) if a.size == 1 else np.broadcast_to(a, shape).reshape(-1) for a in args]
+    outs = [np.empty(size) for _ in range(n_out)]
+    for s in range(0, size, _CHUNK):
+        for o, v in zip(outs, fn(*[a if a.ndim == 0 else a[s:s + _CHUNK] for a in flat])):
+            o[s:s + _CHUNK] = v
+    return [o.reshape(shape) for o in outs]
+
+# sp.cse over all 17 residuals: 27 shared subexpressions.
+_CSE_STEPS: List[Tuple[str, str, Tuple[str, ...]]] = [
+    ('_c0', 'v_i**2', ('v_i',)),
+    ('_c1', 'p_cns**(-1.0)', ('p_cns',)),
+    ('_c2', 'M_i**2', ('M_i',)),
+    ('_c3', '_c2*gamma + 1', ('_c2', 'gamma')),
+    ('_c4', 'gamma - 1', ('gamma',)),
+    ('_c5', '(1/2)*_c4', ('_c4',)),
+    ('_c6', '_c4**(-1.0)', ('_c4',)),
+    ('_c7', '_c6*gamma', ('_c6', 'gamma')),
+    ('_c8', 'p_i**(-1.0)', ('p_i',)),
+    ('_c9', 'gamma + 1', ('gamma',)),
+    ('_c10', '_c9**(-1.0)', ('_c9',)),
+    ('_c11', '2*_c10', ('_c10',)),
+    ('_c12', '_c11**_c7', ('_c11', '_c7')),
+    ('_c13', 'gamma**(-1.0)', ('gamma',)),
+    ('_c14', '_c13*_c4', ('_c13', '_c4')),
+    ('_c15', '_c7*g', ('_c7', 'g')),
+    ('_c16', 'numpy.sqrt(2)', ()),
+    ('_c17', '(-_c1*p_e + 1)**_c14', ('_c1', '_c14', 'p_e')),
+    ('_c18', 'R*T_cns', ('R', 'T_cns')),
+    ('_c19', '_c15*_c18', ('_c15', '_c18')),
+    ('_c20', '_c6*_c9', ('_c6', '_c9')),
+    ('_c21', 'g*gamma', ('g', 'gamma')),
+    ('_c22', 'A_t**(-1.0)', ('A_t',)),
+    ('_c23', '_c11**_c6', ('_c11', '_c6')),
+    ('_c24', '-A_x*_c22', ('A_x', '_c22')),
+    ('_c25', '_c1*p_x', ('_c1', 'p_x')),
+    ('_c26', '1 - _c25**_c14', ('_c14', '_c25')),
+]
+
+_CSE_OUT: Dict[Tuple[str, int], Tuple[str, Tuple[str, ...]]] = {
+    ('1.10', 0): ('-C_p*(T_i - T_x) + (1/2)*(-_c0 + v_x**2)/(J*g)', ('C_p', 'J', 'T_i', 'T_x', '_c0', 'g', 'v_x')),
+    ('1.11', 0): ('(1/144)*A_i*v_i/V_i - 1/144*A_x*v_x/V_x', ('A_i', 'A_x', 'V_i', 'V_x', 'v_i', 'v_x')),
+    ('1.12', 0): ('V_i**gamma*p_i - V_x**gamma*p_x', ('V_i', 'V_x', 'gamma', 'p_i', 'p_x')),
+    ('1.14', 0): ('_c1*p_cinj - _c3*(_c2*_c5 + 1)**(-_c7)', ('_c1', '_c2', '_c3', '_c5', '_c7', 'p_cinj')),
+    ('1.15', 0): ('-_c3 + _c8*p_inj', ('_c3', '_c8', 'p_inj')),
+    ('1.16', 0): ('_c1*p_t - _c12', ('_c1', '_c12', 'p_t')),
+    ('1.17', 0): ('v_e - numpy.sqrt(2*R*T_i*_c15*(-_c8*p_e + 1)**_c14 + _c0)', ('R', 'T_i', '_c0', '_c14', '_c15', '_c8', 'p_e', 'v_e')),
+    ('1.18', 0): ('-_c16*numpy.sqrt(_c17*_c19) + v_e', ('_c16', '_c17', '_c19', 'v_e')),
+    ('1.19', 0): ('-A_t*p_cns*numpy.sqrt(_c11**_c20*_c21/(R*T_cns)) + Wdot', ('A_t', 'R', 'T_cns', 'Wdot', '_c11', '_c20', '_c21', 'p_cns')),
+    ('1.20', 0): ('A_e*_c22 - _c23*(p_cns/p_e)**_c13/numpy.sqrt(_c17*_c20)', ('A_e', '_c13', '_c17', '_c20', '_c22', '_c23', 'p_cns', 'p_e')),
+    ('1.21', 0): ('-_c12*p_cns + p_t', ('_c12', 'p_cns', 'p_t')),
+    ('1.22', 0): ('-_c16*numpy.sqrt(_c10*_c18*_c21) + v_t', ('_c10', '_c16', '_c18', '_c21', 'v_t')),
+    ('1.24', 0): ('-_c24 - (_c11*(M_x**2*_c5 + 1))**(_c9/(2*gamma - 2))/M_x', ('M_x', '_c11', '_c24', '_c5', '_c9', 'gamma')),
+    ('1.25', 0): ('-_c23*(p_cns/p_x)**_c13/numpy.sqrt(_c20*_c26) - _c24', ('_c13', '_c20', '_c23', '_c24', '_c26', 'p_cns', 'p_x')),
+    ('1.26', 0): ('-_c16*numpy.sqrt(_c19*_c26) + v_x', ('_c16', '_c19', '_c26', 'v_x')),
+    ('1.27', 0): ('-numpy.sqrt(_c20*(1 - _c25)**_c14) + v_x/v_t', ('_c14', '_c20', '_c25', 'v_t', 'v_x')),
+    ('1.9', 0): ('-RT_x + 144*V_x*p_x', ('RT_x', 'V_x', 'p_x')),
+}
+
+# (tag, i) -> why the printers produced no code for that residual / its gradient
+_NO_CODE: Dict[Tuple[str, int], str] = {
+}
+
+_NO_GRADIENT: Dict[Tuple[str, int], str] = {
+}
+
+# symbol name -> argument name in the functions above
+_IDENTS: Dict[str, str] = {
+    'A_e': 'A_e',
+    'A_i': 'A_i',
+    'A_t': 'A_t',
+    'A_x': 'A_x',
+    'C_p': 'C_p',
+    'J': 'J',
+    'M_i': 'M_i',
+    'M_x': 'M_x',
+    'R': 'R',
+    'RT_x': 'RT_x',
+    'T_i': 'T_i',
+    'T_x': 'T_x',
+    'T_{cns}': 'T_cns',
+    'V_i': 'V_i',
+    'V_x': 'V_x',
+    'Wdot': 'Wdot',
+    'g': 'g',
+    'gamma': 'gamma',
+    'p_e': 'p_e',
+    'p_i': 'p_i',
+    'p_t': 'p_t',
+    'p_x': 'p_x',
+    'p_{cinj}': 'p_cinj',
+    'p_{cns}': 'p_cns',
+    'p_{inj}': 'p_inj',
+    'v_e': 'v_e',
+    'v_i': 'v_i',
+    'v_t': 'v_t',
+    'v_x': 'v_x',
+}
+
+class asdf_Numeric:
+    """Numeric core equations without SymPy.
+
+    Access:
+      - tags() -> List[str]
+      - symbols(tag: str, i: int) -> List[str]  (argument order of the residual)
+      - residual(tag: str, i: int, **values) -> float
+      - evaluate(tag: str, i: int, **arrays) -> np.ndarray  (NumPy, broadcasting)
+      - evaluate_all(**arrays) / evaluate_tags(tags, **arrays) -> Dict[tag, List[np.ndarray]]
+        (every residual of the tags at once, shared subexpressions computed once)
+      - evaluate_gradient(tag: str, i: int, **arrays) -> np.ndarray  (k, *shape), symbols() order
+      - evaluate_jacobian(eqs, wrt=None, **arrays) -> np.ndarray  (rows, len(wrt), *shape)
+      - Convenience per-line methods: eq_<tag>_<i>(**values)
+    Keyword names are the symbol names of asdf_Core (use **{'p_{cns}': ...}).
+    Out-of-domain inputs raise ValueError in residual() and give nan in evaluate().
+    Lines the code printers could not handle raise ValueError with the reason.
+    """
+
+    _SYMNAMES: Dict[str, List[List[str]]] = {
+        '1.10': [['C_p', 'J', 'T_i', 'T_x', 'g', 'v_i', 'v_x']],
+        '1.11': [['A_i', 'A_x', 'V_i', 'V_x', 'v_i', 'v_x']],
+        '1.12': [['V_i', 'V_x', 'gamma', 'p_i', 'p_x']],
+        '1.14': [['M_i', 'gamma', 'p_{cinj}', 'p_{cns}']],
+        '1.15': [['M_i', 'gamma', 'p_i', 'p_{inj}']],
+        '1.16': [['gamma', 'p_t', 'p_{cns}']],
+        '1.17': [['R', 'T_i', 'g', 'gamma', 'p_e', 'p_i', 'v_e', 'v_i']],
+        '1.18': [['R', 'T_{cns}', 'g', 'gamma', 'p_e', 'p_{cns}', 'v_e']],
+        '1.19': [['A_t', 'R', 'T_{cns}', 'Wdot', 'g', 'gamma', 'p_{cns}']],
+        '1.20': [['A_e', 'A_t', 'gamma', 'p_e', 'p_{cns}']],
+        '1.21': [['gamma', 'p_t', 'p_{cns}']],
+        '1.22': [['R', 'T_{cns}', 'g', 'gamma', 'v_t']],
+        '1.24': [['A_t', 'A_x', 'M_x', 'gamma']],
+        '1.25': [['A_t', 'A_x', 'gamma', 'p_x', 'p_{cns}']],
+        '1.26': [['R', 'T_{cns}', 'g', 'gamma', 'p_x', 'p_{cns}', 'v_x']],
+        '1.27': [['gamma', 'p_x', 'p_{cns}', 'v_t', 'v_x']],
+        '1.9': [['RT_x', 'V_x', 'p_x']],
+    }
+
+    _FUNCS: Dict[str, List[Optional[Callable]]] = {
+        '1.10': [_r_t_1_10_0],
+        '1.11': [_r_t_1_11_0],
+        '1.12': [_r_t_1_12_0],
+        '1.14': [_r_t_1_14_0],
+        '1.15': [_r_t_1_15_0],
+        '1.16': [_r_t_1_16_0],
+        '1.17': [_r_t_1_17_0],
+        '1.18': [_r_t_1_18_0],
+        '1.19': [_r_t_1_19_0],
+        '1.20': [_r_t_1_20_0],
+        '1.21': [_r_t_1_21_0],
+        '1.22': [_r_t_1_22_0],
+        '1.24': [_r_t_1_24_0],
+        '1.25': [_r_t_1_25_0],
+        '1.26': [_r_t_1_26_0],
+        '1.27': [_r_t_1_27_0],
+        '1.9': [_r_t_1_9_0],
+    }
+
+    def __init__(self) -> None:
+        self._kernels: Optional[Dict[str, List[Callable]]] = None
+        self._gradients: Optional[Dict[str, List[Callable]]] = None
+        self._cse: Dict[tuple, tuple] = {}
+
+    def tags(self) -> List[str]:
+        return sorted(self._FUNCS.keys())
+
+    def _names(self, tag: str, i: int) -> List[str]:
+        try:
+            return self._SYMNAMES[tag][i]
+        except (KeyError, IndexError) as e:
+            raise KeyError(f"Unknown equation index for tag '{tag}' i={i}") from e
+
+    def _lookup(self, table, tag: str, i: int, unsupported=_NO_CODE):
+        names = self._names(tag, i)
+        fn = table[tag][i]
+        if fn is None:
+            raise ValueError(f"No numeric code for tag '{tag}' i={i}: {unsupported[(tag, i)]}")
+        return fn, names
+
+    def symbols(self, tag: str, i: int) -> List[str]:
+        return list(self._names(tag, i))
+
+    def residual(self, tag: str, i: int, **values) -> float:
+        fn, names = self._lookup(self._FUNCS, tag, i)
+        missing = [n for n in names if n not in values]
+        if missing:
+            raise KeyError(f"Missing values for {missing} in tag '{tag}' i={i}")
+        return fn(*[values[n] for n in names])
+
+    def evaluate(self, tag: str, i: int, **arrays):
+        """Residual evaluated over NumPy arrays (imports NumPy on first use)."""
+        import numpy as np
+        if self._kernels is None:
+            self._kernels = _numpy_kernels()
+        fn, names = self._lookup(self._kernels, tag, i)
+        args, shape = _kernel_args(names, arrays, f"tag '{tag}' i={i}")
+        out = np.asarray(fn(*args), dtype=float)
+        if out.shape != shape:
+            out = np.broadcast_to(out, shape).copy()
+        return out
+
+    def evaluate_gradient(self, tag: str, i: int, **arrays):
+        """Partial derivatives of residual i of `tag`, in symbols() order: shape (k,) + broadcast shape."""
+        import numpy as np
+        if self._gradients is None:
+            self._gradients = _numpy_gradients()
+        fn, names = self._lookup(self._gradients, tag, i, _NO_GRADIENT)
+        args, shape = _kernel_args(names, arrays, f"tag '{tag}' i={i}")
+        return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*args)])
+
+    def evaluate_jacobian(self, eqs, wrt=None, **arrays):
+        """d(residual)/d(wrt) over NumPy arrays: shape (rows, len(wrt)) + broadcast shape.
+
+        `eqs` is a tag (all its lines), one (tag, i) or a list of them; `wrt` lists symbol
+        names (default: every symbol of those residuals).
+        """
+        import numpy as np
+        if isinstance(eqs, str):
+            if eqs not in self._FUNCS:
+                raise KeyError(f"Unknown tag '{eqs}'")
+            refs = [(eqs, i) for i in range(len(self._FUNCS[eqs]))]
+        elif isinstance(eqs, tuple) and len(eqs) == 2 and isinstance(eqs[0], str):
+            refs = [eqs]
+        else:
+            refs = [tuple(ref) for ref in eqs]
+        if wrt is None:
+            wrt = sorted({n for tag, i in refs for n in self.symbols(tag, i)})
+        elif isinstance(wrt, str):
+            wrt = [wrt]
+        rows = []
+        for tag, i in refs:
+            grad = self.evaluate_gradient(tag, i, **arrays)
+            names = self.symbols(tag, i)
+            rows.append([grad[names.index(n)] if n in names else None for n in wrt])
+        shape = np.broadcast_shapes(*(g.shape for row in rows for g in row if g is not None))
+        out = np.zeros((len(refs), len(wrt)) + shape)
+        for r, row in enumerate(rows):
+            for c, g in enumerate(row):
+                if g is not None:
+                    out[r, c] = g
+        return out
+
+    def _cse_kernel(self, tags: tuple):
+        # One function for every residual of `tags`, running only the _CSE_STEPS they read.
+        if tags not in self._cse:
+            import numpy
+            unknown = [tag for tag in tags if tag not in self._FUNCS]
+            if unknown:
+                raise KeyError(f"Unknown tags {unknown}")
+            refs = [(tag, i) for tag in tags for i in range(len(self._FUNCS[tag]))]
+            unsupported = [ref for ref in refs if ref not in _CSE_OUT]
+            if unsupported:
+                raise ValueError("No numeric code for " + "; ".join(
+                    f"tag '{t}' i={i}: {_NO_CODE.get((t, i), 'not printable')}" for t, i in unsupported))
+            need = set()
+            for ref in refs:
+                need.update(_CSE_OUT[ref][1])
+            steps = []
+            for name, code, reads in reversed(_CSE_STEPS):
+                if name in need:
+                    steps.append((name, code))
+                    need.update(reads)
+            idents = {v: k for k, v in _IDENTS.items()}
+            args = sorted(n for n in need if n in idents)
+            src = [f"def _f({', '.join(args)}):"]
+            src += [f"    {name} = {code}" for name, code in reversed(steps)]
+            src.append(f"    return ({''.join(_CSE_OUT[ref][0] + ', ' for ref in refs)})")
+            ns = {"numpy": numpy}
+            exec(compile("\n".join(src), f"<cse {', '.join(tags)}>", "exec"), ns)
+            self._cse[tags] = (ns["_f"], [idents[a] for a in args], refs)
+        return self._cse[tags]
+
+    def evaluate_tags(self, tags: List[str], **arrays) -> Dict[str, list]:
+        """Every residual of `tags` over NumPy arrays, as {tag: [line 0, line 1, ...]}.
+
+        Subexpressions shared between the lines (see _CSE_STEPS) are computed once.
+        """
+        fn, names, refs = self._cse_kernel(tuple(tags))
+        args, shape = _kernel_args(names, arrays, f"tags {list(tags)}")
+        out: Dict[str, list] = {tag: [] for tag in tags}
+        for (tag, i), v in zip(refs, _chunked(fn, args, shape, len(refs))):
+            out[tag].append(v)
+        return out
+
+    def evaluate_all(self, **arrays) -> Dict[str, list]:
+        """evaluate_tags() over every tag."""
+        return self.evaluate_tags(self.tags(), **arrays)
+
+    def eq_t_1_10_0(self, **values) -> float:
+        """Residual for tag 1.10, line 0."""
+        return self.residual('1.10', 0, **values)
+
+    def eq_t_1_11_0(self, **values) -> float:
+        """Residual for tag 1.11, line 0."""
+        return self.residual('1.11', 0, **values)
+
+    def eq_t_1_12_0(self, **values) -> float:
+        """Residual for tag 1.12, line 0."""
+        return self.residual('1.12', 0, **values)
+
+    def eq_t_1_14_0(self, **values) -> float:
+        """Residual for tag 1.14, line 0."""
+        return self.residual('1.14', 0, **values)
+
+    def eq_t_1_15_0(self, **values) -> float:
+        """Residual for tag 1.15, line 0."""
+        return self.residual('1.15', 0, **values)
+
+    def eq_t_1_16_0(self, **values) -> float:
+        """Residual for tag 1.16, line 0."""
+        return self.residual('1.16', 0, **values)
+
+    def eq_t_1_17_0(self, **values) -> float:
+        """Residual for tag 1.17, line 0."""
+        return self.residual('1.17', 0, **values)
+
+    def eq_t_1_18_0(self, **values) -> float:
+        """Residual for tag 1.18, line 0."""
+        return self.residual('1.18', 0, **values)
+
+    def eq_t_1_19_0(self, **values) -> float:
+        """Residual for tag 1.19, line 0."""
+        return self.residual('1.19', 0, **values)
+
+    def eq_t_1_20_0(self, **values) -> float:
+        """Residual for tag 1.20, line 0."""
+        return self.residual('1.20', 0, **values)
+
+    def eq_t_1_21_0(self, **values) -> float:
+        """Residual for tag 1.21, line 0."""
+        return self.residual('1.21', 0, **values)
+
+    def eq_t_1_22_0(self, **values) -> float:
+        """Residual for tag 1.22, line 0."""
+        return self.residual('1.22', 0, **values)
+
+    def eq_t_1_24_0(self, **values) -> float:
+        """Residual for tag 1.24, line 0."""
+        return self.residual('1.24', 0, **values)
+
+    def eq_t_1_25_0(self, **values) -> float:
+        """Residual for tag 1.25, line 0."""
+        return self.residual('1.25', 0, **values)
+
+    def eq_t_1_26_0(self, **values) -> float:
+        """Residual for tag 1.26, line 0."""
+        return self.residual('1.26', 0, **values)
+
+    def eq_t_1_27_0(self, **values) -> float:
+        """Residual for tag 1.27, line 0."""
+        return self.residual('1.27', 0, **values)
+
+    def eq_t_1_9_0(self, **values) -> float:
+        """Residual for tag 1.9, line 0."""
+        return self.residual('1.9', 0, **values)
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+# run_bench.py
+# Usage: python bench/run_bench.py [--sizes 10 100 1000] [--repeat 3] [--out FILE.json]
+#        python bench/run_bench.py --compare OLD.json NEW.json
+#
+# Times each stage of the parse -> codegen -> load -> evaluate -> solve pipeline
+# separately and prints one JSON document (or writes it to --out):
+#   parse[N]     per-line CoreEqs parse cost on the N-block corpus, split by the path
+#                that handled the line (fast / rd / latex2sympy2 / sympy / failed)
+#   from_tex[N]  whole-file CoreEqs.from_tex, without cache and with a warm cache
+#   memory[N]    bytes a CoreEqs of the N-block corpus keeps alive, per equation line
+#                (tracemalloc; not a timing, so --compare skips it)
+#   codegen[N]   core-eq.sh end to end in a temp dir, without cache and with a warm one
+#   load         fresh-interpreter import of a generated module and its first calls
+#   residual     asdf_core residual('1.27', 0) with and without subs
+#   evaluate     compiled evaluate() of asdf 1.27 over 10^5 points
+#   evaluate_all every asdf_numeric residual over 10^5 states, line by line and at once
+#   solve        asdf 1.27 for p_{cns} via sp.solve (as in bruh.py) and CoreEqs.solve_for,
+#                symbolic, time-bounded (in the solve worker, and starved of time so it
+#                falls back to Newton) and numeric=True over a 10^4-point table
+#
+# All times are in seconds, memory in bytes. The corpora come from make_corpus.py; the N-block
+# equations file and generated module are the ones core-eq.sh writes in the codegen
+# stage, so every size runs through the real pipeline.
+import contextlib
+import glob
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+sys.path.insert(0, HERE)
+
+import sympy as sp
+
+import core_eqs
+from make_corpus import SIZES, corpus_path
+
+PATHS = ('fast', 'rd', 'latex2sympy2', 'sympy', 'failed')
+
+# asdf 1.27, the equation bruh.py solves for p_{cns}
+EQ_1_27 = (r'\frac{v_x}{v_t} = \sqrt{\frac{\gamma + 1}{\gamma - 1}\left[1 - '
+           r'\left(\frac{p_x}{p_{cns}}\right)^{\frac{\gamma - 1}{\gamma}}\right]}')
+PARAMS_1_27 = {'gamma': 1.2, 'p_x': 1.0e5, 'v_t': 1000.0, 'v_x': 2500.0}
+
+def _summary(samples: List[float]) -> Dict[str, float]:
+    s = sorted(samples)
+    return {
+        'n': len(s),
+        'total': sum(s),
+        'min': s[0],
+        'median': statistics.median(s),
+        'mean': statistics.fmean(s),
+        'p95': s[min(len(s) - 1, int(0.95 * len(s)))],
+        'max': s[-1],
+    }
+
+def _timed(fn, repeat: int) -> List[float]:
+    out = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        out.append(time.perf_counter() - t0)
+    return out
+
+def _equation_lines(tex_path: str) -> List[str]:
+    with open(tex_path, 'r', encoding='utf-8') as f:
+        src = f.read()
+    return [ln for m in core_eqs._EQN_BLOCK_RE.finditer(src)
+            for ln in core_eqs.CoreEqs._lines_from_block(m.group('body'))]
+
+# ---------------- stages ----------------
+
+def bench_codegen(n: int, repeat: int, workdir: str) -> Dict:
+    """Run core-eq.sh on the N-block corpus; returns timings and the outputs of one run."""
+    script = os.path.join(REPO, 'core-eq.sh')
+    # no closed-form inversions and no daemon, whatever the caller's environment says,
+    # so runs compare across commits and machines
+    env = dict(os.environ, AUTO_OPEN='none', PYTHONDONTWRITEBYTECODE='1',
+               CORE_EQS_SOLVE_BUDGET='0', CORE_EQS_SOCKET='off')
+    cache_path = os.path.join(workdir, f'cache-{n}.sqlite3')
+
+    def run(tag: str, cache: str) -> str:
+        notes = os.path.join(workdir, f'{n}-{tag}', 'notes')
+        os.makedirs(notes)
+        src = shutil.copy(corpus_path(n), notes)
+        subprocess.run(['bash', script, src], check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, env=dict(env, CORE_EQS_CACHE=cache))
+        return glob.glob(os.path.join(os.path.dirname(notes), '2*'))[0]
+
+    cold, warm = [], []
+    entry = None
+    for r in range(repeat):
+        t0 = time.perf_counter()
+        entry = run(f'cold{r}', 'off')
+        cold.append(time.perf_counter() - t0)
+    run('prime', cache_path)
+    for r in range(repeat):
+        t0 = time.perf_counter()
+        run(f'warm{r}', cache_path)
+        warm.append(time.perf_counter() - t0)
+
+    stem = f'synthetic-{n}'
+    return {
+        'timings': {'no_cache': _summary(cold), 'warm_cache': _summary(warm)},
+        'equations': os.path.join(entry, f'{stem}-equations.tex'),
+        'module': os.path.join(entry, f'{stem}_core.py'),
+    }
+
+def bench_parse(tex_path: str, repeat: int) -> Dict:
+    """Per-line parse cost (best of `repeat`), bucketed by the slowest path the line took."""
+    lines = _equation_lines(tex_path)
+    best = [float('inf')] * len(lines)
+    path = ['fast'] * len(lines)
+    with contextlib.redirect_stderr(io.StringIO()):
+        for _ in range(repeat):
+            for k, line in enumerate(lines):
+                before = core_eqs.parse_path_counts()
+                t0 = time.perf_counter()
+                try:
+                    core_eqs.CoreEqs._parse_line(line, None)
+                except Exception:
+                    pass
+                dt = time.perf_counter() - t0
+                after = core_eqs.parse_path_counts()
+                best[k] = min(best[k], dt)
+                hit = [p for p in PATHS if after[p] != before[p]]
+                path[k] = hit[-1] if hit else 'fast'
+    out = {'lines': len(lines), 'all': _summary(best)}
+    for p in PATHS:
+        samples = [t for t, q in zip(best, path) if q == p]
+        if samples:
+            out[p] = _summary(samples)
+    return out
+
+def bench_from_tex(tex_path: str, repeat: int, workdir: str) -> Dict:
+    with contextlib.redirect_stderr(io.StringIO()):
+        cold = _timed(lambda: core_eqs.CoreEqs.from_tex(tex_path, cache=False), repeat)
+        cache = core_eqs.ParseCache(os.path.join(workdir, f'from-tex-{os.path.basename(tex_path)}'
+                                                          '.sqlite3'))
+        core_eqs.CoreEqs.from_tex(tex_path, cache=cache)
+        warm = _timed(lambda: core_eqs.CoreEqs.from_tex(tex_path, cache=cache), repeat)
+        cache.close()
+    return {'no_cache': _summary(cold), 'warm_cache': _summary(warm)}
+
+def bench_memory(tex_path: str, workdir: str) -> Dict:
+    """Memory retained by CoreEqs.from_tex (warm cache), split into its stats and the rest."""
+    import gc
+    import tracemalloc
+    from sympy.core.cache import clear_cache
+
+    def retained() -> int:
+        # SymPy's global cache would otherwise count towards whatever was built last
+        clear_cache()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    cache = core_eqs.ParseCache(os.path.join(workdir, f'memory-{os.path.basename(tex_path)}.sqlite3'))
+    with contextlib.redirect_stderr(io.StringIO()):
+        core_eqs.CoreEqs.from_tex(tex_path, cache=cache)
+        tracemalloc.start()
+        try:
+            before = retained()
+            ce = core_eqs.CoreEqs.from_tex(tex_path, cache=cache)
+            total = retained() - before
+            lines = sum(1 for _ in ce.records())
+            ce.stats = None
+            stats = before + total - retained()
+        finally:
+            tracemalloc.stop()
+    cache.close()
+    n = max(lines, 1)
+    return {'lines': lines, 'bytes': total, 'bytes_per_line': total / n,
+            'stats_bytes_per_line': stats / n, 'equations_bytes_per_line': (total - stats) / n}
+
+_LOAD_CHILD = r'''
+import importlib.util, json, sys, time
+t0 = time.perf_counter()
+import sympy
+t1 = time.perf_counter()
+spec = importlib.util.spec_from_file_location("gen_core", sys.argv[1])
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+t2 = time.perf_counter()
+cls = next(v for k, v in vars(mod).items() if k.endswith("_Core") and isinstance(v, type))
+core = cls()
+t3 = time.perf_counter()
+tags = core.tags()
+first = next(t for t in tags if core._SREPR[t])  # tags whose lines were all skipped are empty
+core.residual(first, 0)
+t4 = time.perf_counter()
+core.residual(first, 0)
+t5 = time.perf_counter()
+for t in tags:
+    for i in range(len(core._SREPR[t])):
+        core.residual(t, i)
+t6 = time.perf_counter()
+print(json.dumps({"import_sympy": t1 - t0, "import_module": t2 - t1, "construct": t3 - t2,
+                  "first_residual": t4 - t3, "second_residual": t5 - t4,
+                  "all_residuals": t6 - t5}))
+'''
+
+def bench_load(module_path: str, repeat: int) -> Dict:
+    """Import + first-call cost of a generated module, each run in a fresh interpreter."""
+    runs = []
+    for _ in range(repeat):
+        proc = subprocess.run([sys.executable, '-c', _LOAD_CHILD, module_path], check=True,
+                              capture_output=True, text=True,
+                              env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'))
+        runs.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {k: _summary([r[k] for r in runs]) for k in runs[0]}
+
+def _asdf_core():
+    from asdf_core import asdf_Core
+    return asdf_Core()
+
+def bench_residual(repeat: int, number: int = 1000) -> Dict:
+    core = _asdf_core()
+    core.residual('1.27', 0)
+
+    def per_call(fn) -> List[float]:
+        return [t / number for t in _timed(lambda: [fn() for _ in range(number)], repeat)]
+
+    return {
+        'no_subs': _summary(per_call(lambda: core.residual('1.27', 0))),
+        'subs': _summary(per_call(lambda: core.residual('1.27', 0, **PARAMS_1_27))),
+    }
+
+def bench_evaluate(repeat: int, points: int = 100_000) -> Dict:
+    import numpy as np
+    core = _asdf_core()
+    arrays = dict(PARAMS_1_27, **{'p_{cns}': np.linspace(2.0e5, 7.0e6, points)})
+    first = _timed(lambda: core.evaluate('1.27', 0, **arrays), 1)
+    warm = _timed(lambda: core.evaluate('1.27', 0, **arrays), repeat)
+    return {'points': points, 'first_call': _summary(first), 'warm': _summary(warm)}
+
+def bench_evaluate_all(repeat: int, points: int = 100_000) -> Dict:
+    import numpy as np
+    from asdf_numeric import asdf_Numeric
+    num = asdf_Numeric()
+    lines = [(tag, i) for tag in num.tags() for i in range(len(num._FUNCS[tag]))]
+    names = sorted({n for tag, i in lines for n in num.symbols(tag, i)})
+    rng = np.random.default_rng(0)
+    arrays = {n: rng.uniform(1.05, 3.0, points) for n in names}
+    arrays['gamma'] = rng.uniform(1.1, 1.6, points)
+    with np.errstate(all='ignore'):
+        per_line = _timed(lambda: [num.evaluate(tag, i, **arrays) for tag, i in lines], repeat)
+        at_once = _timed(lambda: num.evaluate_all(**arrays), repeat)
+    return {'points': points, 'lines': len(lines),
+            'per_line': _summary(per_line), 'evaluate_all': _summary(at_once)}
+
+def bench_solve(repeat: int, workdir: str, points: int = 10_000) -> Dict:
+    core = _asdf_core()
+    r = core.residual('1.27', 0)
+    var = sp.Symbol('p_{cns}')
+    bruh = _timed(lambda: sp.solve(sp.Eq(r, 0), var), repeat)
+
+    tex = os.path.join(workdir, 'solve-equations.tex')
+    with open(tex, 'w', encoding='utf-8') as f:
+        f.write('\\begin{equation}\n\\begin{aligned}\n' + EQ_1_27 +
+                '\n\\end{aligned}\n\\tag{1.27}\n\\end{equation}\n')
+    ce = core_eqs.CoreEqs.from_tex(tex, cache=False)
+
+    def fresh(*args, **kwargs):
+        # solve_for memoizes symbolic results and timeouts; time the solve, not the lookup
+        ce._solved.clear()
+        ce._solve_timeouts.clear()
+        return ce.solve_for(*args, **kwargs)
+
+    solve_for = _timed(lambda: fresh('1.27', 'p_{cns}'), repeat)
+    solve_for_params = _timed(lambda: fresh('1.27', 'p_{cns}', PARAMS_1_27), repeat)
+    bounded = _timed(lambda: fresh('1.27', 'p_{cns}', PARAMS_1_27, timeout=60.0), repeat)
+    starved = _timed(lambda: fresh('1.27', 'p_{cns}', PARAMS_1_27, timeout=0.05,
+                                   guess=(2.0e5, 7.0e7)), repeat)
+    import numpy as np
+    table = dict(PARAMS_1_27, v_x=np.linspace(1500.0, 3000.0, points))
+    numeric_first = _timed(lambda: ce.solve_for('1.27', 'p_{cns}', table, numeric=True, guess=1.0e6), 1)
+    numeric = _timed(lambda: ce.solve_for('1.27', 'p_{cns}', table, numeric=True, guess=1.0e6), repeat)
+    return {
+        'bruh_sp_solve': _summary(bruh),
+        'solve_for': _summary(solve_for),
+        'solve_for_params': _summary(solve_for_params),
+        'solve_for_bounded': _summary(bounded),
+        'solve_for_timeout_fallback': _summary(starved),
+        'numeric_points': points,
+        'solve_for_numeric_first': _summary(numeric_first),
+        'solve_for_numeric': _summary(numeric),
+    }
+
+# ---------------- driver ----------------
+
+def _meta(repeat: int, sizes: List[int]) -> Dict:
+    def version(name: str) -> Optional[str]:
+        try:
+            from importlib.metadata import version as v
+            return v(name)
+        except Exception:
+            return None
+    try:
+        rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO, check=True,
+                             capture_output=True, text=True).stdout.strip()
+    except Exception:
+        rev = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'git_rev': rev,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sympy': sp.__version__,
+        'numpy': version('numpy'),
+        'latex2sympy2': version('latex2sympy2'),
+        'repeat': repeat,
+        'sizes': sizes,
+    }
+
+def run(sizes: List[int], repeat: int) -> Dict:
+    result = {'meta': _meta(repeat, sizes), 'stages': {}}
+    stages = result['stages']
+    workdir = tempfile.mkdtemp(prefix='core-eqs-bench-')
+    try:
+        for n in sizes:
+            print(f'[bench] {n} blocks', file=sys.stderr)
+            cg = bench_codegen(n, repeat, workdir)
+            stages[f'codegen[{n}]'] = cg['timings']
+            stages[f'parse[{n}]'] = bench_parse(cg['equations'], repeat)
+            stages[f'from_tex[{n}]'] = bench_from_tex(cg['equations'], repeat, workdir)
+            stages[f'memory[{n}]'] = bench_memory(cg['equations'], workdir)
+            stages[f'load[synthetic-{n}]'] = bench_load(cg['module'], repeat)
+        print('[bench] asdf_core', file=sys.stderr)
+        stages['load[asdf_core]'] = bench_load(os.path.join(REPO, 'asdf_core.py'), repeat)
+        stages['residual'] = bench_residual(repeat)
+        stages['evaluate'] = bench_evaluate(repeat)
+        stages['evaluate_all'] = bench_evaluate_all(repeat)
+        stages['solve'] = bench_solve(repeat, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return result
+
+def _medians(node, prefix: str = '') -> Dict[str, float]:
+    out = {}
+    if isinstance(node, dict):
+        if 'median' in node:
+            out[prefix] = node['median']
+        else:
+            for k, v in node.items():
+                out.update(_medians(v, f'{prefix}.{k}' if prefix else k))
+    return out
+
+def compare(old_path: str, new_path: str) -> None:
+    """Print median timings of two result files side by side."""
+    with open(old_path, 'r', encoding='utf-8') as f:
+        old = _medians(json.load(f)['stages'])
+    with open(new_path, 'r', encoding='utf-8') as f:
+        new = _medians(json.load(f)['stages'])
+    width = max(map(len, old.keys() | new.keys()), default=0)
+    print(f'{"stage":<{width}}  {"old":>11}  {"new":>11}  new/old')
+    for key in sorted(old.keys() | new.keys()):
+        a, b = old.get(key), new.get(key)
+        ratio = f'{b / a:7.2f}' if a and b is not None else '      -'
+        fa = f'{a:11.6f}' if a is not None else f'{"-":>11}'
+        fb = f'{b:11.6f}' if b is not None else f'{"-":>11}'
+        print(f'{key:<{width}}  {fa}  {fb}  {ratio}')
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='Benchmark the core_eqs pipeline stage by stage.')
+    ap.add_argument('--sizes', type=int, nargs='+', default=list(SIZES),
+                    help='Synthetic corpus sizes in blocks (see make_corpus.py)')
+    ap.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    ap.add_argument('--out', default=None, help='Write the JSON here instead of stdout')
+    ap.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                    help='Compare two result files and exit')
+    args = ap.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    for n in args.sizes:
+        if not os.path.exists(corpus_path(n)):
+            sys.exit(f'Missing corpus {corpus_path(n)}; run bench/make_corpus.py --sizes {n}')
+
+    result = run(args.sizes, args.repeat)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f'✔ Wrote: {args.out}', file=sys.stderr)
+    else:
+        print(text)
+
+if __name__ == '__main__':
+    main()
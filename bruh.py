@@ -17,5 +17,6 @@ print([v.name for v in vars_in_r])
 sp.pretty_print(r)
 
 
-sol = sp.solve(sp.Eq(r, 0), sp.Symbol('p_{cns}'))
+# closed form precomputed by core-eq.sh (see core.numeric_only for lines without one)
+sol = core.solve('1.27', 0, 'p_{cns}')
 sp.pretty_print(sol)
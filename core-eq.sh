@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 # extract-core-equations.sh
-# Usage: ./extract-core-equations.sh path/to/name.tex
+# Usage: ./extract-core-equations.sh [-u|--update [ENTRY_DIR]] path/to/name.tex
+#        ./extract-core-equations.sh --batch [-u] [-j N] [-n] [-v] DIR|GLOB|FILE.tex ...
 #
 # What it does:
 #   1) Finds \begin{align}...\end{align} blocks with \label{<num>:core...}
@@ -8,17 +9,55 @@
 #        \begin{equation}\begin{aligned}...\end{aligned}\tag{<num}}\end{equation}
 #   3) Creates a NEW timestamped folder under the "class" directory (like new-entry.sh)
 #   4) If a general parser python file exists beside this script (default: core_eqs.py),
-#      it will IMPORT that file's CoreEqs, parse the new *-equations.tex, and
-#      CODE-GENERATE a Python module with a class of callable methods for each equation line.
+#      core_codegen.py will IMPORT that file's CoreEqs, parse the new *-equations.tex, and
+#      CODE-GENERATE a Python module with a class of callable methods for each equation line,
+#      with closed-form solutions of each line for each of its symbols precomputed where
+#      SymPy finds them in time, plus a SymPy-free <name>_numeric.py with plain math/NumPy
+#      functions for each residual.
+#   5) With -u/--update, rebuilds in place in ENTRY_DIR (default: the entry folder of the
+#      most recent build of name.tex) instead of step 3. A manifest beside the outputs
+#      records a hash per :core block and what was generated from each residual, so only
+#      changed or added blocks are parsed, inverted and printed again; if no block
+#      changed, the generated modules are left untouched. Editing core_eqs.py or
+#      core_codegen.py invalidates the manifest (that run is a full build, still in place).
+#   6) With --batch, does all of the above for every .tex under the given directories
+#      or globs in one Python process (core_batch.py beside this script): lines are
+#      parsed once across a worker pool, inputs are built in parallel, and a summary
+#      lists each input's status and timing.
 #
 # Env knobs:
 #   AUTO_OPEN=finder|code|none  (default: none)
 #   CORE_EQS_PY=/abs/path/to/general_parser.py  (default: <this_dir>/core_eqs.py)
+#   CORE_EQS_CACHE=/path/to/parse-cache.sqlite3|off  (default: ~/.cache/core_eqs/parse-cache.sqlite3)
+#   CORE_EQS_JOBS=N  parse equation blocks in N worker processes (default: 0 = serial)
+#   CORE_EQS_STATS=1  generated classes record per-line residual()/evaluate() timings
+#   CORE_EQS_SOLVE_BUDGET=S  precompute closed-form inversions at codegen, S seconds per attempt
+#                            (default: 0 = skip; solve() then runs sp.solve on first use)
+#   CORE_EQS_SOCKET=/path/to/daemon.sock  run the extraction and codegen in the warm
+#                    `core_eqs.py --serve` daemon listening there, falling back to a fresh
+#                    interpreter if none answers (default: unset = no daemon; off = no daemon)
 
 set -euo pipefail
 
+if [[ "${1:-}" == "-b" || "${1:-}" == "--batch" ]]; then
+  shift
+  BATCH_PY="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)/core_batch.py"
+  PYBIN="${VIRTUAL_ENV:+$VIRTUAL_ENV/bin/python}"
+  exec "${PYBIN:-$(command -v python3)}" "$BATCH_PY" "$@"
+fi
+
+UPDATE=0
+UPDATE_DIR=""
+if [[ "${1:-}" == "-u" || "${1:-}" == "--update" ]]; then
+  UPDATE=1; shift
+  if [[ $# -gt 1 ]]; then
+    UPDATE_DIR="$1"; shift
+  fi
+fi
+
 if [[ $# -lt 1 ]]; then
-  echo "Usage: $0 INPUT.tex" >&2
+  echo "Usage: $0 [-u|--update [ENTRY_DIR]] INPUT.tex" >&2
+  echo "       $0 --batch [-u] [-j N] [-n] [-v] DIR|GLOB|FILE.tex ..." >&2
   exit 1
 fi
 
@@ -39,283 +78,73 @@ CORE_EQS_PY="${CORE_EQS_PY:-$SCRIPT_DIR/core_eqs.py}"
 PYBIN="${VIRTUAL_ENV:+$VIRTUAL_ENV/bin/python}"
 PYBIN="${PYBIN:-$(command -v python3)}"
 
-# New timestamped folder (with collision handling like new-entry.sh)
-TIMESTAMP="$(date +%Y%m%d%H%M)"
-FOLDER="$TIMESTAMP"
-i=1
-while [[ -d "$CLASS_DIR/$FOLDER" ]]; do
-  FOLDER="${TIMESTAMP}.$i"; ((i++))
-done
-ENTRY_DIR="$CLASS_DIR/$FOLDER"
+MANIFEST_NAME="${IN_BASE}_core.manifest.json"
+
+# --update: reuse the given entry folder, else the one whose manifest was written last
+ENTRY_DIR=""
+if [[ $UPDATE -eq 1 ]]; then
+  if [[ -n "$UPDATE_DIR" ]]; then
+    [[ -d "$UPDATE_DIR" ]] || { echo "Entry folder not found: $UPDATE_DIR" >&2; exit 1; }
+    ENTRY_DIR="$(cd "$UPDATE_DIR" && pwd)"
+  else
+    LAST="$(ls -1t "$CLASS_DIR"/*/"$MANIFEST_NAME" 2>/dev/null | head -n 1 || true)"
+    if [[ -n "$LAST" ]]; then
+      ENTRY_DIR="$(dirname "$LAST")"
+    else
+      echo "ℹ No earlier build of $IN_BASE under $CLASS_DIR; creating a new entry folder."
+    fi
+  fi
+fi
+
+if [[ -z "$ENTRY_DIR" ]]; then
+  # New timestamped folder (with collision handling like new-entry.sh)
+  TIMESTAMP="$(date +%Y%m%d%H%M)"
+  FOLDER="$TIMESTAMP"
+  i=1
+  while [[ -d "$CLASS_DIR/$FOLDER" ]]; do
+    FOLDER="${TIMESTAMP}.$i"; ((i++))
+  done
+  ENTRY_DIR="$CLASS_DIR/$FOLDER"
+  UPDATE=0
+fi
 FIG_DIR="$ENTRY_DIR/Figures"
 mkdir -p "$FIG_DIR"
 
 OUT_TEX="$ENTRY_DIR/${IN_BASE}-equations.tex"
 OUT_GEN="$ENTRY_DIR/${IN_BASE}_core.py"     # <-- generated class file
+OUT_NUM="$ENTRY_DIR/${IN_BASE}_numeric.py"  # <-- generated SymPy-free companion
+OUT_MANIFEST="$ENTRY_DIR/$MANIFEST_NAME"    # <-- block hashes + cached codegen, for --update
 
-TMP_CONTENT="$(mktemp)"
-trap 'rm -f "$TMP_CONTENT"' EXIT
-
-# --- Collect align blocks with :core labels and emit as equation+aligned+tag ---
-# --- Collect align blocks with :core labels and emit as equation+aligned+tag ---
-perl -0777 -ne '
-  while (m/\\begin\{align\}(.+?)\\end\{align\}/sg) {
-    my $blk = $1;
-    if ($blk =~ /\\label\{([^}:]+):core[^}]*\}/s) {
-      my $tag = $1;  # e.g., 12.68
-
-      # --- PRE-NORMALIZE COMMON FAULTS ---------------------------------------
-      # 1) remove :core labels (we’ll tag outside)
-      $blk =~ s/\\label\{[^}]*:core[^}]*\}//g;
-
-      # 2) strip \left and \right
-      $blk =~ s/\\left\s*//g;
-      $blk =~ s/\\right\s*//g;
-
-      # 3) remove align markers
-      $blk =~ s/&//g;
-
-      # 4) normalize subscripts with \text{} or \mathrm{}  -> plain
-      $blk =~ s/_\{\s*\\(?:text|mathrm)\{([^}]+)\}\s*\}/_{\1}/g;
-
-      # 5) ungroup (X)_{...} -> X_{...}   (simple base)
-      $blk =~ s/\(\s*([A-Za-z\\][A-Za-z0-9]*)\s*\)_\{([^}]+)\}/$1_{\2}/g;
-
-      # 6) collapse comma subscripts: _{a,b} -> _{a_b}  (iterate)
-      1 while ($blk =~ s/_\{([^}]+),\s*([^}]+)\}/_{\1_\2}/g);
-
-      # 7) dotted symbols: \dot{W} -> Wdot ; \dot{p_c} -> p_cdot
-      $blk =~ s/\\dot\{([A-Za-z](?:_[A-Za-z0-9]+|\_\{[^}]+\})?)\}/$1dot/g;
-
-      # 8) tidy products like R\left(T_{cns}\right) -> R T_{cns}
-      $blk =~ s/([A-Za-z])\s*\(\s*([A-Za-z][A-Za-z0-9]*(?:_\{[^}]+\}|_[A-Za-z0-9]+)?)\s*\)/$1 $2/g;
-      
-      $blk =~ s/_(?!\{)([A-Za-z0-9])/_{\1}/g;
-      $blk =~ s/\^([A-Za-z0-9])/\^{\1}/g;
-
-      # 9) split chained equalities A=B=C into two lines (A=B \\ newline B=C)
-      #    only inside individual lines to keep alignment sane
-      $blk =~ s/^\s*(.+?)\s*=\s*(.+?)\s*=\s*(.+?)\s*$/$1 = $2 \\\\\n$2 = $3/gm;
-
-      # trim
-      $blk =~ s/^\s+|\s+$//g;
-
-      # --- EMIT CLEAN BLOCK ---------------------------------------------------
-      print "\\begin{equation}\n";
-      print "\\begin{aligned}\n$blk\n\\end{aligned}\n";
-      print "\\tag{$tag}\n";
-      print "\\end{equation}\n\n";
-    }
-  }
-' "$IN" > "$TMP_CONTENT"
-
-DATE_ISO="$(date +%Y-%m-%d)"
-
-# --- Write LaTeX wrapper ---
-cat >"$OUT_TEX" <<EOF
-\\documentclass[12pt]{article}
-
-%––––– Packages –––––
-\\usepackage[margin=1in]{geometry}
-\\usepackage{amsmath,amssymb,amsthm}
-\\usepackage{enumitem}
-\\usepackage{hyperref}
-\\usepackage{xcolor}
-\\usepackage{import}
-\\usepackage{xifthen}
-\\usepackage{pdfpages}
-\\usepackage{transparent}
-\\usepackage{listings}
-\\usepackage{tikz}
-\\usepackage{physics}
-\\usepackage{siunitx}
-\\usepackage{booktabs}
-\\usepackage{cancel}
-  \\usetikzlibrary{calc,patterns,arrows.meta,decorations.markings}
-
-\\newcommand{\\incfig}[1]{%%
-    \\def\\svgwidth{\\columnwidth}%%
-    \\import{./Figures/}{##1.pdf_tex}%%
-}
-
-\\theoremstyle{definition}
-\\newtheorem{definition}{Definition}
-\\newtheorem{example}{Example}
-\\newtheorem{problem}{Problem}
-\\newtheorem{solution}{Solution}
-\\newtheorem{remark}{Remark}
-\\theoremstyle{plain}
-\\newtheorem{theorem}{Theorem}
-\\newtheorem{lemma}{Lemma}
-\\newtheorem{proposition}{Proposition}
-\\newtheorem{corollary}{Corollary}
-
-\\title{Core Equations — ${IN_BASE}}
-\\author{Jerich Lee}
-\\date{${DATE_ISO}}
-
-\\begin{document}
-\\maketitle
-
-% Auto-extracted equations from align environments with labels ending in :core
-EOF
-
-if [[ -s "$TMP_CONTENT" ]]; then
-  cat "$TMP_CONTENT" >> "$OUT_TEX"
+if [[ $UPDATE -eq 1 ]]; then
+  echo "✔ Updating entry folder: $ENTRY_DIR"
 else
-  cat >>"$OUT_TEX" <<'EOF'
-\begin{center}
-\textit{No \texttt{\textbackslash begin\{align\}} blocks with labels of the form \texttt{\textbackslash label\{\#:\!core\}} were found.}
-\end{center}
-EOF
+  echo "✔ Created entry folder: $ENTRY_DIR"
 fi
 
-cat >>"$OUT_TEX" <<'EOF'
-
-\end{document}
-EOF
-
-echo "✔ Created entry folder: $ENTRY_DIR"
-echo "✔ Wrote: $OUT_TEX"
-
-# --- Codegen: if the general parser file exists, import it and generate a class module
+# --- Collect align blocks with :core labels and write them, as equation+aligned+tag, in
+# the LaTeX wrapper; then, if the general parser file exists, import it and generate a
+# class module. Both are core_codegen.py (which core_batch.py runs as well) ---
 if [[ -f "$CORE_EQS_PY" ]]; then
-"$PYBIN" - "$CORE_EQS_PY" "$OUT_TEX" "$OUT_GEN" "$IN_BASE" <<'PYCODE'
-import sys, os, importlib.util, textwrap
-from datetime import datetime
-
-core_path, tex_path, out_py, in_base = sys.argv[1:5]
-
-# Import the general parser module from a file path
-spec = importlib.util.spec_from_file_location("core_eqs_mod", core_path)
-mod = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(mod)  # provides mod.CoreEqs
-
-ce = mod.CoreEqs.from_tex(tex_path)
-
-# Safe Python identifier for class name & method names
-def safe_name(s: str, prefix="t"):
-    import re
-    s2 = re.sub(r'[^0-9a-zA-Z_]', '_', s)
-    if not s2 or s2[0].isdigit():
-        s2 = f"{prefix}_{s2}"
-    return s2
-
-# Class name based on input base name
-ClassName = safe_name(in_base.replace('-', '_').replace('.', '_')) + "_Core"
-
-# Precompute srepr strings of residuals, so generated module is standalone
-import sympy as sp
-srepr_map = {}      # tag -> [srepr residuals...]
-sym_names_map = {}  # tag -> [ [sym_name,...], ... ]
-for tag in ce.tags():
-    reps = []
-    symnames = []
-    for r in ce.residuals[tag]:
-        reps.append(sp.srepr(sp.sympify(r)))
-        symnames.append(sorted([s.name for s in r.free_symbols]))
-    srepr_map[tag] = reps
-    sym_names_map[tag] = symnames
-
-with open(out_py, "w", encoding="utf-8") as f:
-    # Header + class start
-    f.write(f"""#!/usr/bin/env python3
-# Auto-generated on {datetime.now().isoformat(timespec='seconds')}
-# Source: {os.path.basename(tex_path)}
-# NOTE: This file is standalone; it reconstructs SymPy expressions from srepr strings.
-from __future__ import annotations
-from typing import Dict, List
-import sympy as sp
-
-__all__ = ["{ClassName}"]
-
-class {ClassName}:
-    \"\"\"Callable symbolic core equations.
-
-    Access:
-      - tags() -> List[str]
-      - residual(tag: str, i: int, **subs) -> sp.Expr
-      - symbols(tag: str, i: int) -> List[sp.Symbol]
-      - eq_all(tag: str) -> List[sp.Expr]
-      - Convenience per-line methods: eq_<tag>_<i>(**subs)
-    \"\"\"
-
-    _SREPR: Dict[str, List[str]] = {{
-""")
-    # _SREPR content
-    for tag, reps in srepr_map.items():
-        f.write(f"        {repr(tag)}: [\n")
-        for r in reps:
-            f.write("            " + repr(r) + ",\n")
-        f.write("        ],\n")
-    f.write("    }\n\n")
-
-    # _SYMNAMES content
-    f.write("    _SYMNAMES: Dict[str, List[List[str]]] = {\n")
-    for tag, symnames in sym_names_map.items():
-        f.write(f"        {repr(tag)}: {repr(symnames)},\n")
-    f.write("    }\n\n")
-
-    # Methods (properly indented INSIDE the class)
-    methods = f'''
-def __init__(self) -> None:
-    self._cache: Dict[tuple, sp.Expr] = {{}}
-
-def tags(self) -> List[str]:
-    return sorted(self._SREPR.keys())
-
-def _expr(self, tag: str, i: int) -> sp.Expr:
-    key = (tag, i)
-    if key in self._cache:
-        return self._cache[key]
-    try:
-        s = self._SREPR[tag][i]
-    except (KeyError, IndexError) as e:
-        raise KeyError(f"Unknown equation index for tag '{{tag}}' i={{i}}") from e
-    expr = eval(s, {{}}, vars(sp))   # reconstruct SymPy expr from srepr
-    self._cache[key] = expr
-    return expr
-
-def symbols(self, tag: str, i: int) -> List[sp.Symbol]:
-    names = self._SYMNAMES.get(tag, [])
-    if i < 0 or i >= len(names):
-        raise KeyError(f"Unknown equation index for tag '{{tag}}' i={{i}}")
-    return [sp.Symbol(n) for n in names[i]]
-
-def residual(self, tag: str, i: int, **subs) -> sp.Expr:
-    expr = self._expr(tag, i)
-    return expr.subs(subs) if subs else expr
-
-def eq_all(self, tag: str) -> List[sp.Expr]:
-    return [ self._expr(tag, i) for i in range(len(self._SREPR.get(tag, []))) ]
-'''
-    f.write(textwrap.indent(textwrap.dedent(methods), "    "))
-
-    # Per-line convenience methods, also indented inside class
-    for tag, reps in srepr_map.items():
-        tag_id = safe_name(tag)
-        for i in range(len(reps)):
-            m = f"""
-def eq_{tag_id}_{i}(self, **subs) -> sp.Expr:
-    \"\"\"Residual for tag {tag}, line {i}.\"\"\"
-    return self.residual({repr(tag)}, {i}, **subs)
-"""
-            f.write(textwrap.indent(textwrap.dedent(m), "    "))
-
-    # Footer
-    f.write(textwrap.dedent(f"""
-if __name__ == "__main__":
-    core = {ClassName}()
-    print("Tags:", core.tags())
-    for t in core.tags():
-        print(f"\\nTag {{t}} has", len(core._SREPR[t]), "equation(s).")
-        if core._SREPR[t]:
-            print(" First residual:", core.residual(t, 0))
-"""))
-
-print(f"✔ Wrote generated class: {out_py}")
-PYCODE
+  # With CORE_EQS_SOCKET set, a warm `core_eqs.py --serve` daemon runs the build (75: no
+  # daemon answered); otherwise, or without one, one fresh interpreter does.
+  STATUS=75
+  if [[ -n "${CORE_EQS_SOCKET:-}" && "$CORE_EQS_SOCKET" != "off" && -f "$SCRIPT_DIR/core_client.py" ]]; then
+    STATUS=0
+    "$PYBIN" "$SCRIPT_DIR/core_client.py" build "$IN" "$OUT_TEX" "$IN_BASE" "$CORE_EQS_PY" \
+      "$OUT_GEN" "$OUT_NUM" "$OUT_MANIFEST" || STATUS=$?
+    if [[ $STATUS -eq 0 ]]; then
+      echo "ℹ Built in the core_eqs daemon on $CORE_EQS_SOCKET"
+    elif [[ $STATUS -ne 75 ]]; then
+      exit "$STATUS"
+    fi
+  fi
+  if [[ $STATUS -eq 75 ]]; then
+    "$PYBIN" "$SCRIPT_DIR/core_codegen.py" build "$IN" "$OUT_TEX" "$IN_BASE" "$CORE_EQS_PY" \
+      "$OUT_GEN" "$OUT_NUM" "$OUT_MANIFEST"
+  fi
 else
+  "$PYBIN" "$SCRIPT_DIR/core_codegen.py" extract "$IN" "$OUT_TEX" "$IN_BASE"
+  echo "✔ Wrote: $OUT_TEX"
   echo "ℹ General parser not found at: $CORE_EQS_PY"
   echo "  Skipping Python codegen. (Set CORE_EQS_PY to override.)"
 fi
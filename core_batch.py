@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# core_batch.py
+# Usage:
+#   python core_batch.py [-u|--update] [-j N] [-n|--dry-run] [-v] PATH|GLOB ...
+#   ./core-eq.sh --batch [-u] [-j N] PATH|GLOB ...
+#   python core_batch.py -u ~/classes/04_fall_2025                 # every course entry
+#   python core_batch.py 'me-420/2025*/*.tex' 'ae-4310/**/*.tex'
+#
+# core-eq.sh for many inputs at once, in one process instead of one bash and two cold
+# Python interpreters per file. Directories are searched recursively for *.tex
+# (generated *-equations.tex files are left out), globs may use **, and inputs without
+# any \label{...:core} align block are skipped. Each input gets the same outputs, in the
+# same entry folders, as `core-eq.sh [-u] INPUT.tex`:
+#   1) its :core align blocks are extracted and normalized, and written as
+#      <entry>/<name>-equations.tex;
+#   2) the distinct lines of all inputs that the parse cache does not know yet are parsed
+#      once, spread over N worker processes that share the cache (so a line used by
+#      several entries costs one parse);
+#   3) the codegen writes <name>_core.py, <name>_numeric.py and the manifest, one input
+#      per worker, forked from this process with SymPy and the parsers already imported.
+# Extraction and codegen are core-eq.sh's own, from core_codegen.py, so a batch build
+# writes the same files as a single-file one and its manifests stay valid for
+# single-file --update runs.
+# A summary lists every input with its status (built, up to date, failed, skipped) and
+# timings; the codegen output of failed inputs is printed in full (-v: of all inputs).
+# Exits 1 if any input failed. The CORE_EQS_* knobs of core-eq.sh apply, except that
+# CORE_EQS_JOBS is ignored (-j parallelizes over lines and inputs instead).
+import os
+import sys
+import glob
+import time
+import importlib.util
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def _core_eqs():
+    # the general parser, from the same place core-eq.sh takes it
+    if 'core_eqs' not in sys.modules:
+        path = os.environ.get('CORE_EQS_PY') or os.path.join(HERE, 'core_eqs.py')
+        spec = importlib.util.spec_from_file_location('core_eqs', path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules['core_eqs'] = mod
+    return sys.modules['core_eqs']
+
+def _core_codegen():
+    # extraction, the equations file and the codegen, shared with core-eq.sh
+    if 'core_codegen' not in sys.modules:
+        path = os.path.join(HERE, 'core_codegen.py')
+        spec = importlib.util.spec_from_file_location('core_codegen', path)
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules['core_codegen'] = mod
+    return sys.modules['core_codegen']
+
+# --------------------------------------------------------------------------------------
+# Inputs and entry folders
+# --------------------------------------------------------------------------------------
+
+def find_inputs(patterns: List[str]) -> Tuple[List[str], List[str]]:
+    """(.tex inputs under the directories/globs/files, sorted; patterns that matched nothing)."""
+    found, unmatched = {}, []
+    for pat in patterns:
+        if os.path.isdir(pat):
+            paths = []
+            for root, dirs, files in os.walk(pat):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                paths += [os.path.join(root, f) for f in files if f.endswith('.tex')]
+        elif glob.has_magic(pat):
+            paths = [p for p in glob.glob(pat, recursive=True) if os.path.isfile(p)]
+        else:
+            paths = [pat] if os.path.isfile(pat) else []
+        paths = [p for p in paths if p.endswith('.tex') and not p.endswith('-equations.tex')]
+        if not paths:
+            unmatched.append(pat)
+        for p in paths:
+            found.setdefault(os.path.realpath(p), os.path.abspath(p))
+    return sorted(found.values()), unmatched
+
+def entry_dir(tex: str, update: bool, taken: set) -> Tuple[str, bool]:
+    """
+    (entry folder, reused?) for ``tex``, chosen as core-eq.sh does: with ``update`` the
+    folder of its most recent manifest in the class folder, else (or if there is none)
+    a new <YYYYmmddHHMM>[.i] folder beside the input's own entry folder.
+    """
+    in_base = os.path.basename(tex)[:-len('.tex')]
+    class_dir = os.path.dirname(os.path.dirname(tex))
+    if update:
+        manifests = glob.glob(os.path.join(glob.escape(class_dir), '*', f'{in_base}_core.manifest.json'))
+        if manifests:
+            return os.path.dirname(max(manifests, key=os.path.getmtime)), True
+    stamp = datetime.now().strftime('%Y%m%d%H%M')
+    folder, i = stamp, 1
+    while os.path.isdir(os.path.join(class_dir, folder)) or os.path.join(class_dir, folder) in taken:
+        folder, i = f'{stamp}.{i}', i + 1
+    path = os.path.join(class_dir, folder)
+    taken.add(path)
+    return path, False
+
+# --------------------------------------------------------------------------------------
+# Codegen (core_codegen.generate(), one input per call)
+# --------------------------------------------------------------------------------------
+
+def _codegen_init() -> None:
+    os.environ['CORE_EQS_JOBS'] = '0'
+
+def _codegen(argv: List[str]) -> Tuple[str, float, str]:
+    """Run the codegen with ``argv``: (status, seconds, its output)."""
+    import io
+    import traceback
+    from contextlib import redirect_stdout, redirect_stderr
+    from sympy.core.cache import clear_cache
+    buf = io.StringIO()
+    status = 'built'
+    t0 = time.perf_counter()
+    with redirect_stdout(buf), redirect_stderr(buf):
+        try:
+            if not _core_codegen().generate(*argv):
+                status = 'up to date'   # nothing changed since the manifest was written
+        except Exception:
+            traceback.print_exc()
+            status = 'failed'
+    clear_cache()
+    return status, time.perf_counter() - t0, buf.getvalue()
+
+# --------------------------------------------------------------------------------------
+# Batch
+# --------------------------------------------------------------------------------------
+
+class BatchItem:
+    """
+    One input of a batch.
+
+    status:   'built', 'up to date', 'failed', 'skipped' (no :core blocks) or
+              'planned' (dry run)
+    blocks:   number of :core blocks
+    extract:  seconds spent extracting and writing <name>-equations.tex
+    codegen:  seconds the codegen took
+    log:      what core-eq.sh would have printed for it
+    error:    last line of the log, if it failed
+    """
+
+    def __init__(self, tex: str):
+        self.tex = tex
+        self.entry: Optional[str] = None
+        self.status = 'skipped'
+        self.blocks = 0
+        self.extract = 0.0
+        self.codegen = 0.0
+        self.log = ''
+
+    @property
+    def error(self) -> Optional[str]:
+        if self.status != 'failed':
+            return None
+        lines = self.log.strip().splitlines()
+        return lines[-1] if lines else 'failed'
+
+    def __repr__(self) -> str:
+        return f'BatchItem({self.tex!r}, {self.status}, {self.blocks} blocks)'
+
+def _preparse(texts: List[str], jobs: int) -> Tuple[int, int, float]:
+    # Parse every distinct line the cache has not seen, so the codegen only hits the
+    # cache: (distinct lines, lines parsed, seconds).
+    import io
+    from contextlib import redirect_stderr
+    ce_mod = _core_eqs()
+    t0 = time.perf_counter()
+    cache = ce_mod.ParseCache.default()
+    if cache is None:
+        return 0, 0, 0.0
+    seen, todo = set(), []
+    for text in texts:
+        for m in ce_mod._EQN_BLOCK_RE.finditer(text):
+            for line in ce_mod.CoreEqs._lines_from_block(m.group('body')):
+                key = ce_mod._normalize_for_parsers(line)
+                if key not in seen:
+                    seen.add(key)
+                    if cache.get(key) is None:
+                        todo.append(line)
+    # commit the lookups' last_used updates: the workers write to the same database
+    cache.flush()
+    if todo:
+        per = max(1, min(32, -(-len(todo) // (4 * max(jobs, 1)))))
+        chunks = [(f'#{k}', todo[k:k + per]) for k in range(0, len(todo), per)]
+        # unparsable lines are reported again, with their tags, by the codegen
+        with redirect_stderr(io.StringIO()):
+            ce_mod.CoreEqs.from_blocks(chunks, cache=cache, workers=jobs)
+    cache.close()
+    return len(seen), len(todo), time.perf_counter() - t0
+
+def batch(patterns: List[str], update: bool = False, jobs: int = 0, dry_run: bool = False,
+          verbose: bool = False, quiet: bool = False) -> List[BatchItem]:
+    """
+    Run core-eq.sh's pipeline over every .tex input under ``patterns`` (see the top of
+    this file) and return one BatchItem per input. ``jobs`` worker processes parse and
+    generate (default: all cores, 1 = everything in this process). Unless ``quiet``,
+    each input is reported on stderr as it finishes, with its codegen output if it
+    failed (``verbose``: always).
+    """
+    inputs, _ = find_inputs(patterns)
+    jobs = jobs or os.cpu_count() or 1
+    core_py = os.environ.get('CORE_EQS_PY') or os.path.join(HERE, 'core_eqs.py')
+    have_parser = os.path.isfile(core_py)
+    codegen = _core_codegen()
+    items = [BatchItem(tex) for tex in inputs]
+    taken: set = set()
+    texts, todo = [], []
+
+    def done(item: BatchItem) -> None:
+        if quiet:
+            return
+        if item.status != 'skipped':
+            mark = '✖' if item.status == 'failed' else '✔'
+            print(f'{mark} {item.status}: {item.tex}', file=sys.stderr)
+        if item.log and (verbose or item.status == 'failed'):
+            sys.stderr.write(item.log)
+
+    # 1) extract, one input after the other, writing each equations file as we go
+    for item in items:
+        t0 = time.perf_counter()
+        in_base = os.path.basename(item.tex)[:-len('.tex')]
+        try:
+            with open(item.tex, encoding='utf-8', errors='surrogateescape') as f:
+                blocks = list(codegen.core_blocks(f.read()))
+        except OSError as e:
+            item.status, item.log = 'failed', f'{e}\n'
+            done(item)
+            continue
+        item.blocks = len(blocks)
+        if not blocks:
+            continue
+        item.entry, reused = entry_dir(item.tex, update, taken)
+        if dry_run:
+            item.status = 'planned'
+            done(item)
+            continue
+        out_tex = os.path.join(item.entry, f'{in_base}-equations.tex')
+        text = codegen.equations_tex(in_base, blocks)
+        try:
+            os.makedirs(os.path.join(item.entry, 'Figures'), exist_ok=True)
+            with open(out_tex, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+                f.write(text)
+        except OSError as e:
+            item.status, item.log = 'failed', f'{e}\n'
+            done(item)
+            continue
+        item.extract = time.perf_counter() - t0
+        verb = 'Updating' if reused else 'Created'
+        item.log = f'✔ {verb} entry folder: {item.entry}\n✔ Wrote: {out_tex}\n'
+        if not have_parser:
+            item.status = 'built'
+            item.log += f'ℹ General parser not found at: {core_py}\n'
+            done(item)
+            continue
+        texts.append(text)
+        todo.append((item, [core_py, out_tex, os.path.join(item.entry, f'{in_base}_core.py'),
+                            in_base, os.path.join(item.entry, f'{in_base}_numeric.py'),
+                            os.path.join(item.entry, f'{in_base}_core.manifest.json')]))
+    if not todo:
+        return items
+
+    # 2) parse every line not in the cache yet, once, across the pool
+    n_lines, n_parsed, seconds = _preparse(texts, jobs)
+    if not quiet and n_lines:
+        print(f'ℹ Parsed {n_parsed} new of {n_lines} distinct line(s) in {seconds:.1f}s',
+              file=sys.stderr)
+
+    # 3) codegen, one input per task
+    def finish(item: BatchItem, result: Tuple[str, float, str]) -> None:
+        item.status, item.codegen, log = result
+        item.log += log
+        done(item)
+
+    if jobs <= 1 or len(todo) == 1:
+        old_jobs = os.environ.get('CORE_EQS_JOBS')
+        _codegen_init()
+        try:
+            for item, argv in todo:
+                finish(item, _codegen(argv))
+        finally:
+            if old_jobs is None:
+                os.environ.pop('CORE_EQS_JOBS', None)
+            else:
+                os.environ['CORE_EQS_JOBS'] = old_jobs
+    else:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork') if 'fork' in methods else None
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo)), mp_context=ctx,
+                                 initializer=_codegen_init) as pool:
+            futures = {pool.submit(_codegen, argv): item for item, argv in todo}
+            for fut in as_completed(futures):
+                try:
+                    result = fut.result()
+                except Exception as e:   # the worker died (BrokenProcessPool)
+                    result = ('failed', 0.0, f'{type(e).__name__}: {e}\n')
+                finish(futures[fut], result)
+    return items
+
+def summary(items: List[BatchItem], seconds: float, root: Optional[str] = None) -> str:
+    """One line per input plus totals, paths relative to ``root`` (default: cwd)."""
+    root = root or os.getcwd()
+
+    def rel(p: str) -> str:
+        r = os.path.relpath(p, root)
+        return p if r.startswith('..') else r
+
+    counts: Dict[str, int] = {}
+    rows = []
+    for it in items:
+        counts[it.status] = counts.get(it.status, 0) + 1
+        where = f' -> {rel(it.entry)}' if it.entry else ''
+        rows.append(f'  {it.status:<10} {it.extract + it.codegen:7.2f}s  {it.blocks:4d} blocks  '
+                    f'{rel(it.tex)}{where}')
+        if it.error:
+            rows.append(f'             {it.error}')
+    order = ['built', 'up to date', 'planned', 'failed', 'skipped']
+    totals = ', '.join(f'{counts[s]} {s}' for s in order if s in counts)
+    head = f'✔ Batch: {len(items)} input(s) in {seconds:.1f}s ({totals or "nothing to do"})'
+    return '\n'.join([head] + rows)
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='Run core-eq.sh over many .tex inputs in one process.')
+    ap.add_argument('inputs', nargs='+', metavar='PATH|GLOB',
+                    help='.tex files, directories (searched recursively) or globs')
+    ap.add_argument('-u', '--update', action='store_true',
+                    help='rebuild each input in the entry folder of its last build (core-eq.sh -u)')
+    ap.add_argument('-j', '--jobs', type=int, default=0,
+                    help='worker processes (default: all cores; 1 = no workers)')
+    ap.add_argument('-n', '--dry-run', action='store_true',
+                    help='list the inputs and their entry folders without writing anything')
+    ap.add_argument('-v', '--verbose', action='store_true', help="print every input's codegen output")
+    args = ap.parse_args()
+
+    _, unmatched = find_inputs(args.inputs)
+    for pat in unmatched:
+        print(f'ℹ No .tex inputs in: {pat}', file=sys.stderr)
+
+    t0 = time.perf_counter()
+    items = batch(args.inputs, update=args.update, jobs=args.jobs, dry_run=args.dry_run,
+                  verbose=args.verbose)
+    if not items:
+        raise SystemExit('core_batch: no .tex inputs found')
+    print(summary(items, time.perf_counter() - t0))
+    if any(it.status == 'failed' for it in items):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
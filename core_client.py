@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# core_client.py
+# Usage:
+#   python core_eqs.py --serve &                  # start the daemon (once per session)
+#   python core_client.py ping
+#   python core_client.py call load '{"tex": "notes/asdf-equations.tex"}'
+#   python core_client.py call solve '{"tex": "notes/asdf-equations.tex", "tag": "1.24",
+#                                      "var": "M_x", "params": {"A_x": 2, "A_t": 1}}'
+#   python core_client.py load notes/asdf-equations.tex
+#   python core_client.py build INPUT.tex OUT-equations.tex NAME CORE_EQS_PY OUT_core.py \
+#       OUT_numeric.py OUT_core.manifest.json
+#   python core_client.py stop
+#
+# Thin, standard-library-only client for the daemon `core_eqs.py --serve` runs on a Unix
+# socket (CORE_EQS_SOCKET, default ~/.cache/core_eqs/daemon.sock). It starts in a few
+# milliseconds because it never imports SymPy; the daemon has it (and the parsers,
+# loaded documents, compiled kernels and solve caches) warm. `call` prints the JSON
+# result of one request; `load` parses a document in the daemon; `build` is
+# `core_codegen.py build` run by the daemon (its generate op) in this cwd and
+# environment -- core-eq.sh builds this way when CORE_EQS_SOCKET is set.
+# Exits 75 (EX_TEMPFAIL) when no daemon answers or it cannot take the request, so
+# callers can go on without one.
+import os
+import sys
+import json
+import socket
+from typing import Optional
+
+EX_NODAEMON = 75
+
+def default_socket_path() -> str:
+    # same as core_eqs.default_socket_path(), without importing core_eqs
+    env = os.environ.get('CORE_EQS_SOCKET')
+    if env:
+        return env
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'core_eqs', 'daemon.sock')
+
+class DaemonUnavailable(OSError):
+    pass
+
+class DaemonError(RuntimeError):
+    """A request the daemon answered with ok=false; the message is 'Type: message'."""
+
+class CoreClient:
+    """
+    One connection to the daemon. Requests on it are answered in order; open several
+    clients to have the daemon work on requests concurrently.
+
+        with CoreClient() as c:
+            c.request('load', tex='asdf-equations.tex')
+            c.request('evaluate', tex='asdf-equations.tex', tag='1.24', i=0,
+                      values={'A_x': [1, 2, 3], 'A_t': 1, 'M_x': 2, 'gamma': 1.4})
+    """
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None):
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self.path)
+        except OSError as e:
+            self._sock.close()
+            raise DaemonUnavailable(f'No core_eqs daemon on {self.path}: {e}') from None
+        self._file = self._sock.makefile('rb')
+        self._next_id = 0
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self) -> 'CoreClient':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _send(self, op: str, args: dict) -> int:
+        self._next_id += 1
+        msg = dict(args, op=op, id=self._next_id)
+        self._sock.sendall(json.dumps(msg).encode('utf-8') + b'\n')
+        return self._next_id
+
+    def _replies(self):
+        while True:
+            line = self._file.readline()
+            if not line:
+                raise ConnectionError('The core_eqs daemon closed the connection')
+            yield json.loads(line)
+
+    @staticmethod
+    def _result(reply: dict):
+        if not reply.get('ok'):
+            raise DaemonError(reply.get('error', 'unknown error'))
+        return reply.get('result')
+
+    def request(self, op: str, **args):
+        """Send one request and return its result (raises DaemonError on failure)."""
+        self._send(op, args)
+        return self._result(next(self._replies()))
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='Talk to a running `core_eqs.py --serve` daemon.')
+    ap.add_argument('--socket', default=None, help='daemon socket (default: $CORE_EQS_SOCKET '
+                                                   'or ~/.cache/core_eqs/daemon.sock)')
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    sub.add_parser('ping', help='print the daemon status')
+    sub.add_parser('stop', help='shut the daemon down')
+    p_call = sub.add_parser('call', help='send one request, print its JSON result')
+    p_call.add_argument('op')
+    p_call.add_argument('args', nargs='?', default='{}', help='JSON object of arguments')
+    p_load = sub.add_parser('load', help='parse a document in the daemon, print its summary')
+    p_load.add_argument('tex')
+    p_build = sub.add_parser('build', help='run core_codegen.py build in the daemon')
+    for arg in ('input', 'out_tex', 'name', 'core_eqs_py', 'out_py', 'out_num', 'manifest'):
+        p_build.add_argument(arg)
+    args = ap.parse_args()
+
+    try:
+        client = CoreClient(args.socket)
+    except DaemonUnavailable as e:
+        print(f'core_client: {e}', file=sys.stderr)
+        sys.exit(EX_NODAEMON)
+    with client:
+        try:
+            if args.cmd == 'ping':
+                result = client.request('ping')
+            elif args.cmd == 'stop':
+                result = client.request('shutdown')
+            elif args.cmd == 'load':
+                result = client.request('load', tex=os.path.abspath(args.tex))
+            elif args.cmd == 'build':
+                result = client.request(
+                    'generate', core_eqs_py=args.core_eqs_py, tex=args.out_tex,
+                    out_py=args.out_py, name=args.name, out_num=args.out_num,
+                    manifest=args.manifest, source=args.input, cwd=os.getcwd(),
+                    env=dict(os.environ),
+                    codegen=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                         'core_codegen.py'))
+                sys.stdout.write(result['output'])
+                sys.exit(result['status'])
+            else:
+                result = client.request(args.op, **json.loads(args.args))
+        except DaemonError as e:
+            if args.cmd == 'build':
+                # e.g. a daemon from before the generate op: the caller builds by itself
+                print(f'core_client: {e}', file=sys.stderr)
+                sys.exit(EX_NODAEMON)
+            raise SystemExit(f'core_client: {e}')
+    print(json.dumps(result, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1194 @@
+#!/usr/bin/env python3
+# core_codegen.py
+# Usage:
+#   python core_codegen.py extract INPUT.tex OUT-equations.tex NAME
+#   python core_codegen.py generate CORE_EQS_PY NAME-equations.tex OUT_core.py NAME \
+#       OUT_numeric.py OUT_core.manifest.json
+#   python core_codegen.py build INPUT.tex OUT-equations.tex NAME CORE_EQS_PY OUT_core.py \
+#       OUT_numeric.py OUT_core.manifest.json
+#
+# The Python half of core-eq.sh, shared with core_batch.py so that a single-file run and
+# a batch run write the same bytes:
+#   extract   finds the \begin{align} blocks of INPUT.tex with a \label{<num>:core...},
+#             normalizes them and writes them, as equation+aligned+tag, into the LaTeX
+#             wrapper OUT-equations.tex (core_blocks(), equations_tex());
+#   generate  parses NAME-equations.tex with the general parser CORE_EQS_PY and writes
+#             the class module, its SymPy-free numeric companion and the build manifest
+#             (generate()); exits 0 without writing anything when the manifest shows no
+#             :core block changed;
+#   build     both in one process (build()): what a single-file core-eq.sh run does.
+# SOURCE_DATE_EPOCH, if set, is the date and time written into the outputs.
+import os
+import re
+import sys
+import ast
+import json
+import time
+import hashlib
+import inspect
+import keyword
+import textwrap
+import importlib.util
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def _core_eqs(path: str):
+    # the general parser; inspect finds BoundResidual's source through sys.modules
+    if 'core_eqs' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('core_eqs', path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules['core_eqs'] = mod
+        spec.loader.exec_module(mod)
+    return sys.modules['core_eqs']
+
+def _now() -> datetime:
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).replace(tzinfo=None)
+    return datetime.now()
+
+# --------------------------------------------------------------------------------------
+# Extraction
+# --------------------------------------------------------------------------------------
+#
+# re.ASCII matches perl's byte-string \s (these patterns started out as a perl
+# one-liner), and files are read and written with surrogateescape so bytes that are not
+# UTF-8 pass through unchanged.
+
+_A = re.ASCII
+_ALIGN_RE = re.compile(r'\\begin\{align\}(.+?)\\end\{align\}', re.S | _A)
+_CORE_LABEL_RE = re.compile(r'\\label\{([^}:]+):core[^}]*\}', re.S | _A)
+_CLEANUPS = [
+    # :core labels (the tag goes outside), \left, \right and align markers
+    (re.compile(r'\\label\{[^}]*:core[^}]*\}', _A), ''),
+    (re.compile(r'\\left\s*', _A), ''),
+    (re.compile(r'\\right\s*', _A), ''),
+    (re.compile(r'&', _A), ''),
+    # _{\text{x}} -> _{x};  (X)_{a} -> X_{a}
+    (re.compile(r'_\{\s*\\(?:text|mathrm)\{([^}]+)\}\s*\}', _A), r'_{\1}'),
+    (re.compile(r'\(\s*([A-Za-z\\][A-Za-z0-9]*)\s*\)_\{([^}]+)\}', _A), r'\1_{\2}'),
+    None,   # comma subscripts _{a,b} -> _{a_b}, repeated until nothing changes (below)
+    # \dot{W} -> Wdot;  R(T_{c}) -> R T_{c};  _x -> _{x};  ^2 -> ^{2}
+    (re.compile(r'\\dot\{([A-Za-z](?:_[A-Za-z0-9]+|\_\{[^}]+\})?)\}', _A), r'\1dot'),
+    (re.compile(r'([A-Za-z])\s*\(\s*([A-Za-z][A-Za-z0-9]*(?:_\{[^}]+\}|_[A-Za-z0-9]+)?)\s*\)', _A),
+     r'\1 \2'),
+    (re.compile(r'_(?!\{)([A-Za-z0-9])', _A), r'_{\1}'),
+    (re.compile(r'\^([A-Za-z0-9])', _A), r'^{\1}'),
+    # chained equalities A = B = C -> A = B \\ B = C, then trim
+    (re.compile(r'^\s*(.+?)\s*=\s*(.+?)\s*=\s*(.+?)\s*$', re.M | _A),
+     lambda m: f'{m[1]} = {m[2]} \\\\\n{m[2]} = {m[3]}'),
+    (re.compile(r'^\s+|\s+$', _A), ''),
+]
+_COMMA_SUB_RE = re.compile(r'_\{([^}]+),\s*([^}]+)\}', _A)
+
+def _clean_block(blk: str) -> str:
+    for step in _CLEANUPS:
+        if step is None:
+            n = 1
+            while n:
+                blk, n = _COMMA_SUB_RE.subn(r'_{\1_\2}', blk)
+        else:
+            blk = step[0].sub(step[1], blk)
+    return blk
+
+def core_blocks(src: str) -> Iterator[Tuple[str, str]]:
+    """(tag, normalized body) of every align block of ``src`` with a :core label."""
+    for m in _ALIGN_RE.finditer(src):
+        blk = m.group(1)
+        label = _CORE_LABEL_RE.search(blk)
+        if label:
+            yield label.group(1), _clean_block(blk)
+
+_PREAMBLE = r'''\documentclass[12pt]{article}
+
+%––––– Packages –––––
+\usepackage[margin=1in]{geometry}
+\usepackage{amsmath,amssymb,amsthm}
+\usepackage{enumitem}
+\usepackage{hyperref}
+\usepackage{xcolor}
+\usepackage{import}
+\usepackage{xifthen}
+\usepackage{pdfpages}
+\usepackage{transparent}
+\usepackage{listings}
+\usepackage{tikz}
+\usepackage{physics}
+\usepackage{siunitx}
+\usepackage{booktabs}
+\usepackage{cancel}
+  \usetikzlibrary{calc,patterns,arrows.meta,decorations.markings}
+
+\newcommand{\incfig}[1]{%%
+    \def\svgwidth{\columnwidth}%%
+    \import{./Figures/}{##1.pdf_tex}%%
+}
+
+\theoremstyle{definition}
+\newtheorem{definition}{Definition}
+\newtheorem{example}{Example}
+\newtheorem{problem}{Problem}
+\newtheorem{solution}{Solution}
+\newtheorem{remark}{Remark}
+\theoremstyle{plain}
+\newtheorem{theorem}{Theorem}
+\newtheorem{lemma}{Lemma}
+\newtheorem{proposition}{Proposition}
+\newtheorem{corollary}{Corollary}
+
+\title{Core Equations — @NAME@}
+\author{Jerich Lee}
+\date{@DATE@}
+
+\begin{document}
+\maketitle
+
+% Auto-extracted equations from align environments with labels ending in :core
+'''
+
+_NO_BLOCKS = r'''\begin{center}
+\textit{No \texttt{\textbackslash begin\{align\}} blocks with labels of the form \texttt{\textbackslash label\{\#:\!core\}} were found.}
+\end{center}
+'''
+
+def equations_tex(name: str, blocks: List[Tuple[str, str]], date_iso: Optional[str] = None) -> str:
+    """The <name>-equations.tex for ``blocks`` (from core_blocks), dated ``date_iso``."""
+    date_iso = date_iso or _now().strftime('%Y-%m-%d')
+    out = [_PREAMBLE.replace('@NAME@', name).replace('@DATE@', date_iso)]
+    for tag, blk in blocks:
+        out.append(f'\\begin{{equation}}\n\\begin{{aligned}}\n{blk}\n\\end{{aligned}}\n'
+                   f'\\tag{{{tag}}}\n\\end{{equation}}\n\n')
+    if not blocks:
+        out.append(_NO_BLOCKS)
+    out.append('\n\\end{document}\n')
+    return ''.join(out)
+
+def extract(in_tex: str, out_tex: str, name: str) -> int:
+    """Write the <name>-equations.tex of ``in_tex`` to ``out_tex``: the number of :core blocks."""
+    with open(in_tex, encoding='utf-8', errors='surrogateescape') as f:
+        blocks = list(core_blocks(f.read()))
+    with open(out_tex, 'w', encoding='utf-8', errors='surrogateescape', newline='') as f:
+        f.write(equations_tex(name, blocks))
+    return len(blocks)
+
+# --------------------------------------------------------------------------------------
+# Codegen
+# --------------------------------------------------------------------------------------
+#
+# Build manifest: a hash of every block's body, its residuals as srepr, and everything
+# derived from each residual (inversions, numeric and gradient code), keyed by srepr.
+# Blocks whose hash is unchanged are rebuilt from the recorded srepr instead of being
+# parsed again, and residuals already in the manifest skip sp.solve, the printers and
+# sp.diff. A manifest written by another version of this file or of core_eqs.py is
+# ignored, i.e. that run is a full build.
+
+def file_digest(*paths):
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f_:
+            h.update(f_.read())
+    return h.hexdigest()
+
+def block_digest(body):
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+# Safe Python identifier for class name & method names
+def safe_name(s: str, prefix="t"):
+    s2 = re.sub(r'[^0-9a-zA-Z_]', '_', s)
+    if not s2 or s2[0].isdigit():
+        s2 = f"{prefix}_{s2}"
+    return s2
+
+# Turn each srepr string into constructor code compiled with the module: SymPy names
+# become sp.<Name> and plain Symbol('x') calls index one shared _SYM table, so loading
+# an expression is a function call instead of eval() over a copy of vars(sympy). The
+# generated class runs the builders under sp.evaluate(False), which rebuilds the
+# recorded tree without paying for SymPy's canonicalization a second time.
+class ToConstructor(ast.NodeTransformer):
+    def __init__(self, names):
+        self.names = names
+
+    def visit_Call(self, node):
+        if (isinstance(node.func, ast.Name) and node.func.id == "Symbol" and not node.keywords
+                and len(node.args) == 1 and isinstance(node.args[0], ast.Constant)):
+            self.names.add(node.args[0].value)
+            return ast.Subscript(value=ast.Name(id="_SYM", ctx=ast.Load()), slice=node.args[0],
+                                 ctx=ast.Load())
+        return self.generic_visit(node)
+
+    def visit_Name(self, node):
+        return ast.Attribute(value=ast.Name(id="sp", ctx=ast.Load()), attr=node.id, ctx=node.ctx)
+
+# Shared by both generated modules: evaluate_tags() runs big inputs slice by slice.
+CHUNKED_SRC = '''
+# Inputs with more points than this are evaluated _CHUNK points at a time, so the
+# temporaries of one slice stay in cache between the operations that reuse them.
+_CHUNK = 16384
+
+def _chunked(fn: Callable, args: list, shape: tuple, n_out: int) -> list:
+    import numpy as np
+    size = int(np.prod(shape))
+    if size <= _CHUNK:
+        return [np.broadcast_to(np.asarray(v, dtype=float), shape).copy() for v in fn(*args)]
+    flat = [a.reshape(()) if a.size == 1 else np.broadcast_to(a, shape).reshape(-1) for a in args]
+    outs = [np.empty(size) for _ in range(n_out)]
+    for s in range(0, size, _CHUNK):
+        for o, v in zip(outs, fn(*[a if a.ndim == 0 else a[s:s + _CHUNK] for a in flat])):
+            o[s:s + _CHUNK] = v
+    return [o.reshape(shape) for o in outs]
+'''
+
+# Emitted into the core module only: what the generated solve() raises.
+NUMERIC_ONLY_SRC = '''
+class NumericOnlyError(ValueError):
+    \"\"\"
+    solve() has no closed form for `var` in line i of `tag`: solve it numerically.
+
+    `reason` is why the codegen, or solve()'s own bounded sp.solve, found none (timeout,
+    solver error, no solution); numeric_only() returns the codegen's. `numeric_only` is
+    always True.
+    \"\"\"
+
+    numeric_only = True
+
+    def __init__(self, tag: str, i: int, var: str, reason: str) -> None:
+        super().__init__(f"No closed form for {var!r} in tag '{tag}' i={i} ({reason}); solve numerically")
+        self.tag = tag
+        self.i = i
+        self.var = var
+        self.reason = reason
+'''
+
+def generate(core_path: str, tex_path: str, out_py: str, in_base: str, out_num: str,
+             manifest_path: str) -> bool:
+    """
+    Parse the :core blocks of ``tex_path`` (a <name>-equations.tex) with the general
+    parser at ``core_path`` and write the class module ``out_py``, its numeric companion
+    ``out_num`` and the manifest ``manifest_path``. False, and nothing written, if the
+    manifest shows that no block changed since the last build.
+    """
+    mod = _core_eqs(core_path)
+    import sympy as sp
+    tool_version = f"{file_digest(core_path, __file__)[:16]};sympy={sp.__version__}"
+    manifest = {}
+    if os.path.exists(manifest_path):
+        try:
+            with open(manifest_path, encoding="utf-8") as f_:
+                manifest = json.load(f_)
+        except ValueError:
+            manifest = {}
+        if manifest.get("version") != tool_version:
+            print("ℹ Manifest is from another version of the codegen; doing a full build")
+            manifest = {}
+    old_blocks = manifest.get("blocks", {})
+    old_lines = manifest.get("lines", {})
+
+    with open(tex_path, encoding="utf-8") as f_:
+        src = f_.read()
+    bodies = {}   # tag -> block body; a repeated tag keeps its last block, like from_tex()
+    for m in mod._EQN_BLOCK_RE.finditer(src):
+        bodies[m.group("tag").strip()] = m.group("body")
+    hashes = {tag: block_digest(body) for tag, body in bodies.items()}
+    changed = [tag for tag in bodies if old_blocks.get(tag, {}).get("hash") != hashes[tag]]
+    removed = [tag for tag in old_blocks if tag not in bodies]
+
+    budget_setting = os.environ.get("CORE_EQS_SOLVE_BUDGET") or "0"
+    if (manifest and not changed and not removed and manifest.get("budget") == budget_setting
+            and os.path.exists(out_py) and os.path.exists(out_num)):
+        print(f"✔ Up to date: no :core block changed since the last build ({len(bodies)} blocks)")
+        return False
+
+    parsed = mod.CoreEqs.from_blocks([(tag, mod.CoreEqs._lines_from_block(bodies[tag])) for tag in changed],
+                                     workers=int(os.environ.get("CORE_EQS_JOBS") or 0))
+    ce = mod.CoreEqs.from_exprs({tag: parsed.eqs[tag] if tag in parsed.eqs else
+                                 [mod._from_srepr(r) for r in old_blocks[tag]["srepr"]] for tag in bodies})
+    if manifest:
+        print(f"✔ Incremental build: {len(changed)} changed or added block(s), "
+              f"{len(removed)} removed, {len(bodies) - len(changed)} reused")
+
+    # Class name based on input base name
+    ClassName = safe_name(in_base.replace('-', '_').replace('.', '_')) + "_Core"
+
+    # Precompute srepr strings of residuals, so generated module is standalone
+    srepr_map = {}      # tag -> [srepr residuals...]
+    sym_names_map = {}  # tag -> [ [sym_name,...], ... ]
+    # Residuals are derived (ce.residual) only where they are needed: reused blocks keep
+    # their recorded srepr, and a line's symbols are the residual's free symbols anyway.
+    for tag in ce.tags():
+        if tag in changed:
+            srepr_map[tag] = [sp.srepr(sp.sympify(r)) for r in ce.residuals[tag]]
+        else:
+            srepr_map[tag] = old_blocks[tag]["srepr"]
+        sym_names_map[tag] = [[s.name for s in syms] for syms in ce.symbols[tag]]
+
+    all_sym_names = {n for names in sym_names_map.values() for ns in names for n in ns}
+
+    # BoundResidual is core_eqs' own class, copied from its source so the generated module
+    # stays standalone and CoreEqs.bind() and the generated bind() share one implementation.
+    BOUND_SRC = inspect.getsource(mod.BoundResidual)
+    # with the argument check every evaluate method of both modules shares
+    ARGS_SRC = inspect.getsource(mod._kernel_args)
+    # and the SolveWorker the generated solve() bounds sp.solve with, the same way
+    SOLVE_SRC = (inspect.getsource(mod._solve_worker_main) + "\n"
+                 + inspect.getsource(mod.SolveWorker) + "\n"
+                 + "_SOLVE_WORKER: Optional[SolveWorker] = None\n\n"
+                 + inspect.getsource(mod.solve_worker))
+
+    def constructor_code(srepr_str):
+        tree = ToConstructor(all_sym_names).visit(ast.parse(srepr_str, mode="eval"))
+        return ast.unparse(ast.fix_missing_locations(tree))
+
+    builder_map = {}    # tag -> [(function name, constructor code), ...]
+    for tag, reps in srepr_map.items():
+        builders = []
+        for i, r in enumerate(reps):
+            builders.append((f"_build_{safe_name(tag)}_{i}", constructor_code(r)))
+        builder_map[tag] = builders
+
+    # Closed-form inversions: try sp.solve(residual, symbol) once per (line, symbol) here, with
+    # a per-attempt time budget, so the generated solve() is a lookup plus substitution. Each
+    # solution list gets its own builder; timeouts, empty results and solver errors are
+    # recorded as the reason that symbol can only be solved numerically. The attempts run in
+    # core_eqs' solver child process, which is killed and restarted when one runs out of
+    # time; interrupting sp.solve in this process would leave SymPy's caches half-filled.
+    solve_budget = float(budget_setting)
+
+    def invert(r, sym):
+        """(solutions, None) or (None, reason)."""
+        status, out = mod.solve_worker().solve(r, sym, solve_budget)
+        if status == "timeout":
+            return None, f"timed out after {solve_budget:g}s"
+        if status == "error":
+            return None, out.splitlines()[0].rstrip(": ")
+        sols = [d[sym] for d in out if sym in d]
+        if not sols:
+            return None, "sympy found no closed form"
+        return sols, None
+
+    inverse_map = {}    # tag -> [{sym_name: (function name, constructor code)}, ...]
+    numeric_only = {}   # tag -> [{sym_name: reason}, ...]
+    lines = {}          # residual srepr -> manifest entry, written back at the end
+    n_reused = 0
+    if solve_budget > 0:
+        t_solve = time.perf_counter()
+        for tag in ce.tags():
+            inv_rows, fail_rows = [], []
+            for i, rep in enumerate(srepr_map[tag]):
+                entry = lines.setdefault(rep, {})
+                old = old_lines.get(rep, {})
+                # attempts made with at least this budget give the same answer
+                if old.get("budget", 0) >= solve_budget:
+                    entry.update(budget=old["budget"], inverse=old["inverse"], numeric_only=old["numeric_only"])
+                    n_reused += 1
+                elif "inverse" not in entry:
+                    r = ce.residual(tag, i)
+                    inv, fail = {}, {}
+                    for sym in sorted(r.free_symbols, key=lambda s_: s_.name):
+                        sols, reason = invert(r, sym)
+                        if sols is None:
+                            fail[sym.name] = reason
+                        else:
+                            inv[sym.name] = ", ".join(constructor_code(sp.srepr(s_)) for s_ in sols)
+                    entry.update(budget=solve_budget, inverse=inv, numeric_only=fail)
+                inv_rows.append({name: (f"_inv_{safe_name(tag)}_{i}_{k}", entry["inverse"][name])
+                                 for k, name in enumerate(sym_names_map[tag][i]) if name in entry["inverse"]})
+                fail_rows.append(dict(entry["numeric_only"]))
+            inverse_map[tag] = inv_rows
+            numeric_only[tag] = fail_rows
+        n_inv = sum(len(d) for rows in inverse_map.values() for d in rows)
+        n_fail = sum(len(d) for rows in numeric_only.values() for d in rows)
+        print(f"✔ Inverted {n_inv}/{n_inv + n_fail} (line, symbol) pairs in "
+              f"{time.perf_counter() - t_solve:.1f}s ({n_fail} numeric-only, "
+              f"{n_reused} line(s) from the manifest)")
+
+    with open(out_py, "w", encoding="utf-8") as f:
+        # Header + shared symbols + expression builders
+        f.write(f"""#!/usr/bin/env python3
+# Auto-generated on {_now().isoformat(timespec='seconds')}
+# Source: {os.path.basename(tex_path)}
+# NOTE: This file is standalone; expressions are rebuilt by the _build_* constructor
+# functions below (the srepr strings in _SREPR are kept as the canonical record).
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import os
+import time
+import sympy as sp
+
+__all__ = ["{ClassName}", "NumericOnlyError"]
+
+# Every plain Symbol used by the equations, created once at import.
+_SYM: Dict[str, sp.Symbol] = {{n: sp.Symbol(n) for n in (
+""")
+        for name in sorted(all_sym_names):
+            f.write(f"    {repr(name)},\n")
+        f.write(")}\n\n")
+        for tag, builders in builder_map.items():
+            for fname, code in builders:
+                f.write(f"def {fname}() -> sp.Expr:\n    return {code}\n\n")
+        for tag, rows in inverse_map.items():
+            for inv in rows:
+                for fname, code in inv.values():
+                    f.write(f"def {fname}() -> List[sp.Expr]:\n    return [{code}]\n\n")
+        f.write(ARGS_SRC.lstrip() + "\n")
+        f.write(CHUNKED_SRC.lstrip() + "\n")
+        f.write(NUMERIC_ONLY_SRC.lstrip() + "\n")
+        f.write(BOUND_SRC.lstrip() + "\n")
+        f.write(SOLVE_SRC.lstrip() + "\n")
+
+        # Class start
+        f.write(f"""class {ClassName}:
+    \"\"\"Callable symbolic core equations.
+
+    Access:
+      - tags() -> List[str]
+      - residual(tag: str, i: int, **subs) -> sp.Expr
+      - bind(tag: str, i: int, **fixed) -> BoundResidual  (substitute constants once, then
+        call it with the remaining values; LRU-cached per fixed values)
+      - symbols(tag: str, i: int) -> List[sp.Symbol]
+      - eq_all(tag: str) -> List[sp.Expr]
+      - equations_with(name: str | sp.Symbol) -> List[(tag, i)]  (every line using a symbol)
+      - warm(tags: List[str] | None = None) -> None  (build expressions up front)
+      - evaluate(tag: str, i: int, **arrays) -> np.ndarray  (compiled, broadcasting)
+      - evaluate_all(**arrays) / evaluate_tags(tags, **arrays) -> Dict[tag, List[np.ndarray]]
+        (every residual of the tags in one kernel, shared subexpressions computed once)
+      - jacobian(eqs, wrt=None) -> sp.Matrix  (eqs: a tag, a (tag, i) or a list of them)
+      - evaluate_jacobian(eqs, wrt=None, **arrays) -> np.ndarray  (rows, len(wrt), *shape)
+      - solve(tag: str, i: int, var: str | sp.Symbol, timeout=None, **params) -> List[sp.Expr]
+        (precomputed closed forms; raises NumericOnlyError for numeric-only symbols)
+      - numeric_only(tag: str, i: int, var: str | sp.Symbol) -> str | None  (why not)
+      - call_stats(top: int | None = None) -> per-line call counts/time, hottest first
+        (recorded only with {ClassName}(stats=True) or CORE_EQS_STATS=1)
+      - Convenience per-line methods: eq_<tag>_<i>(**subs)
+    \"\"\"
+
+    _SREPR: Dict[str, List[str]] = {{
+""")
+        # _SREPR content
+        for tag, reps in srepr_map.items():
+            f.write(f"        {repr(tag)}: [\n")
+            for r in reps:
+                f.write("            " + repr(r) + ",\n")
+            f.write("        ],\n")
+        f.write("    }\n\n")
+
+        # _SYMNAMES content
+        f.write("    _SYMNAMES: Dict[str, List[List[str]]] = {\n")
+        for tag, symnames in sym_names_map.items():
+            f.write(f"        {repr(tag)}: {repr(symnames)},\n")
+        f.write("    }\n\n")
+
+        # _INDEX content: symbol name -> every (tag, i) whose residual involves it
+        f.write("    _INDEX: Dict[str, List[tuple]] = {\n")
+        index = {}
+        for tag, symnames in sym_names_map.items():
+            for i, names in enumerate(symnames):
+                for n in names:
+                    index.setdefault(n, []).append((tag, i))
+        for n in sorted(index):
+            f.write(f"        {n!r}: {index[n]!r},\n")
+        f.write("    }\n\n")
+
+        # _BUILD content
+        f.write("    _BUILD: Dict[str, List[Callable[[], sp.Expr]]] = {\n")
+        for tag, builders in builder_map.items():
+            f.write(f"        {repr(tag)}: [{', '.join(fname for fname, _ in builders)}],\n")
+        f.write("    }\n\n")
+
+        # _INVERSE / _NUMERIC_ONLY content
+        f.write("    _INVERSE: Dict[str, List[Dict[str, Callable[[], List[sp.Expr]]]]] = {\n")
+        for tag, rows in inverse_map.items():
+            cells = ", ".join("{" + ", ".join(f"{n!r}: {fn}" for n, (fn, _) in inv.items()) + "}"
+                              for inv in rows)
+            f.write(f"        {repr(tag)}: [{cells}],\n")
+        f.write("    }\n\n")
+        f.write("    _NUMERIC_ONLY: Dict[str, List[Dict[str, str]]] = {\n")
+        for tag, rows in numeric_only.items():
+            f.write(f"        {repr(tag)}: {repr(rows)},\n")
+        f.write("    }\n\n")
+
+        # Methods (properly indented INSIDE the class)
+        methods = f'''
+def __init__(self, stats: bool = False) -> None:
+    self._cache: Dict[tuple, sp.Expr] = {{}}
+    self._kernels: Dict[tuple, tuple] = {{}}
+    self._bound: OrderedDict[tuple, BoundResidual] = OrderedDict()
+    # (tag, i, var) -> (seconds, reason) for solves that timed out or failed in solve()
+    self._unsolved: Dict[tuple, tuple] = {{}}
+    # (method, tag, i) -> [calls, seconds]; None keeps residual()/evaluate() untimed
+    self._stats: Optional[Dict[tuple, list]] = {{}} if stats or os.environ.get("CORE_EQS_STATS") else None
+
+def tags(self) -> List[str]:
+    return sorted(self._SREPR.keys())
+
+def _expr(self, tag: str, i: int) -> sp.Expr:
+    key = (tag, i)
+    if key in self._cache:
+        return self._cache[key]
+    try:
+        build = self._BUILD[tag][i]
+    except (KeyError, IndexError) as e:
+        raise KeyError(f"Unknown equation index for tag '{{tag}}' i={{i}}") from e
+    with sp.evaluate(False):
+        expr = build()
+    self._cache[key] = expr
+    return expr
+
+def warm(self, tags: Optional[List[str]] = None) -> None:
+    """Build every expression (of `tags`, default all) now instead of on first use."""
+    for tag in (self.tags() if tags is None else tags):
+        for i in range(len(self._BUILD.get(tag, []))):
+            self._expr(tag, i)
+
+def symbols(self, tag: str, i: int) -> List[sp.Symbol]:
+    names = self._SYMNAMES.get(tag, [])
+    if i < 0 or i >= len(names):
+        raise KeyError(f"Unknown equation index for tag '{{tag}}' i={{i}}")
+    return [_SYM[n] for n in names[i]]
+
+def residual(self, tag: str, i: int, **subs) -> sp.Expr:
+    t0 = time.perf_counter() if self._stats is not None else 0.0
+    expr = self._expr(tag, i)
+    out = expr.subs(subs) if subs else expr
+    if self._stats is not None:
+        self._record("residual", tag, i, t0)
+    return out
+
+# bind() keeps this many BoundResidual objects, least recently used dropped first
+BIND_CACHE_SIZE = 256
+
+def bind(self, tag: str, i: int, **fixed) -> BoundResidual:
+    """Residual i of `tag` with `fixed` (values by symbol name) substituted once.
+
+    Call the result with the remaining values only. Names that are not symbols of the
+    line are ignored, so one dict of constants can be bound to every line; the result
+    is cached per (tag, i, the fixed values it uses).
+    """
+    t0 = time.perf_counter() if self._stats is not None else 0.0
+    names = [s.name for s in self.symbols(tag, i)]
+    fixed = {{n: v for n, v in fixed.items() if n in names}}
+    try:
+        key = (tag, i, frozenset(fixed.items()))
+        hash(key)
+    except TypeError:
+        key = None
+    bound = self._bound.get(key) if key is not None else None
+    if bound is not None:
+        self._bound.move_to_end(key)
+    else:
+        bound = BoundResidual(tag, i, self._expr(tag, i), {{n: _SYM[n] for n in names}}, fixed)
+        if key is not None:
+            self._bound[key] = bound
+            if len(self._bound) > self.BIND_CACHE_SIZE:
+                self._bound.popitem(last=False)
+    if self._stats is not None:
+        self._record("bind", tag, i, t0)
+    return bound
+
+def _record(self, method: str, tag: str, i: int, t0: float) -> None:
+    rec = self._stats.setdefault((method, tag, i), [0, 0.0])
+    rec[0] += 1
+    rec[1] += time.perf_counter() - t0
+
+def call_stats(self, top: Optional[int] = None) -> List[tuple]:
+    """(method, tag, i, calls, seconds) rows, most total time first."""
+    rows = [(m, tag, i, n, t) for (m, tag, i), (n, t) in (self._stats or {{}}).items()]
+    rows.sort(key=lambda r: -r[4])
+    return rows[:top] if top is not None else rows
+
+def _inverse_row(self, table, tag: str, i: int, var) -> tuple:
+    name = var if isinstance(var, str) else var.name
+    if name not in [s.name for s in self.symbols(tag, i)]:
+        raise KeyError(f"{{name!r}} is not a symbol of tag '{{tag}}' i={{i}}")
+    rows = table.get(tag)
+    return name, (rows[i] if rows else {{}})
+
+def numeric_only(self, tag: str, i: int, var) -> Optional[str]:
+    """Why `var` has no precomputed closed form in line i of `tag`, or None if it has one."""
+    name, row = self._inverse_row(self._NUMERIC_ONLY, tag, i, var)
+    return row.get(name)
+
+# solve() gives sp.solve this many seconds for a symbol the codegen did not invert
+SOLVE_TIMEOUT = 30.0
+
+def solve(self, tag: str, i: int, var, timeout: Optional[float] = None, **params) -> List[sp.Expr]:
+    """Solutions of residual i of `tag` for `var`, with `params` (by symbol name) substituted.
+
+    Closed forms were found at codegen time; symbols whose inversion timed out or failed
+    raise NumericOnlyError, a ValueError carrying the reason (see numeric_only()).
+    Symbols never attempted (codegen run without CORE_EQS_SOLVE_BUDGET) are solved on
+    first use by sp.solve in a SolveWorker process, for at most `timeout` seconds
+    (default SOLVE_TIMEOUT), and cached; if it times out or fails, NumericOnlyError is
+    raised as well, and again by later calls with no larger timeout.
+    """
+    reason = self.numeric_only(tag, i, var)
+    name, row = self._inverse_row(self._INVERSE, tag, i, var)
+    if reason is not None:
+        raise NumericOnlyError(tag, i, name, reason)
+    key = ("solve", tag, i, name)
+    if key not in self._cache:
+        if name in row:
+            with sp.evaluate(False):
+                self._cache[key] = row[name]()
+        else:
+            limit = self.SOLVE_TIMEOUT if timeout is None else timeout
+            spent, reason = self._unsolved.get((tag, i, name), (0.0, None))
+            if reason is not None and spent >= limit:
+                raise NumericOnlyError(tag, i, name, reason)
+            # the same attempt, and reasons, as the codegen's
+            sym = _SYM[name]
+            status, out = solve_worker().solve(self._expr(tag, i), sym, limit)
+            sols = [d[sym] for d in out if sym in d] if status == "ok" else []
+            if not sols:
+                if status == "timeout":
+                    reason = f"timed out after {{limit:g}}s"
+                else:
+                    reason = out.splitlines()[0].rstrip(": ") if status == "error" else "sympy found no closed form"
+                    limit = float("inf")
+                self._unsolved[(tag, i, name)] = (limit, reason)
+                raise NumericOnlyError(tag, i, name, reason)
+            self._cache[key] = sols
+    sols = self._cache[key]
+    if not params:
+        return list(sols)
+    subs = {{_SYM.get(k, k): v for k, v in params.items()}}
+    return [s.subs(subs) for s in sols]
+
+def equations_with(self, name) -> List[tuple]:
+    return list(self._INDEX.get(name if isinstance(name, str) else name.name, []))
+
+def eq_all(self, tag: str) -> List[sp.Expr]:
+    return [ self._expr(tag, i) for i in range(len(self._SREPR.get(tag, []))) ]
+
+def _refs(self, eqs) -> List[tuple]:
+    # a tag (all its lines), one (tag, i) or a list of (tag, i)
+    if isinstance(eqs, str):
+        if eqs not in self._BUILD:
+            raise KeyError(f"Unknown tag '{{eqs}}'")
+        return [(eqs, i) for i in range(len(self._BUILD[eqs]))]
+    if isinstance(eqs, tuple) and len(eqs) == 2 and isinstance(eqs[0], str):
+        return [eqs]
+    return [tuple(ref) for ref in eqs]
+
+def _wrt_names(self, refs: List[tuple], wrt) -> List[str]:
+    if wrt is None:
+        return sorted({{n for tag, i in refs for n in self._SYMNAMES[tag][i]}})
+    return [v if isinstance(v, str) else v.name for v in ([wrt] if isinstance(wrt, (str, sp.Symbol)) else wrt)]
+
+def jacobian(self, eqs, wrt=None) -> sp.Matrix:
+    """d(residual)/d(wrt), one row per residual of `eqs` (a tag, a (tag, i) or a list of them).
+
+    `wrt` lists symbols or names (default: every symbol of those residuals); derived once
+    per (eqs, wrt) and cached.
+    """
+    refs = self._refs(eqs)
+    names = self._wrt_names(refs, wrt)
+    key = ("jacobian", tuple(refs), tuple(names))
+    if key not in self._cache:
+        exprs = [self._expr(tag, i) for tag, i in refs]
+        self._cache[key] = sp.Matrix([[sp.diff(e, _SYM.get(n, sp.Symbol(n))) for n in names] for e in exprs])
+    return self._cache[key]
+
+def evaluate_jacobian(self, eqs, wrt=None, **arrays):
+    """jacobian(eqs, wrt) over NumPy arrays: shape (rows, len(wrt)) + broadcast shape."""
+    import numpy as np
+    refs = self._refs(eqs)
+    names = self._wrt_names(refs, wrt)
+    key = ("jacobian", tuple(refs), tuple(names))
+    if key not in self._kernels:
+        jac = self.jacobian(refs, names)
+        args = sorted({{n for tag, i in refs for n in self._SYMNAMES[tag][i]}})
+        fn = sp.lambdify([_SYM[n] for n in args], list(jac), modules="numpy")
+        self._kernels[key] = (fn, args, jac.shape)
+    fn, args_names, (m, k) = self._kernels[key]
+    args, shape = _kernel_args(args_names, arrays, str(refs))
+    out = np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*args)])
+    return out.reshape((m, k) + shape)
+
+def evaluate_tags(self, tags: List[str], **arrays) -> Dict[str, list]:
+    """Every residual of `tags` over NumPy arrays, as {{tag: [line 0, line 1, ...]}}.
+
+    The lines are lambdified together with cse=True, so subexpressions they share are
+    computed once; the kernel is cached per tag list.
+    """
+    key = ("tags",) + tuple(tags)
+    if key not in self._kernels:
+        unknown = [tag for tag in tags if tag not in self._BUILD]
+        if unknown:
+            raise KeyError(f"Unknown tags {{unknown}}")
+        refs = [(tag, i) for tag in tags for i in range(len(self._BUILD[tag]))]
+        names = sorted({{n for tag, i in refs for n in self._SYMNAMES[tag][i]}})
+        fn = sp.lambdify([_SYM[n] for n in names], [self._expr(tag, i) for tag, i in refs],
+                         modules="numpy", cse=True)
+        self._kernels[key] = (fn, names, refs)
+    fn, names, refs = self._kernels[key]
+    args, shape = _kernel_args(names, arrays, f"tags {{list(tags)}}")
+    out: Dict[str, list] = {{tag: [] for tag in tags}}
+    for (tag, i), v in zip(refs, _chunked(fn, args, shape, len(refs))):
+        out[tag].append(v)
+    return out
+
+def evaluate_all(self, **arrays) -> Dict[str, list]:
+    """evaluate_tags() over every tag."""
+    return self.evaluate_tags(self.tags(), **arrays)
+
+def _kernel(self, tag: str, i: int):
+    key = (tag, i)
+    if key not in self._kernels:
+        expr = self._expr(tag, i)
+        names = self._SYMNAMES[tag][i]
+        fn = sp.lambdify([_SYM[n] for n in names], expr, modules="numpy")
+        self._kernels[key] = (fn, names)
+    return self._kernels[key]
+
+def evaluate(self, tag: str, i: int, **arrays):
+    """Residual evaluated over NumPy arrays; lambdified once and cached per line."""
+    import numpy as np
+    t0 = time.perf_counter() if self._stats is not None else 0.0
+    fn, names = self._kernel(tag, i)
+    args, shape = _kernel_args(names, arrays, f"tag '{{tag}}' i={{i}}")
+    out = np.asarray(fn(*args), dtype=float)
+    if out.shape != shape:
+        out = np.broadcast_to(out, shape).copy()
+    if self._stats is not None:
+        self._record("evaluate", tag, i, t0)
+    return out
+'''
+        f.write(textwrap.indent(textwrap.dedent(methods), "    "))
+
+        # Per-line convenience methods, also indented inside class
+        for tag, reps in srepr_map.items():
+            tag_id = safe_name(tag)
+            for i in range(len(reps)):
+                m = f"""
+def eq_{tag_id}_{i}(self, **subs) -> sp.Expr:
+    \"\"\"Residual for tag {tag}, line {i}.\"\"\"
+    return self.residual({repr(tag)}, {i}, **subs)
+"""
+                f.write(textwrap.indent(textwrap.dedent(m), "    "))
+
+        # Footer
+        f.write(textwrap.dedent(f"""
+if __name__ == "__main__":
+    core = {ClassName}()
+    print("Tags:", core.tags())
+    for t in core.tags():
+        print(f"\\nTag {{t}} has", len(core._SREPR[t]), "equation(s).")
+        if core._SREPR[t]:
+            print(" First residual:", core.residual(t, 0))
+"""))
+
+    print(f"✔ Wrote generated class: {out_py}")
+
+    # --- SymPy-free numeric companion: one plain function per residual, printed with SymPy's
+    # math (scalar) and NumPy (array) code printers. Symbol names become Python identifiers.
+    from sympy.printing.pycode import PythonCodePrinter
+    from sympy.printing.numpy import NumPyPrinter
+
+    NumClassName = ClassName[:-len("_Core")] + "_Numeric"
+
+    class MathPrinter(PythonCodePrinter):
+        # Non-integer powers go through math.pow, so out-of-domain inputs raise ValueError
+        # (like math.sqrt) instead of silently turning complex.
+        def _print_Pow(self, expr, rational=False):
+            if expr.exp.is_Integer or expr.exp in (sp.S.Half, -sp.S.Half):
+                return super()._print_Pow(expr, rational)
+            return f"math.pow({self._print(expr.base)}, {self._print(expr.exp)})"
+
+    math_printer = MathPrinter({"fully_qualified_modules": True})
+    numpy_printer = NumPyPrinter()
+
+    idents = {}   # symbol name -> argument name
+    # names keep the argument name they had in the last build, so cached code stays valid
+    for name, arg in manifest.get("idents", {}).items():
+        if name in all_sym_names and arg not in idents.values():
+            idents[name] = arg
+
+    def ident(name):
+        if name not in idents:
+            base = re.sub(r"[\W_]+", "_", name).strip("_") or "x"
+            if base[0].isdigit() or keyword.iskeyword(base) or base in ("math", "numpy", "abs"):
+                base = "s_" + base
+            cand, k = base, 1
+            while cand in idents.values():
+                cand, k = f"{base}_{k}", k + 1
+            idents[name] = cand
+        return idents[name]
+
+    # Residual over argument names, printed as math and NumPy code, and its gradient
+    # (partial derivatives in _SYMNAMES order) as NumPy code; the manifest entry of the
+    # residual is reused when its argument names are unchanged.
+    def numeric_entry(tag, i, rep, names):
+        args = [ident(n) for n in names]
+        entry = lines.setdefault(rep, {})
+        if entry.get("args") == args:
+            return entry
+        old = old_lines.get(rep, {})
+        if old.get("args") == args and (old["numpy"] is None or old.get("cse") is not None):
+            for key in ("args", "math", "numpy", "reason", "grad", "grad_reason", "cse"):
+                entry[key] = old.get(key)
+            return entry
+        r = ce.residual(tag, i)
+        rx = r.xreplace({s_: sp.Symbol(ident(s_.name)) for s_ in r.free_symbols})
+        try:
+            mcode, ncode, reason = math_printer.doprint(rx), numpy_printer.doprint(rx), ""
+        except Exception as e:
+            mcode = ncode = None
+            reason = f"{type(e).__name__}: {str(e).splitlines()[0]}"
+        gcode, greason = None, reason
+        if ncode is not None:
+            try:
+                parts = [numpy_printer.doprint(sp.diff(rx, sp.Symbol(a))) for a in args]
+                gcode = "(" + "".join(p_ + ", " for p_ in parts) + ")"
+            except Exception as e:
+                greason = f"{type(e).__name__}: {str(e).splitlines()[0]}"
+        entry.update(args=args, math=mcode, numpy=ncode, reason=reason, grad=gcode,
+                     grad_reason=greason, cse=None)
+        if ncode is not None:
+            num_exprs[rep] = rx
+        return entry
+
+    num_funcs = {}   # tag -> [(fname, args, math code | None, numpy code | None, reason)]
+    num_exprs = {}   # residual srepr -> residual over argument names, for lines printed this run
+    grad_funcs = {}  # tag -> [(fname, args, "(d0, d1, ...)" | None, reason)]
+    cse_refs = []    # (tag, i) of the lines NumPy can print
+    for tag in ce.tags():
+        rows, grows = [], []
+        for i, rep in enumerate(srepr_map[tag]):
+            e_ = numeric_entry(tag, i, rep, sym_names_map[tag][i])
+            rows.append((f"_r_{safe_name(tag)}_{i}", e_["args"], e_["math"], e_["numpy"], e_["reason"]))
+            grows.append((f"_g_{safe_name(tag)}_{i}", e_["args"], e_["grad"], e_["grad_reason"]))
+            if e_["numpy"] is not None:
+                cse_refs.append((tag, i))
+        num_funcs[tag] = rows
+        grad_funcs[tag] = grows
+
+    # Common subexpressions across every residual of the document. Steps and outputs are
+    # kept as NumPy source with the names each one reads, so evaluate_tags() can compile
+    # just the steps its lines need into one function.
+    def free_names(e):
+        return tuple(sorted(s_.name for s_ in e.free_symbols))
+
+    # An incremental build keeps the recorded steps and outputs of unchanged residuals and
+    # runs sp.cse over the changed ones only, so sharing between an edited line and the rest
+    # of the document is found again by the next full build.
+    def line_entry(ref):
+        return lines[srepr_map[ref[0]][ref[1]]]
+
+    fresh = [ref for ref in cse_refs if line_entry(ref)["cse"] is None]
+    cse_steps = [(name, code, tuple(reads)) for name, code, reads in manifest.get("cse_steps", [])]
+    if len(fresh) == len(cse_refs):
+        cse_steps = []
+    if fresh:
+        start = 1 + max((int(name[2:]) for name, _, _ in cse_steps), default=-1)
+        steps, reduced = sp.cse([num_exprs[srepr_map[tag][i]] for tag, i in fresh],
+                                symbols=sp.numbered_symbols("_c", start=start))
+        cse_steps += [(str(c), numpy_printer.doprint(e), free_names(e)) for c, e in steps]
+        for ref, e in zip(fresh, reduced):
+            line_entry(ref)["cse"] = (numpy_printer.doprint(e), free_names(e))
+    cse_out = {ref: (line_entry(ref)["cse"][0], tuple(line_entry(ref)["cse"][1])) for ref in cse_refs}
+    needed = {n for _, reads in cse_out.values() for n in reads}
+    for name, _, reads in reversed(cse_steps):
+        if name in needed:
+            needed.update(reads)
+    cse_steps = [step for step in cse_steps if step[0] in needed]
+
+    # Lines a printer could not handle get no function: their table slot is None and the
+    # dispatcher raises ValueError with the recorded reason (_NO_CODE / _NO_GRADIENT).
+    def num_def(fname, args, code, indent=""):
+        if code is None:
+            return ""
+        return f"{indent}def {fname}({', '.join(args)}):\n{indent}    return {code}\n\n"
+
+    def num_table(rows, code_at):
+        return f"[{', '.join(r[0] if r[code_at] is not None else 'None' for r in rows)}]"
+
+    with open(out_num, "w", encoding="utf-8") as f:
+        f.write(f"""#!/usr/bin/env python3
+# Auto-generated on {_now().isoformat(timespec='seconds')}
+# Source: {os.path.basename(tex_path)}
+# NOTE: SymPy-free numeric companion of {os.path.basename(out_py)}: each residual is a
+# plain `math` function (NumPy versions are built on first use of evaluate()).
+from __future__ import annotations
+from typing import Callable, Dict, List, Optional, Tuple
+import math
+
+__all__ = ["{NumClassName}"]
+
+""")
+        for tag, rows in num_funcs.items():
+            for fname, args, mcode, _, reason in rows:
+                f.write(num_def(fname, args, mcode))
+
+        f.write("def _numpy_kernels() -> Dict[str, List[Callable]]:\n    import numpy\n\n")
+        for tag, rows in num_funcs.items():
+            for fname, args, _, ncode, reason in rows:
+                f.write(num_def(fname, args, ncode, indent="    "))
+        f.write("    return {\n")
+        for tag, rows in num_funcs.items():
+            f.write(f"        {tag!r}: {num_table(rows, 3)},\n")
+        f.write("    }\n\n")
+
+        f.write("def _numpy_gradients() -> Dict[str, List[Callable]]:\n    import numpy\n\n")
+        for tag, grows in grad_funcs.items():
+            for fname, args, code, reason in grows:
+                f.write(num_def(fname, args, code, indent="    "))
+        f.write("    return {\n")
+        for tag, grows in grad_funcs.items():
+            f.write(f"        {tag!r}: {num_table(grows, 2)},\n")
+        f.write("    }\n\n")
+
+        f.write(ARGS_SRC.lstrip() + "\n")
+        f.write(CHUNKED_SRC.lstrip() + "\n")
+        f.write(f"# sp.cse over all {len(cse_refs)} residuals: {len(cse_steps)} shared subexpressions.\n")
+        f.write("_CSE_STEPS: List[Tuple[str, str, Tuple[str, ...]]] = [\n")
+        for step in cse_steps:
+            f.write(f"    {step!r},\n")
+        f.write("]\n\n")
+        f.write("_CSE_OUT: Dict[Tuple[str, int], Tuple[str, Tuple[str, ...]]] = {\n")
+        for ref, out in cse_out.items():
+            f.write(f"    {ref!r}: {out!r},\n")
+        f.write("}\n\n")
+        f.write("# (tag, i) -> why the printers produced no code for that residual / its gradient\n")
+        for table, funcs in (("_NO_CODE", num_funcs), ("_NO_GRADIENT", grad_funcs)):
+            f.write(f"{table}: Dict[Tuple[str, int], str] = {{\n")
+            for tag, rows in funcs.items():
+                for i, row in enumerate(rows):
+                    if row[2] is None:   # no math code (num_funcs) / no gradient code
+                        f.write(f"    {(tag, i)!r}: {row[-1]!r},\n")
+            f.write("}\n\n")
+        f.write("# symbol name -> argument name in the functions above\n")
+        f.write("_IDENTS: Dict[str, str] = {\n")
+        for name in sorted(idents):
+            f.write(f"    {name!r}: {idents[name]!r},\n")
+        f.write("}\n\n")
+
+        f.write(f"""class {NumClassName}:
+    \"\"\"Numeric core equations without SymPy.
+
+    Access:
+      - tags() -> List[str]
+      - symbols(tag: str, i: int) -> List[str]  (argument order of the residual)
+      - residual(tag: str, i: int, **values) -> float
+      - evaluate(tag: str, i: int, **arrays) -> np.ndarray  (NumPy, broadcasting)
+      - evaluate_all(**arrays) / evaluate_tags(tags, **arrays) -> Dict[tag, List[np.ndarray]]
+        (every residual of the tags at once, shared subexpressions computed once)
+      - evaluate_gradient(tag: str, i: int, **arrays) -> np.ndarray  (k, *shape), symbols() order
+      - evaluate_jacobian(eqs, wrt=None, **arrays) -> np.ndarray  (rows, len(wrt), *shape)
+      - Convenience per-line methods: eq_<tag>_<i>(**values)
+    Keyword names are the symbol names of {ClassName} (use **{{'p_{{cns}}': ...}}).
+    Out-of-domain inputs raise ValueError in residual() and give nan in evaluate().
+    Lines the code printers could not handle raise ValueError with the reason.
+    \"\"\"
+
+""")
+        f.write("    _SYMNAMES: Dict[str, List[List[str]]] = {\n")
+        for tag, symnames in sym_names_map.items():
+            f.write(f"        {repr(tag)}: {repr(symnames)},\n")
+        f.write("    }\n\n")
+        f.write("    _FUNCS: Dict[str, List[Optional[Callable]]] = {\n")
+        for tag, rows in num_funcs.items():
+            f.write(f"        {tag!r}: {num_table(rows, 2)},\n")
+        f.write("    }\n")
+
+        methods = f'''
+def __init__(self) -> None:
+    self._kernels: Optional[Dict[str, List[Callable]]] = None
+    self._gradients: Optional[Dict[str, List[Callable]]] = None
+    self._cse: Dict[tuple, tuple] = {{}}
+
+def tags(self) -> List[str]:
+    return sorted(self._FUNCS.keys())
+
+def _names(self, tag: str, i: int) -> List[str]:
+    try:
+        return self._SYMNAMES[tag][i]
+    except (KeyError, IndexError) as e:
+        raise KeyError(f"Unknown equation index for tag '{{tag}}' i={{i}}") from e
+
+def _lookup(self, table, tag: str, i: int, unsupported=_NO_CODE):
+    names = self._names(tag, i)
+    fn = table[tag][i]
+    if fn is None:
+        raise ValueError(f"No numeric code for tag '{{tag}}' i={{i}}: {{unsupported[(tag, i)]}}")
+    return fn, names
+
+def symbols(self, tag: str, i: int) -> List[str]:
+    return list(self._names(tag, i))
+
+def residual(self, tag: str, i: int, **values) -> float:
+    fn, names = self._lookup(self._FUNCS, tag, i)
+    missing = [n for n in names if n not in values]
+    if missing:
+        raise KeyError(f"Missing values for {{missing}} in tag '{{tag}}' i={{i}}")
+    return fn(*[values[n] for n in names])
+
+def evaluate(self, tag: str, i: int, **arrays):
+    """Residual evaluated over NumPy arrays (imports NumPy on first use)."""
+    import numpy as np
+    if self._kernels is None:
+        self._kernels = _numpy_kernels()
+    fn, names = self._lookup(self._kernels, tag, i)
+    args, shape = _kernel_args(names, arrays, f"tag '{{tag}}' i={{i}}")
+    out = np.asarray(fn(*args), dtype=float)
+    if out.shape != shape:
+        out = np.broadcast_to(out, shape).copy()
+    return out
+
+def evaluate_gradient(self, tag: str, i: int, **arrays):
+    """Partial derivatives of residual i of `tag`, in symbols() order: shape (k,) + broadcast shape."""
+    import numpy as np
+    if self._gradients is None:
+        self._gradients = _numpy_gradients()
+    fn, names = self._lookup(self._gradients, tag, i, _NO_GRADIENT)
+    args, shape = _kernel_args(names, arrays, f"tag '{{tag}}' i={{i}}")
+    return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*args)])
+
+def evaluate_jacobian(self, eqs, wrt=None, **arrays):
+    """d(residual)/d(wrt) over NumPy arrays: shape (rows, len(wrt)) + broadcast shape.
+
+    `eqs` is a tag (all its lines), one (tag, i) or a list of them; `wrt` lists symbol
+    names (default: every symbol of those residuals).
+    """
+    import numpy as np
+    if isinstance(eqs, str):
+        if eqs not in self._FUNCS:
+            raise KeyError(f"Unknown tag '{{eqs}}'")
+        refs = [(eqs, i) for i in range(len(self._FUNCS[eqs]))]
+    elif isinstance(eqs, tuple) and len(eqs) == 2 and isinstance(eqs[0], str):
+        refs = [eqs]
+    else:
+        refs = [tuple(ref) for ref in eqs]
+    if wrt is None:
+        wrt = sorted({{n for tag, i in refs for n in self.symbols(tag, i)}})
+    elif isinstance(wrt, str):
+        wrt = [wrt]
+    rows = []
+    for tag, i in refs:
+        grad = self.evaluate_gradient(tag, i, **arrays)
+        names = self.symbols(tag, i)
+        rows.append([grad[names.index(n)] if n in names else None for n in wrt])
+    shape = np.broadcast_shapes(*(g.shape for row in rows for g in row if g is not None))
+    out = np.zeros((len(refs), len(wrt)) + shape)
+    for r, row in enumerate(rows):
+        for c, g in enumerate(row):
+            if g is not None:
+                out[r, c] = g
+    return out
+
+def _cse_kernel(self, tags: tuple):
+    # One function for every residual of `tags`, running only the _CSE_STEPS they read.
+    if tags not in self._cse:
+        import numpy
+        unknown = [tag for tag in tags if tag not in self._FUNCS]
+        if unknown:
+            raise KeyError(f"Unknown tags {{unknown}}")
+        refs = [(tag, i) for tag in tags for i in range(len(self._FUNCS[tag]))]
+        unsupported = [ref for ref in refs if ref not in _CSE_OUT]
+        if unsupported:
+            raise ValueError("No numeric code for " + "; ".join(
+                f"tag '{{t}}' i={{i}}: {{_NO_CODE.get((t, i), 'not printable')}}" for t, i in unsupported))
+        need = set()
+        for ref in refs:
+            need.update(_CSE_OUT[ref][1])
+        steps = []
+        for name, code, reads in reversed(_CSE_STEPS):
+            if name in need:
+                steps.append((name, code))
+                need.update(reads)
+        idents = {{v: k for k, v in _IDENTS.items()}}
+        args = sorted(n for n in need if n in idents)
+        src = [f"def _f({{', '.join(args)}}):"]
+        src += [f"    {{name}} = {{code}}" for name, code in reversed(steps)]
+        src.append(f"    return ({{''.join(_CSE_OUT[ref][0] + ', ' for ref in refs)}})")
+        ns = {{"numpy": numpy}}
+        exec(compile("\\n".join(src), f"<cse {{', '.join(tags)}}>", "exec"), ns)
+        self._cse[tags] = (ns["_f"], [idents[a] for a in args], refs)
+    return self._cse[tags]
+
+def evaluate_tags(self, tags: List[str], **arrays) -> Dict[str, list]:
+    """Every residual of `tags` over NumPy arrays, as {{tag: [line 0, line 1, ...]}}.
+
+    Subexpressions shared between the lines (see _CSE_STEPS) are computed once.
+    """
+    fn, names, refs = self._cse_kernel(tuple(tags))
+    args, shape = _kernel_args(names, arrays, f"tags {{list(tags)}}")
+    out: Dict[str, list] = {{tag: [] for tag in tags}}
+    for (tag, i), v in zip(refs, _chunked(fn, args, shape, len(refs))):
+        out[tag].append(v)
+    return out
+
+def evaluate_all(self, **arrays) -> Dict[str, list]:
+    """evaluate_tags() over every tag."""
+    return self.evaluate_tags(self.tags(), **arrays)
+'''
+        f.write(textwrap.indent(textwrap.dedent(methods), "    "))
+        for tag, rows in num_funcs.items():
+            for i in range(len(rows)):
+                m = f"""
+def eq_{safe_name(tag)}_{i}(self, **values) -> float:
+    \"\"\"Residual for tag {tag}, line {i}.\"\"\"
+    return self.residual({repr(tag)}, {i}, **values)
+"""
+                f.write(textwrap.indent(textwrap.dedent(m), "    "))
+
+    print(f"✔ Wrote numeric companion: {out_num}")
+
+    for rep, entry in lines.items():
+        old = old_lines.get(rep, {})
+        if "inverse" not in entry and "inverse" in old:   # CORE_EQS_SOLVE_BUDGET=0 run
+            entry.update(budget=old["budget"], inverse=old["inverse"], numeric_only=old["numeric_only"])
+    manifest = {
+        "version": tool_version,
+        "source": os.path.basename(tex_path),
+        "budget": budget_setting,
+        "blocks": {tag: {"hash": hashes[tag], "srepr": srepr_map[tag]} for tag in ce.tags()},
+        "idents": idents,
+        "cse_steps": cse_steps,
+        "lines": lines,
+    }
+    with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(manifest_path + ".tmp", manifest_path)
+    print(f"✔ Wrote manifest: {manifest_path}")
+    return True
+
+def build(in_tex: str, out_tex: str, name: str, core_path: str, out_py: str, out_num: str,
+          manifest_path: str) -> bool:
+    """extract() then generate(), in one interpreter; returns what generate() does."""
+    extract(in_tex, out_tex, name)
+    print(f"✔ Wrote: {out_tex}")
+    return generate(core_path, out_tex, out_py, name, out_num, manifest_path)
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+    ap = argparse.ArgumentParser(description="core-eq.sh's extraction and codegen.")
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('extract', help='write the <name>-equations.tex of a .tex input')
+    p.add_argument('input')
+    p.add_argument('out_tex')
+    p.add_argument('name')
+    p = sub.add_parser('generate', help='write <name>_core.py, <name>_numeric.py and the manifest')
+    p.add_argument('core_eqs_py')
+    p.add_argument('equations_tex')
+    p.add_argument('out_py')
+    p.add_argument('name')
+    p.add_argument('out_num')
+    p.add_argument('manifest')
+    p = sub.add_parser('build', help='extract, then generate, in one process')
+    for arg in ('input', 'out_tex', 'name', 'core_eqs_py', 'out_py', 'out_num', 'manifest'):
+        p.add_argument(arg)
+    args = ap.parse_args(argv)
+    if args.cmd == 'extract':
+        extract(args.input, args.out_tex, args.name)
+    elif args.cmd == 'build':
+        build(args.input, args.out_tex, args.name, args.core_eqs_py, args.out_py, args.out_num,
+              args.manifest)
+    else:
+        generate(args.core_eqs_py, args.equations_tex, args.out_py, args.name, args.out_num,
+                 args.manifest)
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,13 @@ from __future__ import annotations
 import sys
 import os
 import re
-from typing import Dict, List, Optional, Union
+import time
+import hashlib
+import sqlite3
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import sympy as sp
 from sympy.parsing.latex import parse_latex as _sympy_parse_latex  # fallback
@@ -17,10 +23,6 @@ from sympy.parsing.latex import parse_latex as _sympy_parse_latex  # fallback
 
 _SPACING_CMDS = r'(?:\\,|\\!|\\;|\\:|\\quad|\\qquad)'
 
-_SUB_BARE = re.compile(r'_(?!\{)([A-Za-z0-9])')     # x_i  -> x_{i}
-_EXP_BARE = re.compile(r'\^([A-Za-z0-9])')          # M^2  -> M^{2}
-_BRACK_GROUP = re.compile(r'\[([^\[\]]+)\]')        # [ ... ] -> ( ... )
-
 def _balanced(s: str) -> bool:
     st: List[str] = []
     for ch in s:
@@ -32,59 +34,100 @@ def _balanced(s: str) -> bool:
             st.pop()
     return not st
 
-def _normalize_text_subscripts(s: str) -> str:
-    # (BASE)_{\text{ns}} -> BASE_{ns}
-    s = re.sub(
-        r'\(\s*([A-Za-z\\]+(?:_\{[^}]+\})?)\s*\)_\{\\text\{([^}]+)\}\}',
-        r'\1_{\2}', s
-    )
-    # (BASE)_{ns} -> BASE_{ns}
-    s = re.sub(
-        r'\(\s*([A-Za-z\\]+(?:_\{[^}]+\})?)\s*\)_\{([^}]+)\}',
-        r'\1_{\2}', s
-    )
-    # X_{\text{inj}}  -> X_{inj}
-    s = re.sub(r'_\{\\text\{([^}]+)\}\}', r'_{\1}', s)
-    # X_{\mathrm{inj}} -> X_{inj}
-    s = re.sub(r'_\{\\mathrm\{([^}]+)\}\}', r'_{\1}', s)
+# --- Single-pass normalizer ----------------------------------------------------------
+#
+# Two linear scans instead of a dozen re.sub passes and a fixpoint loop: the first
+# drops spacing commands, \left, \right and & and collapses whitespace; the second is
+# a master alternation over the rewrite rules in which every hit is rewritten in place
+# and only the rewritten piece is re-scanned (e.g. \dot{p_{a,b}} still needs its commas
+# collapsed). tests/test_normalize.py checks the output against the multi-pass regex
+# implementation this replaced.
+
+_GAP = r'(?:\s|\\(?:,|!|;|:|quad|qquad)|\\left\s*|\\right\s*|&)'
+_GAP_RE = re.compile(
+    # a lone ' ' is already normal and never reaches the callback
+    r'[^\S ]' + _GAP + r'*| ' + _GAP + r'+|(?:\\(?:,|!|;|:|quad|qquad)|\\left|\\right|&)' + _GAP + r'*'
+)
+
+def _gap(m: 're.Match[str]') -> str:
+    g = m.group()
+    if '\\' in g or '&' in g:
+        g = re.sub(_SPACING_CMDS, '', g)
+        g = re.sub(r'\\(?:left|right)\s*', '', g).replace('&', '')
+    return ' ' if g else ''
+
+_NORM_RE = re.compile(
+    r'(?=[(_^\\\[])(?:'
+    # (BASE)_{\text{ns}} / (BASE)_{ns} -> BASE_{ns}  (the subscript is scanned next)
+    r'\(\s*(?P<pbase>[A-Za-z\\]+(?:_\{[^}]+\})?'
+    # ... one level of nesting when the inner subscript is \text (the reference
+    # rewrites \text subscripts in an earlier pass than plain ones)
+    r'|[A-Za-z\\]*\(\s*[A-Za-z\\]+\s*\)_\{\\text\{[^}]+\}\})\s*\)(?=_\{[^}]+\})'
+    # X_{\text{inj}} / X_{\mathrm{inj}} -> X_{inj}
+    r'|_\{\\(?:text|mathrm)\{(?P<tsub>[^}]+)\}\}'
     # _{a,b} -> _{a_b}
-    while True:
-        s2 = re.sub(r'_\{([^{}]+),\s*([^{}]+)\}', r'_{\1_\2}', s)
-        if s2 == s:
-            break
-        s = s2
-    return s
+    r'|_\{(?P<csub>[^{}]*,[^{}]*)\}'
+    # \dot{W} -> Wdot ; \dot{p_c} -> p_cdot  (x_\dot{W} -> x_{W}dot)
+    r'|(?P<dop>[_^])?\\dot\{(?P<dbase>[A-Za-z](?:_[A-Za-z0-9]+'
+    r'|_\{(?:\\(?:text|mathrm)\{[^}]+\}|[^}]+)\})?)\}'
+    # x_i -> x_{i} ; M^2 -> M^{2}
+    r'|(?P<bop>[_^])(?P<bch>[A-Za-z0-9])'
+    # [ ... ] -> ( ... )  (innermost only)
+    r'|\[(?P<bracket>[^\[\]]+)\])'
+)
+
+_COMMA_RE = re.compile(r'(?<=[\s\S]),(\s*)')
+
+def _collapse_commas(c: str) -> str:
+    # Same result as re-applying _\{([^{}]+),\s*([^{}]+)\} to a fixpoint: every comma
+    # with text before and after it becomes '_' and swallows the whitespace after it
+    # (keeping one character if that whitespace ends the group).
+    n = len(c)
+    def rep(m: 're.Match[str]') -> str:
+        if m.end() < n:
+            return '_'
+        ws = m.group(1)
+        return '_' + ws[-1] if ws else ','
+    return _COMMA_RE.sub(rep, c)
 
-def _normalize_dots(s: str) -> str:
-    # \dot{W} -> Wdot ; \dot{p_c} -> p_cdot
-    return re.sub(
-        r'\\dot\{([A-Za-z](?:_[A-Za-z0-9]+|\_\{[^}]+\})?)\}',
-        r'\1dot', s
-    )
+def _norm_piece(m: 're.Match[str]') -> str:
+    kind = m.lastgroup
+    g = m.group(kind)
+    if kind == 'bch':
+        return f'{m.group("bop")}{{{g}}}'
+    if kind == 'pbase':
+        return _norm_scan(g)
+    if kind == 'tsub':
+        return _norm_scan(f'_{{{g}}}')
+    if kind == 'csub':
+        return '_{' + _norm_scan(_collapse_commas(g)) + '}'
+    if kind == 'dbase':
+        out = _norm_scan(g + 'dot')
+        op = m.group('dop')
+        return f'{op}{{{out[0]}}}{out[1:]}' if op else out
+    # bracket
+    inner = _norm_scan(g)
+    return f'({inner})' if inner else '[]'
+
+def _norm_scan(s: str) -> str:
+    return _NORM_RE.sub(_norm_piece, s)
 
 def _normalize_for_parsers(s: str) -> str:
-    # strip thin/space commands
-    s = re.sub(_SPACING_CMDS, '', s)
-    # strip \left \right
-    s = re.sub(r'\\left\s*', '', s)
-    s = re.sub(r'\\right\s*', '', s)
-    # remove alignment tabs
-    s = s.replace('&', '')
-    # friendlier subscripts and dotted symbols
-    s = _normalize_text_subscripts(s)
-    s = _normalize_dots(s)
-    # brace bare subscripts/exponents
-    s = _SUB_BARE.sub(r'_{\1}', s)
-    s = _EXP_BARE.sub(r'^{\1}', s)
-    # treat [ ... ] as grouping if present
-    s = _BRACK_GROUP.sub(r'(\1)', s)
-    # collapse whitespace
-    s = re.sub(r'\s+', ' ', s).strip()
-    return s
+    return _norm_scan(_GAP_RE.sub(_gap, s)).strip()
+
+def _is_normal(s: str) -> bool:
+    # Normalizing is a fixpoint unless a rewrite exposed another bracket level or a
+    # (BASE)_{sub} (e.g. ( \dot{m} )_{ns} -> (mdot)_{ns}); such output goes round again.
+    return '[' not in s and ')_{' not in s
 
 # lazy primary parser (latex2sympy2 if available)
 def _primary_parse(s: str) -> sp.Expr:
     import latex2sympy2 as l2s  # type: ignore
+    # latex2sympy2 can leave a Symbol in its module-global ``var`` table, which
+    # makes every later parse in the process fail; results must not depend on
+    # which lines a (worker) process happened to see before.
+    if not isinstance(getattr(l2s, 'var', None), dict):
+        l2s.var = {}
     return l2s.latex2sympy(s)
 
 # --- Fast-path tokenization for simple cases (avoid latex parsers) --------------------
@@ -162,30 +205,347 @@ def _fast_path_expr(s: str) -> Optional[sp.Expr]:
 
     return None
 
-def _parse_latex_expr(raw: str) -> sp.Expr:
+# --- Recursive-descent parser for the common equation grammar -------------------------
+#
+# Covers what our equation files actually use: numerals, (subscripted) names, Greek
+# letters, \frac, \sqrt[n]{}, ^{}, ( ) [ ] { } grouping, \cdot / \times / '/', and
+# implicit products. Trees are built with evaluate=False and follow latex2sympy2's
+# naming (p_t, p_{cns}, gamma_x). Anything else raises _RDUnsupported so the caller
+# falls back to latex2sympy2 / parse_latex.
+
+class _RDUnsupported(Exception):
+    """Construct outside the recursive-descent grammar."""
+
+_GREEK = frozenset('''
+    alpha beta gamma delta epsilon varepsilon zeta eta theta vartheta iota kappa
+    lambda mu nu xi omicron varpi rho varrho sigma varsigma tau upsilon phi varphi
+    chi psi omega Gamma Delta Theta Lambda Xi Pi Sigma Upsilon Phi Psi Omega
+'''.split())
+
+_RD_TOKEN_RE = re.compile(r'''
+    (?P<ws>\s+)
+  | (?P<num>\d+(?:\.\d+)?)
+  | (?P<cmd>\\[A-Za-z]+|\\.)
+  | (?P<letter>[A-Za-z])
+  | (?P<op>[-+*/^_()\[\]{}])
+  | (?P<other>.)
+''', re.X | re.S)
+
+_RD_MULOPS = ('*', '\\cdot', '\\times')
+_RD_FRACS = ('\\frac', '\\dfrac', '\\tfrac')
+_RD_SUB_TEXT_RE = re.compile(r'^[A-Za-z0-9_\\{}]+$')
+
+# Parse-path counters, reported by main() as the recursive-descent hit rate.
+_PARSE_COUNTS: Dict[str, int] = {'fast': 0, 'rd': 0, 'latex2sympy2': 0, 'sympy': 0, 'failed': 0}
+
+def parse_path_counts() -> Dict[str, int]:
+    return dict(_PARSE_COUNTS)
+
+# Stage timers, accumulated alongside _PARSE_COUNTS: stage -> [calls, seconds].
+# Stages: normalize, fast, rd, latex2sympy2, sympy (parse attempts on each path),
+# cache (lookups/stores/flush), residual, free_symbols and skipped (lines dropped).
+_STAGE_TIMES: Dict[str, List[float]] = {}
+
+def _clock(stage: str, t0: float) -> float:
+    now = time.perf_counter()
+    rec = _STAGE_TIMES.get(stage)
+    if rec is None:
+        _STAGE_TIMES[stage] = [1, now - t0]
+    else:
+        rec[0] += 1
+        rec[1] += now - t0
+    return now
+
+def stage_times() -> Dict[str, Tuple[int, float]]:
+    return {k: (int(n), t) for k, (n, t) in _STAGE_TIMES.items()}
+
+def _rd_mul(*factors: sp.Expr) -> sp.Expr:
+    # flatten one level the way latex2sympy2 does: \frac{a}{b} c -> Mul(a, 1/b, c)
+    flat: List[sp.Expr] = []
+    for f in factors:
+        flat.extend(f.args if isinstance(f, sp.Mul) else (f,))
+    return flat[0] if len(flat) == 1 else sp.Mul(*flat, evaluate=False)
+
+def _rd_neg(e: sp.Expr) -> sp.Expr:
+    return -e if e.is_Number else _rd_mul(sp.Integer(-1), e)
+
+class _RDParser:
+    def __init__(self, s: str):
+        self.s = s
+        self.toks: List[Tuple[str, str, int, int]] = []
+        for m in _RD_TOKEN_RE.finditer(s):
+            kind = m.lastgroup
+            if kind == 'ws':
+                continue
+            if kind == 'other':
+                raise _RDUnsupported(f'character {m.group()!r}')
+            text = m.group()
+            if kind == 'cmd' and text in ('\\left', '\\right'):
+                continue
+            self.toks.append((kind, text, m.start(), m.end()))
+        self.i = 0
+
+    # -- token helpers --
+    def _peek(self, k: int = 0) -> Optional[Tuple[str, str, int, int]]:
+        j = self.i + k
+        return self.toks[j] if j < len(self.toks) else None
+
+    def _text(self, k: int = 0) -> Optional[str]:
+        t = self._peek(k)
+        return t[1] if t else None
+
+    def _next(self) -> Tuple[str, str, int, int]:
+        t = self._peek()
+        if t is None:
+            raise ValueError('Unexpected end of LaTeX: ' + self.s)
+        self.i += 1
+        return t
+
+    def _expect(self, text: str) -> None:
+        t = self._next()
+        if t[1] != text:
+            raise ValueError(f'Expected {text!r} at column {t[2]} in: {self.s}')
+
+    # -- grammar --
+    def parse(self) -> sp.Expr:
+        if not self.toks:
+            raise ValueError('Empty LaTeX expression')
+        e = self._expr()
+        if self._peek() is not None:
+            raise ValueError(f'Unexpected {self._text()!r} in: {self.s}')
+        return e
+
+    def _expr(self) -> sp.Expr:
+        terms = [self._term()]
+        while self._text() in ('+', '-'):
+            op = self._next()[1]
+            t = self._term()
+            terms.append(t if op == '+' else _rd_neg(t))
+        return terms[0] if len(terms) == 1 else sp.Add(*terms, evaluate=False)
+
+    def _starts_factor(self) -> bool:
+        t = self._peek()
+        if t is None:
+            return False
+        kind, text = t[0], t[1]
+        if kind in ('num', 'letter'):
+            return True
+        if kind == 'cmd':
+            return text not in _RD_MULOPS
+        return text in ('(', '[', '{')
+
+    def _term(self) -> sp.Expr:
+        # explicit * and / bind looser than juxtaposition, as in latex2sympy2:
+        # a b / c d is (a b)/(c d) and a/b c is a/(b c)
+        left = self._implicit()
+        while True:
+            text = self._text()
+            if text in _RD_MULOPS:
+                self._next()
+                left = _rd_mul(left, self._implicit())
+            elif text == '/':
+                self._next()
+                den = self._implicit()
+                left = sp.Mul(left, sp.Pow(den, -1, evaluate=False), evaluate=False)
+            else:
+                break
+        return left
+
+    def _implicit(self) -> sp.Expr:
+        factors = [self._unary()]
+        while self._starts_factor():
+            factors.append(self._postfix())
+        return _rd_mul(*factors)
+
+    def _unary(self) -> sp.Expr:
+        text = self._text()
+        if text == '+':
+            self._next()
+            return self._unary()
+        if text == '-':
+            self._next()
+            if self._peek() is not None and self._peek()[0] == 'num' and self._text(1) != '^':
+                return -self._number(self._next()[1])
+            return _rd_neg(self._unary())
+        return self._postfix()
+
+    def _postfix(self) -> sp.Expr:
+        base = self._primary()
+        while self._text() == '^':
+            self._next()
+            base = sp.Pow(base, self._script_arg(), evaluate=False)
+        if self._text() == '_':
+            raise _RDUnsupported('subscript on a non-name')
+        return base
+
+    def _script_arg(self) -> sp.Expr:
+        # ^{...}, or a single token: ^2, ^x, ^\gamma
+        t = self._peek()
+        if t is None:
+            raise ValueError('Dangling ^ in: ' + self.s)
+        if t[1] == '{':
+            return self._group()
+        if t[0] == 'num':
+            self._next()
+            if len(t[1]) > 1:
+                raise _RDUnsupported('unbraced multi-digit exponent')
+            return self._number(t[1])
+        return self._primary()
+
+    def _group(self, open_: str = '{', close: str = '}') -> sp.Expr:
+        self._expect(open_)
+        e = self._expr()
+        self._expect(close)
+        return e
+
+    @staticmethod
+    def _number(text: str) -> sp.Expr:
+        return sp.Rational(text) if '.' in text else sp.Integer(text)
+
+    def _primary(self) -> sp.Expr:
+        t = self._peek()
+        if t is None:
+            raise ValueError('Unexpected end of LaTeX: ' + self.s)
+        kind, text = t[0], t[1]
+        if kind == 'num':
+            self._next()
+            return self._number(text)
+        if kind == 'letter':
+            return self._name()
+        if text == '(':
+            return self._group('(', ')')
+        if text == '[':
+            return self._group('[', ']')
+        if text == '{':
+            return self._group()
+        if kind == 'cmd':
+            if text in _RD_FRACS:
+                self._next()
+                num = self._group()
+                den = self._group()
+                return sp.Mul(num, sp.Pow(den, -1, evaluate=False), evaluate=False)
+            if text == '\\sqrt':
+                self._next()
+                if self._text() in ('[', '('):
+                    # the normalizer turns \sqrt[n] into \sqrt(n)
+                    n = self._group('[', ']') if self._text() == '[' else self._group('(', ')')
+                    arg = self._group()
+                    exp = sp.Rational(1, n) if n.is_Integer else sp.Pow(n, -1, evaluate=False)
+                    return sp.Pow(arg, exp, evaluate=False)
+                return sp.Pow(self._group(), sp.Rational(1, 2), evaluate=False)
+            if text == '\\pi':
+                self._next()
+                return sp.pi
+            if text[1:] in _GREEK:
+                return self._name()
+        raise _RDUnsupported(f'token {text!r}')
+
+    def _name(self) -> sp.Expr:
+        kind, text, _, end = self._next()
+        base = text[1:] if kind == 'cmd' else text
+        # \dot{X} arrives normalized as Xdot / X_{sub}dot
+        if kind == 'letter' and self._dot_suffix(end):
+            base += 'dot'
+        sub = None
+        if self._text() == '_':
+            self._next()
+            sub = self._subscript_text()
+            if self._dot_suffix(self._peek(-1)[3]):
+                sub += 'dot'
+        if sub is None:
+            if base == 'e':
+                return sp.E
+            if base == 'I':
+                return sp.I
+            return sp.Symbol(base)
+        return sp.Symbol(f'{base}_{sub}' if len(sub) == 1 else f'{base}_{{{sub}}}')
+
+    def _dot_suffix(self, end: int) -> bool:
+        if self.s.startswith('dot', end) and not self.s[end + 3:end + 4].isalnum():
+            toks = [self._peek(k) for k in range(3)]
+            if all(tk is not None and tk[0] == 'letter' for tk in toks):
+                self.i += 3
+                return True
+        return False
+
+    def _subscript_text(self) -> str:
+        t = self._next()
+        if t[1] != '{':
+            if t[0] in ('letter', 'num') and len(t[1]) == 1:
+                return t[1]
+            raise _RDUnsupported('unbraced subscript')
+        depth, start = 1, t[3]
+        while depth:
+            tk = self._next()
+            if tk[1] == '{':
+                depth += 1
+            elif tk[1] == '}':
+                depth -= 1
+        text = re.sub(r'\s+', '', self.s[start:tk[2]])
+        if not text or not _RD_SUB_TEXT_RE.match(text):
+            raise _RDUnsupported(f'subscript {text!r}')
+        return text
+
+def _rd_parse(s: str) -> sp.Expr:
+    return _RDParser(s).parse()
+
+def _parse_latex_expr(raw: str, normalized: bool = False) -> sp.Expr:
     """
     Try a fast-path for simple identifiers/ratios first (avoids latex2sympy2 bugs),
-    then attempt latex2sympy2, then SymPy's parse_latex.
+    then the recursive-descent parser, and only for constructs outside its
+    grammar latex2sympy2, then SymPy's parse_latex.
+
+    Pass normalized=True when `raw` already went through _normalize_for_parsers.
     """
-    s = _normalize_for_parsers(raw)
+    t = time.perf_counter()
+    if normalized:
+        s = raw.strip()
+    else:
+        s = _normalize_for_parsers(raw)
+        t = _clock('normalize', t)
 
     # Fast path: handles Wdot, p_t, v_x, \epsilon, A_x/A_t, v_x/v_t, etc.
     fp = _fast_path_expr(s)
+    t = _clock('fast', t)
     if fp is not None:
+        _PARSE_COUNTS['fast'] += 1
         return fp
 
     if not _balanced(s):
+        _PARSE_COUNTS['failed'] += 1
         raise ValueError('Unbalanced braces in LaTeX: ' + s)
 
+    try:
+        expr = _rd_parse(s)
+    except _RDUnsupported:
+        t = _clock('rd', t)
+    except Exception:
+        _clock('rd', t)
+        _PARSE_COUNTS['failed'] += 1
+        raise
+    else:
+        _clock('rd', t)
+        _PARSE_COUNTS['rd'] += 1
+        return expr
+
     # Prefer latex2sympy2, fall back to SymPy parser
     try:
-        return _primary_parse(s)
+        expr = _primary_parse(s)
+        _clock('latex2sympy2', t)
+        _PARSE_COUNTS['latex2sympy2'] += 1
+        return expr
     except Exception as e_l2s:
+        t = _clock('latex2sympy2', t)
         # Show exactly what failed, then try SymPy's parser
         print('\nLATEX2SYMPY FAIL ON:\n>>>', s, '\n<<<', file=sys.stderr)
         try:
-            return _sympy_parse_latex(s)
+            expr = _sympy_parse_latex(s)
+            _clock('sympy', t)
+            _PARSE_COUNTS['sympy'] += 1
+            return expr
         except Exception as e_sympy:
+            _clock('sympy', t)
+            _PARSE_COUNTS['failed'] += 1
             # If both fail, raise the SymPy error but include the l2s context
             raise RuntimeError(
                 f"LaTeX parse failed for: {s}\n"
@@ -208,16 +568,789 @@ _ALIGNED_RE = re.compile(
 )
 
 # --------------------------------------------------------------------------------------
-# CoreEqs container
+# Persistent parse cache: hash(parser versions + normalized line) -> srepr | failure
+# --------------------------------------------------------------------------------------
+
+# Bump whenever normalization or the fast path changes what a line parses to.
+_PARSER_REV = '5'
+
+def _parser_versions() -> str:
+    from importlib import metadata
+    parts = [f'core_eqs={_PARSER_REV}', f'sympy={sp.__version__}']
+    for dist in ('latex2sympy2', 'antlr4-python3-runtime'):
+        try:
+            parts.append(f'{dist}={metadata.version(dist)}')
+        except metadata.PackageNotFoundError:
+            parts.append(f'{dist}=none')
+    return ';'.join(parts)
+
+def _from_srepr(s: str):
+    # evaluate=False rebuilds exactly the tree the parser produced
+    with sp.evaluate(False):
+        return eval(s, {}, vars(sp))
+
+class _CachedFailure(Exception):
+    """A parse failure replayed from the cache instead of re-running the parsers."""
+
+class ParseCache:
+    """
+    On-disk (sqlite) cache of parsed lines, keyed by a hash of the normalized
+    LaTeX plus the parser versions. Stores the srepr of the result, or the
+    recorded failure, so unchanged lines skip latex2sympy2/parse_latex entirely.
+    Least-recently-used entries are evicted past ``max_entries``.
+
+    Lookups only read. New entries and ``last_used`` touches are kept in memory
+    and written by ``flush()`` in one short transaction, so concurrent users of
+    the same file (parallel parse workers, the daemon) never wait on each other
+    for longer than that write. If the database cannot be written the pending
+    entries are dropped; a cache failure never fails a parse.
+    """
+
+    DEFAULT_MAX_ENTRIES = 50_000
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._versions = _parser_versions()
+        self._pending: Dict[str, Tuple[int, str, float]] = {}
+        self._touched: Dict[str, float] = {}
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        # WAL lets readers carry on while another connection writes.
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS parse ('
+            ' key TEXT PRIMARY KEY, ok INTEGER NOT NULL, payload TEXT NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._db.commit()
+
+    @staticmethod
+    def default_path() -> str:
+        env = os.environ.get('CORE_EQS_CACHE')
+        if env:
+            return env
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'core_eqs', 'parse-cache.sqlite3')
+
+    @classmethod
+    def default(cls) -> Optional['ParseCache']:
+        """The shared cache, or None if disabled (CORE_EQS_CACHE=off) or unusable."""
+        path = cls.default_path()
+        if path.lower() in ('off', 'none', '0'):
+            return None
+        try:
+            return cls(path)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[core_eqs] Parse cache disabled ({path}): {e}", file=sys.stderr)
+            return None
+
+    def _key(self, normalized: str) -> str:
+        h = hashlib.sha256(self._versions.encode('utf-8'))
+        h.update(b'\0')
+        h.update(normalized.encode('utf-8'))
+        return h.hexdigest()
+
+    def get(self, normalized: str) -> Optional[Tuple[bool, str]]:
+        key = self._key(normalized)
+        pending = self._pending.get(key)
+        if pending is not None:
+            return bool(pending[0]), pending[1]
+        row = self._db.execute('SELECT ok, payload FROM parse WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        return bool(row[0]), row[1]
+
+    def put(self, normalized: str, ok: bool, payload: str) -> None:
+        self._pending[self._key(normalized)] = (int(ok), payload, time.time())
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._touched.clear()
+        self._db.execute('DELETE FROM parse')
+        self._db.commit()
+
+    def flush(self) -> None:
+        """Write pending entries and touches, and evict LRU entries beyond ``max_entries``."""
+        pending, self._pending = self._pending, {}
+        touched, self._touched = self._touched, {}
+        try:
+            with self._db:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO parse (key, ok, payload, last_used) VALUES (?, ?, ?, ?)',
+                    [(k, ok, payload, used) for k, (ok, payload, used) in pending.items()],
+                )
+                self._db.executemany('UPDATE parse SET last_used = ? WHERE key = ?',
+                                     [(used, k) for k, used in touched.items()])
+                (n,) = self._db.execute('SELECT COUNT(*) FROM parse').fetchone()
+                if n > self.max_entries:
+                    self._db.execute(
+                        'DELETE FROM parse WHERE key IN '
+                        '(SELECT key FROM parse ORDER BY last_used ASC LIMIT ?)',
+                        (n - self.max_entries,),
+                    )
+        except sqlite3.Error as e:
+            print(f"[core_eqs] Parse cache not updated ({self.path}): {e}", file=sys.stderr)
+
+    def close(self) -> None:
+        self.flush()
+        self._db.close()
+
+# --------------------------------------------------------------------------------------
+# Load / call statistics (CoreEqs.stats, --stats)
 # --------------------------------------------------------------------------------------
 
+class CoreStats:
+    """
+    Where the time went while building a CoreEqs, and in calls on it since.
+
+    stages:  stage -> [calls, seconds] (see _STAGE_TIMES for the stage names)
+    paths:   parse-path hit counts for this load (same keys as parse_path_counts())
+    tags:    tag -> seconds spent parsing and post-processing its block
+    lines:   (seconds, tag, path, line) per source line; path is the slowest parser
+             the line needed, or 'cache' for a cache hit
+    calls:   (method, tag) -> [calls, seconds] for solve_for / substitute / bind / evaluate
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}
+        self.paths: Dict[str, int] = {k: 0 for k in _PARSE_COUNTS}
+        self.tags: Dict[str, float] = {}
+        self.lines: List[Tuple[float, str, str, str]] = []
+        self.calls: Dict[Tuple[str, str], List[float]] = {}
+        self.skipped = 0
+        self.total = 0.0
+
+    def record_call(self, method: str, tag: str, t0: float) -> None:
+        rec = self.calls.setdefault((method, tag), [0, 0.0])
+        rec[0] += 1
+        rec[1] += time.perf_counter() - t0
+
+    def slowest_lines(self, n: int = 10) -> List[Tuple[float, str, str, str]]:
+        import heapq
+        return heapq.nlargest(n, self.lines)
+
+    def slowest_tags(self, n: int = 10) -> List[Tuple[str, float]]:
+        return sorted(self.tags.items(), key=lambda kv: -kv[1])[:n]
+
+    def as_dict(self, top: int = 10) -> dict:
+        return {
+            'total': self.total,
+            'lines': len(self.lines),
+            'skipped': self.skipped,
+            'stages': {k: {'calls': int(n), 'seconds': t} for k, (n, t) in self.stages.items()},
+            'paths': dict(self.paths),
+            'slowest_tags': [{'tag': tag, 'seconds': t} for tag, t in self.slowest_tags(top)],
+            'slowest_lines': [{'seconds': t, 'tag': tag, 'path': path, 'line': line}
+                              for t, tag, path, line in self.slowest_lines(top)],
+            'calls': [{'method': m, 'tag': tag, 'calls': int(n), 'seconds': t}
+                      for (m, tag), (n, t) in sorted(self.calls.items(), key=lambda kv: -kv[1][1])],
+        }
+
+    def report(self, top: int = 10) -> str:
+        out = [f'Load: {len(self.lines)} lines in {len(self.tags)} blocks, '
+               f'{self.total:.3f} s ({self.skipped} skipped)', 'Stages:']
+        for k, (n, t) in sorted(self.stages.items(), key=lambda kv: -kv[1][1]):
+            out.append(f'  {k:<13} {int(n):>7} calls {t:>9.4f} s')
+        out.append('Paths: ' + ', '.join(f'{k} {v}' for k, v in self.paths.items()))
+        out.append(f'Slowest tags (top {top}):')
+        for tag, t in self.slowest_tags(top):
+            out.append(f'  {tag:<10} {t:>9.4f} s')
+        out.append(f'Slowest lines (top {top}):')
+        for t, tag, path, line in self.slowest_lines(top):
+            out.append(f'  {t:>9.4f} s  [{tag}] {path:<12} {line}')
+        if self.calls:
+            out.append('Calls:')
+            for (m, tag), (n, t) in sorted(self.calls.items(), key=lambda kv: -kv[1][1])[:top]:
+                out.append(f'  {m:<11} {tag:<10} {int(n):>6} calls {t:>9.4f} s')
+        return '\n'.join(out)
+
+def _line_path(before: Dict[str, int]) -> str:
+    # Slowest parser a line needed, from the parse-path counters it moved.
+    moved = [k for k in _PARSE_COUNTS if _PARSE_COUNTS[k] != before[k]]
+    return moved[-1] if moved else 'cache'
+
+# --------------------------------------------------------------------------------------
+# Arguments of the compiled NumPy kernels (also copied into the generated modules)
+# --------------------------------------------------------------------------------------
+
+def _kernel_args(names: List[str], arrays: dict, where: str) -> Tuple[list, tuple]:
+    # float arrays for `names` in order, and the shape they broadcast to
+    import numpy as np
+    missing = [n for n in names if n not in arrays]
+    if missing:
+        raise KeyError(f"Missing values for {missing} in {where}")
+    args = [np.asarray(arrays[n], dtype=float) for n in names]
+    return args, (np.broadcast_shapes(*(a.shape for a in args)) if args else ())
+
+# --------------------------------------------------------------------------------------
+# Partially substituted residuals (CoreEqs.bind)
+# --------------------------------------------------------------------------------------
+
+class BoundResidual:
+    """
+    One residual with some of its symbols fixed, from bind(). core_codegen.py emits
+    this class's source (inspect.getsource) into the generated modules, whose bind()
+    returns it as well.
+
+    expr:   the residual with the fixed values substituted (done once, with xreplace)
+    fixed:  name -> value that was substituted
+    free:   names of the symbols still to be supplied, sorted
+
+    Calling it with values for (some of) the free names substitutes just those into
+    ``expr``; evaluate() runs ``expr`` over NumPy arrays with a kernel lambdified once.
+    Names that are not free symbols of the residual are ignored in both.
+    """
+
+    def __init__(self, tag: str, i: int, expr: sp.Expr, symbols: Dict[str, sp.Symbol],
+                 fixed: dict):
+        self.tag = tag
+        self.i = i
+        self.fixed = dict(fixed)
+        self._symbols = {n: s for n, s in symbols.items() if n not in fixed}
+        subs = {symbols[n]: sp.sympify(v) for n, v in fixed.items()}
+        self.expr = expr.xreplace(subs) if subs else expr
+        self.free = sorted(self._symbols)
+        self._kernel = None
+
+    def __call__(self, **values) -> sp.Expr:
+        syms = self._symbols
+        subs = {syms[n]: sp.sympify(v) for n, v in values.items() if n in syms}
+        return self.expr.xreplace(subs) if subs else self.expr
+
+    def evaluate(self, **arrays):
+        """expr over NumPy arrays for the free names (they broadcast against each other)."""
+        import numpy as np
+        if self._kernel is None:
+            self._kernel = sp.lambdify([self._symbols[n] for n in self.free], self.expr,
+                                       modules='numpy')
+        args, shape = _kernel_args(self.free, arrays, f"tag {self.tag!r} i={self.i}")
+        out = np.asarray(self._kernel(*args), dtype=float)
+        return out if out.shape == shape else np.broadcast_to(out, shape).copy()
+
+    def __repr__(self) -> str:
+        return f'BoundResidual({self.tag!r}, {self.i}, fixed={sorted(self.fixed)}, free={self.free})'
+
+# --------------------------------------------------------------------------------------
+# Vectorized root finding (CoreEqs.solve_for(numeric=True))
+# --------------------------------------------------------------------------------------
+
+class NumericSolution:
+    """
+    Per-point result of a numeric solve_for.
+
+    root:        solution array (nan where the point did not converge)
+    converged:   bool array
+    residual:    |residual| at root
+    iterations:  iterations each point took (maxiter if it never converged)
+    """
+
+    def __init__(self, var: str, root, converged, residual, iterations):
+        self.var = var
+        self.root = root
+        self.converged = converged
+        self.residual = residual
+        self.iterations = iterations
+
+    @property
+    def all_converged(self) -> bool:
+        return bool(self.converged.all())
+
+    def __repr__(self) -> str:
+        n = self.converged.size
+        return (f'NumericSolution({self.var!r}, {int(self.converged.sum())}/{n} converged, '
+                f'max iterations {int(self.iterations.max()) if n else 0})')
+
+def _find_roots(f, df, x0, lo, hi, tol: float, maxiter: int):
+    """
+    Newton iteration on every point at once, with ``f(x)``/``df(x)`` evaluated over
+    the whole array. With a bracket (``lo``/``hi`` not None) steps that leave the
+    bracket fall back to bisection and the bracket shrinks around the sign change;
+    without one, steps are halved while they make the residual worse or non-finite.
+    A point converges once its step is below ``tol * (1 + |x|)`` or its residual is 0.
+    """
+    import numpy as np
+    bracketed = lo is not None
+    if bracketed:
+        lo, hi = np.array(lo, dtype=float), np.array(hi, dtype=float)
+        flo, fhi = f(lo), f(hi)
+        if x0 is None:
+            x0 = 0.5 * (lo + hi)
+    x = np.array(x0, dtype=float)
+    its = np.full(x.shape, maxiter)
+    converged = np.zeros(x.shape, dtype=bool)
+    # points without a sign change in their bracket are never iterated
+    done = ~(np.sign(flo) * np.sign(fhi) <= 0) if bracketed else converged.copy()
+    fx = f(x)
+    for k in range(maxiter):
+        active = ~done
+        if not active.any():
+            break
+        if bracketed:
+            # shrink each bracket to the half that still holds the sign change
+            left = active & (np.sign(fx) == np.sign(flo))
+            lo, flo = np.where(left, x, lo), np.where(left, fx, flo)
+            right = active & ~left
+            hi, fhi = np.where(right, x, hi), np.where(right, fx, fhi)
+        step = fx / df(x)
+        xn = x - step
+        if bracketed:
+            wild = ~np.isfinite(xn) | (xn <= np.minimum(lo, hi)) | (xn >= np.maximum(lo, hi))
+            xn = np.where(wild, 0.5 * (lo + hi), xn)
+        fn = f(xn)
+        if not bracketed:
+            for _ in range(30):
+                worse = active & (~np.isfinite(fn) | (np.abs(fn) > np.abs(fx)))
+                if not worse.any():
+                    break
+                step = np.where(worse, 0.5 * step, step)
+                xn = np.where(worse, x - step, xn)
+                fn = np.where(worse, f(xn), fn)
+        dx = np.abs(xn - x)
+        x = np.where(active, xn, x)
+        fx = np.where(active, fn, fx)
+        hit = (active & np.isfinite(x) & np.isfinite(fx)
+               & ((dx <= tol * (1.0 + np.abs(x))) | (fx == 0)))
+        its = np.where(hit, k + 1, its)
+        converged |= hit
+        done |= hit
+    return np.where(converged, x, np.nan), converged, np.abs(fx), its
+
+def find_roots(f, df, guess=None, shape: Tuple[int, ...] = (), tol: float = 1e-10,
+               maxiter: int = 50, var: str = 'x') -> NumericSolution:
+    """
+    Solve ``f(x) = 0`` at every point of an array at once: the vectorized Newton behind
+    solve_for(numeric=True), for residuals compiled elsewhere (e.g. the generated
+    <name>_numeric.py). ``f`` and ``df`` (its derivative in x) take and return float
+    arrays; ``guess`` is a start value (default 1) or a ``(lo, hi)`` bracket, as in
+    solve_for, and broadcasts with ``shape`` to the shape of the points.
+    """
+    import numpy as np
+    if isinstance(guess, tuple) and len(guess) == 2:
+        lo, hi, x0 = np.asarray(guess[0], float), np.asarray(guess[1], float), None
+        starts = [lo, hi]
+    else:
+        lo = hi = None
+        x0 = np.asarray(1.0 if guess is None else guess, dtype=float)
+        starts = [x0]
+    shape = np.broadcast_shapes(tuple(shape), *(a.shape for a in starts))
+    if lo is not None:
+        lo, hi = np.broadcast_to(lo, shape), np.broadcast_to(hi, shape)
+    else:
+        x0 = np.broadcast_to(x0, shape)
+
+    def fb(x):
+        return np.broadcast_to(np.asarray(f(x), dtype=float), shape)
+
+    def dfb(x):
+        return np.broadcast_to(np.asarray(df(x), dtype=float), shape)
+
+    with np.errstate(all='ignore'):
+        root, converged, residual, its = _find_roots(fb, dfb, x0, lo, hi, tol, maxiter)
+    return NumericSolution(var, root, converged, residual, its)
+
+def _find_roots_nd(F, J, x0, tol: float, maxiter: int):
+    """
+    Newton iteration for a k-variable block at every point at once. ``F(x)`` maps the
+    (k, *shape) unknowns to (k, *shape) residuals and ``J(x)`` to the (k, k, *shape)
+    Jacobian; steps are halved while they make ``|F|`` worse or non-finite, and points
+    with a singular Jacobian stop where they are (unconverged).
+    """
+    import numpy as np
+    x = np.array(x0, dtype=float)
+    shape = x.shape[1:]
+    its = np.full(shape, maxiter)
+    converged = np.zeros(shape, dtype=bool)
+    done = converged.copy()
+    fx = F(x)
+    norm = np.sqrt((fx ** 2).sum(axis=0))
+    for k in range(maxiter):
+        active = ~done
+        if not active.any():
+            break
+        jac = np.moveaxis(J(x), (0, 1), (-2, -1))
+        det = np.linalg.det(np.where(np.isfinite(jac), jac, 0.0))
+        singular = ~np.isfinite(jac).all(axis=(-2, -1)) | (det == 0)
+        done |= singular
+        active &= ~singular
+        jac = np.where(singular[..., None, None], np.eye(x.shape[0]), jac)
+        rhs = np.moveaxis(fx, 0, -1)[..., None]
+        step = np.moveaxis(np.linalg.solve(jac, np.where(np.isfinite(rhs), rhs, 0.0))[..., 0], -1, 0)
+        xn = x - step
+        fn = F(xn)
+        nn = np.sqrt((fn ** 2).sum(axis=0))
+        for _ in range(30):
+            worse = active & (~np.isfinite(nn) | (nn > norm))
+            if not worse.any():
+                break
+            step = np.where(worse, 0.5 * step, step)
+            xn = np.where(worse, x - step, xn)
+            fn = np.where(worse, F(xn), fn)
+            nn = np.sqrt((fn ** 2).sum(axis=0))
+        dx = np.abs(xn - x).max(axis=0)
+        x = np.where(active, xn, x)
+        fx = np.where(active, fn, fx)
+        norm = np.where(active, nn, norm)
+        hit = (active & np.isfinite(x).all(axis=0) & np.isfinite(norm)
+               & ((dx <= tol * (1.0 + np.abs(x).max(axis=0))) | (norm == 0)))
+        its = np.where(hit, k + 1, its)
+        converged |= hit
+        done |= hit
+    return np.where(converged, x, np.nan), converged, norm, its
+
+# --------------------------------------------------------------------------------------
+# Time-bounded sp.solve (CoreEqs.solve_for(timeout=...), solve_system(timeout=...))
+# --------------------------------------------------------------------------------------
+#
+# sp.solve cannot be interrupted from inside the process (it ignores signals while in C
+# code and leaves caches half-filled if it is), and on the transcendental gamma-exponent
+# lines it can run for minutes. Bounded solves therefore go to a child process that is
+# forked once and reused; a call that runs out of time kills it, and the next call forks
+# a fresh one from the (already warm) parent.
+
+class SolveResult:
+    """
+    Outcome of a time-bounded solve_for.
+
+    status:     'closed_form' (sp.solve answered in time), 'numeric' (it timed out,
+                failed or found nothing, and the vectorized Newton ran instead) or
+                'no_closed_form' (no answer and no numeric fallback possible)
+    solutions:  list of {Symbol: expr} dicts for 'closed_form', else []
+    numeric:    the NumericSolution for 'numeric', else None
+    reason:     why there is no closed form (None for 'closed_form')
+    seconds:    wall time of the call
+    """
+
+    def __init__(self, status: str, var: str, solutions: Optional[List[dict]] = None,
+                 numeric: Optional[NumericSolution] = None, reason: Optional[str] = None,
+                 seconds: float = 0.0):
+        self.status = status
+        self.var = var
+        self.solutions = solutions or []
+        self.numeric = numeric
+        self.reason = reason
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.status != 'no_closed_form'
+
+    def __repr__(self) -> str:
+        if self.status == 'closed_form':
+            detail = f'{len(self.solutions)} solution(s)'
+        elif self.status == 'numeric':
+            detail = f'{self.numeric!r}, {self.reason}'
+        else:
+            detail = self.reason
+        return f'SolveResult({self.var!r}, {self.status}, {detail}, {self.seconds:.2f}s)'
+
+def _solve_worker_main(conn) -> None:
+    import signal
+    # Ctrl-C is the parent's to handle; SIGTERM must work even when the parent is the
+    # daemon, whose asyncio handlers were inherited with the fork
+    signal.set_wakeup_fd(-1)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        eqs, unknowns = job
+        try:
+            sols = sp.solve(eqs, unknowns, dict=True)
+            conn.send(('ok', sols))
+        except Exception as e:
+            conn.send(('error', f'{type(e).__name__}: {e}'))
+
+class SolveWorker:
+    """
+    One child process running ``sp.solve`` jobs in turn (calls from several threads
+    queue on a lock). ``solve`` returns ('ok', solutions), ('timeout', None) or
+    ('error', 'Type: message'); on a timeout the child is killed and the next call
+    starts a new one (``restarts`` counts them).
+    """
+
+    def __init__(self):
+        import threading
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn = None
+        self.restarts = 0
+
+    def _start(self) -> None:
+        import multiprocessing as mp
+        # fork: the child starts with SymPy loaded and does not need to re-import this
+        # module by name
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork') if 'fork' in methods else mp.get_context()
+        parent, child = ctx.Pipe()
+        proc = ctx.Process(target=_solve_worker_main, args=(child,), name='core_eqs-solve',
+                           daemon=True)
+        proc.start()
+        child.close()
+        self._proc, self._conn = proc, parent
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.join()
+            self._conn.close()
+            self._proc = self._conn = None
+            self.restarts += 1
+
+    def solve(self, eqs, unknowns, timeout: float) -> Tuple[str, object]:
+        with self._lock:
+            if self._proc is None or not self._proc.is_alive():
+                self._kill()
+                self._start()
+            try:
+                self._conn.send((eqs, unknowns))
+            except OSError:
+                self._kill()
+                self._start()
+                self._conn.send((eqs, unknowns))
+            if not self._conn.poll(max(timeout, 0.0)):
+                self._kill()
+                return 'timeout', None
+            try:
+                return self._conn.recv()
+            except (EOFError, OSError):
+                self._kill()
+                return 'error', 'solver process died'
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is None:
+                return
+            try:
+                self._conn.send(None)
+                self._proc.join(1.0)
+            except OSError:
+                pass
+            if self._proc.is_alive():
+                self._proc.kill()
+                self._proc.join()
+            self._conn.close()
+            self._proc = self._conn = None
+
+_SOLVE_WORKER: Optional[SolveWorker] = None
+
+def solve_worker() -> SolveWorker:
+    """The process-wide SolveWorker bounded solves share (started on first use)."""
+    global _SOLVE_WORKER
+    if _SOLVE_WORKER is None:
+        import atexit
+        import multiprocessing.util  # noqa: F401 -- its exit hook must run after close()
+        _SOLVE_WORKER = SolveWorker()
+        atexit.register(_SOLVE_WORKER.close)
+    return _SOLVE_WORKER
+
+# --------------------------------------------------------------------------------------
+# Equation/variable graph planning (CoreEqs.plan / CoreEqs.solve_system)
+# --------------------------------------------------------------------------------------
+
+EqRef = Tuple[str, int]
+
+def _match_block(eqs: List[EqRef], names: frozenset, live: Dict[EqRef, frozenset]):
+    # Kuhn's augmenting paths: pick len(names) equations that each own one unknown.
+    owner: Dict[str, EqRef] = {}
+
+    def augment(e: EqRef, seen: set) -> bool:
+        for v in sorted(live[e]):
+            if v in seen:
+                continue
+            seen.add(v)
+            if v not in owner or augment(owner[v], seen):
+                owner[v] = e
+                return True
+        return False
+
+    for e in eqs:
+        augment(e, set())
+        if len(owner) == len(names):
+            break
+    if len(owner) < len(names):
+        return None
+    return sorted(set(owner.values())), sorted(names)
+
+def _smallest_block(live: Dict[EqRef, frozenset], max_block: int):
+    """
+    The smallest set of k equations that determine k still-unknown symbols between
+    them (k <= max_block), as (equations, names), or None. Blocks of one come from an
+    equation with a single unknown; larger candidates are the unknowns of one equation
+    or of two equations sharing an unknown, kept if a matching covers all of them.
+    """
+    for e, u in live.items():
+        if len(u) == 1:
+            return [e], sorted(u)
+    by_name: Dict[str, List[EqRef]] = {}
+    for e, u in live.items():
+        for v in u:
+            by_name.setdefault(v, []).append(e)
+    candidates = set()
+    for e, u in live.items():
+        if len(u) > max_block:
+            continue
+        candidates.add(u)
+        for v in u:
+            for e2 in by_name[v]:
+                both = u | live[e2]
+                if len(both) <= max_block:
+                    candidates.add(both)
+    for names in sorted(candidates, key=lambda c: (len(c), sorted(c))):
+        eqs = sorted({e for v in names for e in by_name[v] if live[e] <= names})
+        if len(eqs) >= len(names):
+            block = _match_block(eqs, names, live)
+            if block is not None:
+                return block
+    return None
+
+def _plan_blocks(eq_names: Dict[EqRef, frozenset], known, targets, max_block: int = 3):
+    """
+    Block-triangular evaluation order for ``targets`` given ``known`` symbol names.
+
+    Blocks are peeled off smallest first (every one-unknown equation before any
+    coupled pair, and so on), which gives the finest lower block-triangular order of
+    the part of the equation/variable graph the knowns determine; blocks the targets
+    do not depend on are then dropped. Returns [(equations, names), ...] in solve order.
+    """
+    known = set(known)
+    targets = set(targets)
+    steps = []
+    used = set()
+    while not targets <= known:
+        live = {e: u - known for e, u in eq_names.items() if e not in used and u - known}
+        block = _smallest_block(live, max_block)
+        if block is None:
+            break
+        steps.append(block)
+        used.update(block[0])
+        known.update(block[1])
+    missing = sorted(targets - known)
+    if missing:
+        raise ValueError(f'Cannot determine {missing} from the known symbols '
+                         f'(no block of up to {max_block} equations closes them)')
+    needed = set(targets)
+    keep = []
+    for eqs, names in reversed(steps):
+        if needed & set(names):
+            keep.append((eqs, names))
+            for e in eqs:
+                needed |= eq_names[e]
+    keep.reverse()
+    return keep
+
 ExprOrEq = Union[sp.Expr, sp.Eq]
 
+# --------------------------------------------------------------------------------------
+# Equation records (CoreEqs.records)
+# --------------------------------------------------------------------------------------
+
+class SymbolTable:
+    """
+    Interned symbols of one CoreEqs. Every distinct Symbol gets a small integer id,
+    and the (name-sorted) symbols of each line are a run of ids in one ``array('I')``
+    rather than a list of Symbol references per line. Runs of a block that is
+    replaced stay in the array; ids are never reused.
+    """
+
+    __slots__ = ('symbols', 'ids', 'runs')
+
+    def __init__(self):
+        self.symbols: List[sp.Symbol] = []
+        self.ids: Dict[sp.Symbol, int] = {}
+        self.runs = array('I')
+
+    def intern(self, sym: sp.Symbol) -> int:
+        k = self.ids.get(sym)
+        if k is None:
+            k = self.ids[sym] = len(self.symbols)
+            self.symbols.append(sym)
+        return k
+
+    def add_run(self, syms) -> Tuple[int, int]:
+        start = len(self.runs)
+        self.runs.extend(self.intern(s) for s in syms)
+        return start, len(self.runs) - start
+
+    def run(self, start: int, count: int) -> List[sp.Symbol]:
+        symbols = self.symbols
+        return [symbols[k] for k in self.runs[start:start + count]]
+
+class EqRecord:
+    """
+    One line of a CoreEqs: ``obj`` is what the parser returned (an Eq or a bare
+    expression). The residual is derived from it on access instead of being kept
+    alongside, and the free symbols are a run of ids in the owning SymbolTable.
+    """
+
+    __slots__ = ('tag', 'i', 'obj', '_table', '_start', '_count')
+
+    def __init__(self, tag: str, i: int, obj: ExprOrEq, table: SymbolTable,
+                 start: int, count: int):
+        self.tag = tag
+        self.i = i
+        self.obj = obj
+        self._table = table
+        self._start = start
+        self._count = count
+
+    @property
+    def residual(self) -> sp.Expr:
+        return CoreEqs._residual_of(self.obj)
+
+    @property
+    def symbol_ids(self) -> array:
+        return self._table.runs[self._start:self._start + self._count]
+
+    @property
+    def symbols(self) -> List[sp.Symbol]:
+        return self._table.run(self._start, self._count)
+
+    @property
+    def names(self) -> List[str]:
+        return [s.name for s in self.symbols]
+
+    def __repr__(self) -> str:
+        return f'EqRecord({self.tag!r}, {self.i}, {self.obj})'
+
+class _RecordView(Mapping):
+    # read-only tag -> [one field of every line] (CoreEqs.eqs / residuals / symbols)
+    __slots__ = ('_records', '_field')
+
+    def __init__(self, records: Dict[str, List[EqRecord]], field: str):
+        self._records = records
+        self._field = field
+
+    def __getitem__(self, tag: str) -> list:
+        return [getattr(rec, self._field) for rec in self._records[tag]]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+# --------------------------------------------------------------------------------------
+# CoreEqs container
+# --------------------------------------------------------------------------------------
+
 class CoreEqs:
     def __init__(self):
-        self.eqs: Dict[str, List[ExprOrEq]] = {}
-        self.residuals: Dict[str, List[sp.Expr]] = {}
-        self.symbols: Dict[str, List[List[sp.Symbol]]] = {}
+        self._records: Dict[str, List[EqRecord]] = {}
+        self._symtab = SymbolTable()
+        self._kernels: Dict[tuple, tuple] = {}
+        self._solved: Dict[tuple, List[dict]] = {}
+        self._solve_timeouts: Dict[tuple, float] = {}   # solve_for key -> budget it ran out of
+        self.index: Dict[str, List[EqRef]] = {}   # symbol name -> [(tag, i), ...]
+        self._jacobians: Dict[tuple, sp.Matrix] = {}
+        self._bound: OrderedDict[tuple, BoundResidual] = OrderedDict()
+        self.stats = CoreStats()
 
     @staticmethod
     def _lines_from_block(body: str) -> List[str]:
@@ -228,12 +1361,50 @@ class CoreEqs:
         return [ln.strip() for ln in lines if ln.strip()]
 
     @staticmethod
-    def _to_expr_or_eq(line: str) -> ExprOrEq:
-        cleaned = _normalize_for_parsers(line)
+    def _to_expr_or_eq(line: str, cleaned: Optional[str] = None) -> ExprOrEq:
+        # ``cleaned``: _normalize_for_parsers(line), if the caller already has it
+        if cleaned is None:
+            t = time.perf_counter()
+            cleaned = _normalize_for_parsers(line)
+            _clock('normalize', t)
+        done = _is_normal(cleaned)
         if '=' in cleaned:
             lhs, rhs = cleaned.split('=', 1)
-            return sp.Eq(_parse_latex_expr(lhs), _parse_latex_expr(rhs))
-        return _parse_latex_expr(cleaned)
+            return sp.Eq(_parse_latex_expr(lhs, done), _parse_latex_expr(rhs, done))
+        return _parse_latex_expr(cleaned, done)
+
+    @classmethod
+    def _parse_line(cls, line: str, cache: Optional[ParseCache]) -> ExprOrEq:
+        if cache is None:
+            return cls._to_expr_or_eq(line)
+        t = time.perf_counter()
+        key = _normalize_for_parsers(line)
+        t = _clock('normalize', t)
+        try:
+            hit = cache.get(key)
+        except sqlite3.Error as e:
+            # an unreadable cache must not turn into a skipped line: parse uncached
+            _clock('cache', t)
+            print(f"[core_eqs] Parse cache lookup failed ({cache.path}): {e}", file=sys.stderr)
+            return cls._to_expr_or_eq(line, key)
+        if hit is not None:
+            ok, payload = hit
+            if ok:
+                obj = _from_srepr(payload)
+                _clock('cache', t)
+                return obj
+            _clock('cache', t)
+            raise _CachedFailure(payload)
+        _clock('cache', t)
+        try:
+            obj = cls._to_expr_or_eq(line, key)
+        except Exception as e:
+            cache.put(key, False, f"{type(e).__name__}: {e}")
+            raise
+        t = time.perf_counter()
+        cache.put(key, True, sp.srepr(obj))
+        _clock('cache', t)
+        return obj
 
     @staticmethod
     def _residual_of(obj: ExprOrEq) -> sp.Expr:
@@ -244,59 +1415,998 @@ class CoreEqs:
         return sorted(expr.free_symbols, key=lambda s: s.name)
 
     @classmethod
-    def from_tex(cls, tex_path: str) -> 'CoreEqs':
+    def _parse_block(cls, tag: str, lines: List[str], cache: Optional[ParseCache],
+                     stats: Optional[CoreStats] = None) -> List[ExprOrEq]:
+        exprs: List[ExprOrEq] = []
+        for line in lines:
+            before = parse_path_counts()
+            t0 = time.perf_counter()
+            try:
+                obj = cls._parse_line(line, cache)
+            except _CachedFailure as e:
+                print(f"[core_eqs] Skipping unparsable line for tag {tag!r}: {line!r}", file=sys.stderr)
+                print(f"[core_eqs] Reason (cached): {e}", file=sys.stderr)
+                obj = None
+            except Exception as e:
+                print(f"[core_eqs] Skipping unparsable line for tag {tag!r}: {line!r}", file=sys.stderr)
+                print(f"[core_eqs] Reason: {type(e).__name__}: {e}", file=sys.stderr)
+                obj = None
+            if obj is None:
+                _clock('skipped', t0)
+            else:
+                exprs.append(obj)
+            if stats is not None:
+                stats.lines.append((time.perf_counter() - t0, tag, _line_path(before), line))
+                stats.skipped += obj is None
+        return exprs
+
+    def _add_block(self, tag: str, exprs: List[ExprOrEq]) -> None:
+        t = time.perf_counter()
+        residuals = [self._residual_of(obj) for obj in exprs]
+        t = _clock('residual', t)
+        for name in {n for rec in self._records.get(tag, []) for n in rec.names}:
+            self.index[name] = [ref for ref in self.index[name] if ref[0] != tag]
+        table = self._symtab
+        recs = []
+        for i, (obj, rr) in enumerate(zip(exprs, residuals)):
+            rec = EqRecord(tag, i, obj, table, *table.add_run(self._symbols_of(rr)))
+            ref = (tag, i)   # one tuple shared by every symbol's index entry
+            for name in rec.names:
+                self.index.setdefault(name, []).append(ref)
+            recs.append(rec)
+        self._records[tag] = recs
+        _clock('free_symbols', t)
+
+    @classmethod
+    def from_tex(cls, tex_path: str, cache: Union[ParseCache, bool, None] = True,
+                 workers: int = 0) -> 'CoreEqs':
+        """
+        Parse every tagged block of ``tex_path``.
+
+        ``cache=True`` uses the shared on-disk ParseCache (see CORE_EQS_CACHE),
+        a ParseCache instance uses that cache, and False/None parses everything.
+        ``workers > 1`` parses blocks in a process pool; tag order and the
+        skip-and-log output are the same as a serial run.
+        """
         with open(tex_path, 'r', encoding='utf-8') as f:
             src = f.read()
+        blocks = [(m.group('tag').strip(), cls._lines_from_block(m.group('body')))
+                  for m in _EQN_BLOCK_RE.finditer(src)]
+        return cls.from_blocks(blocks, cache=cache, workers=workers)
+
+    @classmethod
+    def from_blocks(cls, blocks: List[Tuple[str, List[str]]],
+                    cache: Union[ParseCache, bool, None] = True, workers: int = 0) -> 'CoreEqs':
+        """
+        Parse (tag, [LaTeX line, ...]) blocks, e.g. only the blocks of a document
+        that changed since the last build; ``cache`` and ``workers`` as in from_tex().
+        """
+        if cache is True:
+            cache = ParseCache.default()
+        cache = cache or None
 
         out = cls()
+        stats = out.stats
+        start = time.perf_counter()
+        stages_before = stage_times()
+        paths_before = parse_path_counts()
+        if workers > 1 and len(blocks) > 1:
+            for tag, exprs in _parse_blocks_parallel(blocks, workers, cache, stats):
+                t0 = time.perf_counter()
+                out._add_block(tag, exprs)
+                stats.tags[tag] = stats.tags.get(tag, 0.0) + time.perf_counter() - t0
+        else:
+            for tag, lines in blocks:
+                t0 = time.perf_counter()
+                out._add_block(tag, cls._parse_block(tag, lines, cache, stats))
+                stats.tags[tag] = stats.tags.get(tag, 0.0) + time.perf_counter() - t0
 
-        for m in _EQN_BLOCK_RE.finditer(src):
-            body = m.group('body')
-            tag = m.group('tag').strip()
-            lines = cls._lines_from_block(body)
+        if cache is not None:
+            t0 = time.perf_counter()
+            cache.flush()
+            _clock('cache', t0)
 
-            exprs: List[ExprOrEq] = []
-            residuals: List[sp.Expr] = []
-            sym_lists: List[List[sp.Symbol]] = []
+        for k, (n, t) in stage_times().items():
+            n0, t0 = stages_before.get(k, (0, 0.0))
+            if n > n0:
+                stats.stages[k] = [n - n0, t - t0]
+        stats.paths = {k: v - paths_before[k] for k, v in parse_path_counts().items()}
+        stats.total = time.perf_counter() - start
+        return out
 
-            for line in lines:
-                try:
-                    obj = cls._to_expr_or_eq(line)
-                except Exception as e:
-                    print(f"[core_eqs] Skipping unparsable line for tag {tag!r}: {line!r}", file=sys.stderr)
-                    print(f"[core_eqs] Reason: {type(e).__name__}: {e}", file=sys.stderr)
-                    continue
-                exprs.append(obj)
-                rr = cls._residual_of(obj)
-                residuals.append(rr)
-                sym_lists.append(cls._symbols_of(rr))
+    @classmethod
+    def from_exprs(cls, blocks: Mapping[str, List[ExprOrEq]]) -> 'CoreEqs':
+        """
+        A CoreEqs of lines that are already parsed: tag -> [Eq or expression, ...] in
+        line order, e.g. rebuilt from recorded srepr strings. Nothing is parsed.
+        """
+        out = cls()
+        start = time.perf_counter()
+        for tag, exprs in blocks.items():
+            out._add_block(tag, list(exprs))
+        out.stats.total = time.perf_counter() - start
+        return out
+
+    # ---------------- records and their dict views ----------------
 
-            out.eqs[tag] = exprs
-            out.residuals[tag] = residuals
-            out.symbols[tag] = sym_lists
+    @property
+    def eqs(self) -> Mapping[str, List[ExprOrEq]]:
+        """tag -> parsed Eq (or expression) of each line; read-only view."""
+        return _RecordView(self._records, 'obj')
 
+    @property
+    def residuals(self) -> Mapping[str, List[sp.Expr]]:
+        """
+        tag -> residual of each line, derived on access (every line of the tag; use
+        residual(tag, i) for one); read-only view.
+        """
+        return _RecordView(self._records, 'residual')
+
+    @property
+    def symbols(self) -> Mapping[str, List[List[sp.Symbol]]]:
+        """tag -> name-sorted free symbols of each line; read-only view."""
+        return _RecordView(self._records, 'symbols')
+
+    def records(self, tags: Optional[List[str]] = None) -> Iterator[EqRecord]:
+        """Every line as an EqRecord, tag by tag (sorted, or in the order of ``tags``)."""
+        for tag in self.tags() if tags is None else tags:
+            yield from self._records[tag]
+
+    def _record(self, tag: str, i: int) -> EqRecord:
+        if tag not in self._records:
+            raise KeyError(f"Unknown tag {tag!r}. Available: {self.tags()}")
+        recs = self._records[tag]
+        if i < 0 or i >= len(recs):
+            raise KeyError(f"Unknown equation index for tag {tag!r} i={i}")
+        return recs[i]
+
+    def dumps(self) -> str:
+        """
+        The parsed lines as JSON: the symbol table once, then per tag each line's
+        srepr with its symbol ids. loads() rebuilds an equal CoreEqs without walking
+        the expressions for their free symbols again.
+        """
+        import json
+        table = self._symtab
+        used = sorted({k for rec in self.records() for k in rec.symbol_ids})
+        renum = {k: j for j, k in enumerate(used)}
+        return json.dumps({
+            'symbols': [sp.srepr(table.symbols[k]) for k in used],
+            'tags': {tag: [[sp.srepr(rec.obj), [renum[k] for k in rec.symbol_ids]]
+                           for rec in recs] for tag, recs in self._records.items()},
+        })
+
+    @classmethod
+    def loads(cls, s: str) -> 'CoreEqs':
+        import json
+        data = json.loads(s)
+        out = cls()
+        table = out._symtab
+        ids = [table.intern(_from_srepr(rep)) for rep in data['symbols']]
+        for tag, lines in data['tags'].items():
+            recs = []
+            for i, (rep, run) in enumerate(lines):
+                start = len(table.runs)
+                table.runs.extend(ids[k] for k in run)
+                rec = EqRecord(tag, i, _from_srepr(rep), table, start, len(run))
+                ref = (tag, i)
+                for name in rec.names:
+                    out.index.setdefault(name, []).append(ref)
+                recs.append(rec)
+            out._records[tag] = recs
         return out
 
     # ---------------- convenience API ----------------
 
     def tags(self) -> List[str]:
-        return sorted(self.eqs.keys())
+        return sorted(self._records)
+
+    def residual(self, tag: str, i: int) -> sp.Expr:
+        """The residual of line ``i`` of ``tag``, derived from that line alone."""
+        return self._record(tag, i).residual
 
     def substitute(self, tag: str, subs: dict) -> List[sp.Expr]:
-        if tag not in self.residuals:
+        if tag not in self._records:
             raise KeyError(f"Unknown tag {tag!r}. Available: {self.tags()}")
-        return [r.subs(subs) for r in self.residuals[tag]]
+        t0 = time.perf_counter()
+        out = [rec.residual.subs(subs) for rec in self._records[tag]]
+        self.stats.record_call('substitute', tag, t0)
+        return out
 
-    def solve_for(self, tag: str, var: Union[sp.Symbol, str], params: Optional[dict] = None):
-        if tag not in self.residuals:
+    # bind() keeps this many BoundResidual objects, least recently used dropped first
+    BIND_CACHE_SIZE = 256
+
+    def bind(self, tag: str, i: int, **fixed) -> BoundResidual:
+        """
+        Residual ``i`` of ``tag`` with ``fixed`` (values by symbol name) substituted,
+        as a BoundResidual to call repeatedly with only the remaining values.
+
+        Names that are not symbols of the residual are ignored, so one dict of
+        constants can be bound to every line. Results are kept in an LRU cache keyed
+        by (tag, i, the fixed values it uses), so binding the same constants again
+        returns the same object and its compiled kernel.
+        """
+        t0 = time.perf_counter()
+        rec = self._record(tag, i)
+        syms = {s.name: s for s in rec.symbols}
+        fixed = {n: v for n, v in fixed.items() if n in syms}
+        try:
+            key = (tag, i, frozenset(fixed.items()))
+            hash(key)
+        except TypeError:
+            key = None
+        bound = self._bound.get(key) if key is not None else None
+        if bound is not None:
+            self._bound.move_to_end(key)
+        else:
+            bound = BoundResidual(tag, i, rec.residual, syms, fixed)
+            if key is not None:
+                self._bound[key] = bound
+                if len(self._bound) > self.BIND_CACHE_SIZE:
+                    self._bound.popitem(last=False)
+        self.stats.record_call('bind', tag, t0)
+        return bound
+
+    def solve_for(self, tag: str, var: Union[sp.Symbol, str], params: Optional[dict] = None,
+                  numeric: bool = False, guess=None, line: Optional[int] = None,
+                  tol: float = 1e-10, maxiter: int = 50, timeout: Optional[float] = None):
+        """
+        Solve the residuals of ``tag`` for ``var`` with ``params`` substituted.
+
+        By default this is ``sp.solve`` (memoized per tag, var and params) and returns
+        a list of solution dicts. ``numeric=True`` instead solves one residual (the only
+        line of ``tag`` containing ``var``, or ``line``) with a vectorized Newton
+        iteration over NumPy arrays: ``params`` values may be arrays and broadcast
+        against each other, ``guess`` is a starting value (array or scalar, default 1)
+        or a ``(lo, hi)`` bracket that keeps every step inside a sign change. Returns a
+        NumericSolution with the root and convergence of each point.
+
+        ``timeout=S`` bounds the symbolic solve: ``sp.solve`` runs in the shared
+        SolveWorker process for at most S seconds, and when it times out, fails or finds
+        nothing the numeric solve above runs instead (which needs values for the other
+        symbols in ``params``). Returns a SolveResult; a timeout is remembered, so later
+        calls with no larger budget go straight to the fallback.
+        """
+        if tag not in self._records:
             raise KeyError(f"Unknown tag {tag!r}. Available: {self.tags()}")
+        t0 = time.perf_counter()
         var_sym = sp.Symbol(var) if isinstance(var, str) else var
-        eqs = self.residuals[tag]
+        if numeric:
+            try:
+                return self._solve_numeric(tag, var_sym, params or {}, guess, line, tol, maxiter)
+            finally:
+                self.stats.record_call('solve_for', tag, t0)
+        try:
+            key = (tag, var_sym, frozenset((params or {}).items()))
+            hash(key)
+        except TypeError:
+            key = None
+        try:
+            if timeout is not None:
+                return self._solve_bounded(tag, var_sym, params or {}, key, timeout, guess,
+                                           line, tol, maxiter, t0)
+            sols = self._solved.get(key) if key is not None else None
+            if sols is None:
+                sols = sp.solve(*self._solve_args(tag, var_sym, params), dict=True)
+                if key is not None:
+                    self._solved[key] = sols
+            return [dict(d) for d in sols]
+        finally:
+            self.stats.record_call('solve_for', tag, t0)
+
+    def _solve_args(self, tag: str, var: sp.Symbol, params: Optional[dict]):
+        eqs = [rec.residual for rec in self._records[tag]]
         if params:
             eqs = [e.subs(params) for e in eqs]
         if len(eqs) == 1:
-            return sp.solve(sp.Eq(eqs[0], 0), var_sym, dict=True)
-        return sp.solve([sp.Eq(e, 0) for e in eqs], [var_sym], dict=True)
+            return sp.Eq(eqs[0], 0), var
+        return [sp.Eq(e, 0) for e in eqs], [var]
+
+    def _solve_bounded(self, tag: str, var: sp.Symbol, params: dict, key: Optional[tuple],
+                       timeout: float, guess, line: Optional[int], tol: float, maxiter: int,
+                       t0: float) -> SolveResult:
+        sols = self._solved.get(key) if key is not None else None
+        arrays = [getattr(k, 'name', k) for k, v in params.items()
+                  if isinstance(v, (list, tuple)) or getattr(v, 'ndim', 0)]
+        if arrays:
+            # no single closed form to substitute point values into: solve point by point
+            reason = f'array values for {arrays}'
+        elif sols is None:
+            spent = self._solve_timeouts.get(key, 0.0) if key is not None else 0.0
+            if spent >= timeout:
+                reason = f'sp.solve timed out after {spent:g}s before'
+            else:
+                status, payload = solve_worker().solve(*self._solve_args(tag, var, params),
+                                                       timeout)
+                if status == 'ok':
+                    sols = payload
+                    if key is not None:
+                        self._solved[key] = sols
+                elif status == 'timeout':
+                    reason = f'sp.solve timed out after {timeout:g}s'
+                    if key is not None:
+                        self._solve_timeouts[key] = timeout
+                else:
+                    reason = f'sp.solve failed: {payload}'
+        if sols:
+            return SolveResult('closed_form', var.name, [dict(d) for d in sols],
+                               seconds=time.perf_counter() - t0)
+        if sols is not None:
+            reason = 'sp.solve found no solution'
+        try:
+            num = self._solve_numeric(tag, var, params, guess, line, tol, maxiter)
+        except (KeyError, ValueError, TypeError) as e:
+            return SolveResult('no_closed_form', var.name, reason=f'{reason}; no numeric fallback: {e}',
+                               seconds=time.perf_counter() - t0)
+        return SolveResult('numeric', var.name, numeric=num, reason=reason,
+                           seconds=time.perf_counter() - t0)
+
+    def _solve_numeric(self, tag: str, var: sp.Symbol, params: dict, guess, line: Optional[int],
+                       tol: float, maxiter: int) -> NumericSolution:
+        if line is None:
+            lines = [i for t, i in self.index.get(var.name, []) if t == tag]
+            if not lines:
+                raise KeyError(f"{var.name!r} does not appear in tag {tag!r}")
+            if len(lines) > 1:
+                raise ValueError(f"{var.name!r} appears in lines {lines} of tag {tag!r}; pass line=")
+            line = lines[0]
+        fn, dfn, names = self._root_kernel(tag, line, var)
+        values = {getattr(k, 'name', k): v for k, v in params.items()}
+        args, shape = _kernel_args(names, values, f"tag {tag!r} i={line}")
+        return find_roots(lambda x: fn(x, *args), lambda x: dfn(x, *args), guess, shape,
+                          tol, maxiter, var.name)
+
+    def _root_kernel(self, tag: str, i: int, var: sp.Symbol):
+        # residual and d(residual)/d(var) compiled with var first, then the other symbols
+        key = ('root', tag, i, var.name)
+        if key not in self._kernels:
+            rec = self._record(tag, i)
+            expr = rec.residual
+            others = [s for s in rec.symbols if s != var]
+            fn = sp.lambdify([var] + others, expr, modules='numpy')
+            dfn = sp.lambdify([var] + others, self.jacobian((tag, i), [var])[0, 0], modules='numpy')
+            self._kernels[key] = (fn, dfn, [s.name for s in others])
+        return self._kernels[key]
+
+    # ---------------- equation/variable graph ----------------
+
+    def equations_with(self, name: Union[sp.Symbol, str]) -> List[EqRef]:
+        """(tag, i) of every residual that involves the symbol ``name``."""
+        return list(self.index.get(getattr(name, 'name', name), []))
+
+    def plan(self, known, targets, tags: Optional[List[str]] = None,
+             max_block: int = 3) -> List[Tuple[List[EqRef], List[str]]]:
+        """
+        Evaluation order for ``targets`` given the ``known`` symbol names.
+
+        Returns [(equations, names), ...]: each step solves its (tag, i) equations for
+        its names once every earlier step is done, and steps the targets do not need
+        are left out. Only residuals of ``tags`` (default: all) are considered; raises
+        ValueError if the knowns do not determine every target.
+        """
+        known = {getattr(k, 'name', k) for k in known}
+        targets = {getattr(k, 'name', k) for k in ([targets] if isinstance(targets, str) else targets)}
+        eq_names = {(rec.tag, rec.i): frozenset(rec.names) for rec in self.records(tags)}
+        return _plan_blocks(eq_names, known, targets, max_block)
+
+    def solve_system(self, known: dict, targets, tags: Optional[List[str]] = None,
+                     numeric: bool = False, guess=None, max_block: int = 3,
+                     tol: float = 1e-10, maxiter: int = 50,
+                     timeout: Optional[float] = None) -> Dict[str, object]:
+        """
+        Solve for ``targets`` by chaining equations along ``plan(known, targets)``.
+
+        Each block is solved on its own: with ``sp.solve`` by default, keeping the real
+        solution (the positive one if there are several; ValueError if that is still
+        ambiguous), or with ``numeric=True`` by vectorized Newton over the (array)
+        values of ``known``. ``guess`` is one start value for every unknown or a dict
+        of them (a ``(lo, hi)`` bracket works for one-equation blocks). Returns the
+        values of every symbol the plan solved for, targets included; numeric points
+        that did not converge are nan. ``timeout=S`` gives each block's ``sp.solve`` S
+        seconds in the SolveWorker process; a block that times out, fails or has no real
+        solution there is solved numerically instead.
+        """
+        t0 = time.perf_counter()
+        try:
+            values = {getattr(k, 'name', k): v for k, v in known.items()}
+            for eqs, names in self.plan(values, targets, tags, max_block):
+                if numeric:
+                    self._solve_block_numeric(eqs, names, values, guess, tol, maxiter)
+                else:
+                    self._solve_block(eqs, names, values, timeout, guess, tol, maxiter)
+            given = {getattr(k, 'name', k) for k in known}
+            return {n: v for n, v in values.items() if n not in given}
+        finally:
+            self.stats.record_call('solve_system', ','.join(tags or ['*']), t0)
+
+    def _solve_block(self, eqs: List[EqRef], names: List[str], values: dict,
+                     timeout: Optional[float] = None, guess=None, tol: float = 1e-10,
+                     maxiter: int = 50) -> None:
+        unknowns = [sp.Symbol(n) for n in names]
+        exprs = []
+        for tag, i in eqs:
+            expr = self.residual(tag, i)
+            exprs.append(expr.subs({sym: values[sym.name] for sym in expr.free_symbols
+                                    if sym.name in values}))
+        if timeout is None:
+            sols = sp.solve(exprs, unknowns, dict=True)
+        else:
+            status, sols = solve_worker().solve(exprs, unknowns, timeout)
+            if status != 'ok':
+                self._solve_block_numeric(eqs, names, values, guess, tol, maxiter)
+                return
+        sols = [d for d in sols if all(u in d for u in unknowns)]
+        sols = [d for d in sols if all(d[u].is_real is not False for u in unknowns)]
+        if len(sols) > 1:
+            sols = [d for d in sols if all(d[u].is_positive for u in unknowns)] or sols
+        if not sols:
+            if timeout is not None:
+                # the bounded path promises a fallback whenever sp.solve has no answer
+                self._solve_block_numeric(eqs, names, values, guess, tol, maxiter)
+                return
+            raise ValueError(f'No real solution for {names} from {eqs}')
+        if len(sols) > 1:
+            raise ValueError(f'{len(sols)} solutions for {names} from {eqs}: {sols}; pass the '
+                             f'intended one in known= or use numeric=True with a guess')
+        for u in unknowns:
+            values[u.name] = sols[0][u]
+
+    def _solve_block_numeric(self, eqs: List[EqRef], names: List[str], values: dict,
+                             guess, tol: float, maxiter: int) -> None:
+        import numpy as np
+        starts = [guess.get(n) if isinstance(guess, dict) else guess for n in names]
+        if len(eqs) == 1:
+            (tag, i), = eqs
+            sol = self._solve_numeric(tag, sp.Symbol(names[0]), values, starts[0], i, tol, maxiter)
+            values[names[0]] = sol.root
+            return
+        fn, jfn, others = self._block_kernel(eqs, names)
+        args = [np.asarray(values[n], dtype=float) for n in others]
+        starts = [np.asarray(1.0 if g is None else (0.5 * (g[0] + g[1]) if isinstance(g, tuple) else g),
+                             dtype=float) for g in starts]
+        shape = np.broadcast_shapes(*(a.shape for a in args + starts))
+        args = [np.broadcast_to(a, shape) for a in args]
+        k = len(names)
+
+        def F(x):
+            return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*x, *args)])
+
+        def J(x):
+            return np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape)
+                             for v in jfn(*x, *args)]).reshape((k, k) + shape)
+
+        x0 = np.stack([np.broadcast_to(g, shape) for g in starts])
+        with np.errstate(all='ignore'):
+            root = _find_roots_nd(F, J, x0, tol, maxiter)[0]
+        for n, r in zip(names, root):
+            values[n] = r
+
+    def _block_kernel(self, eqs: List[EqRef], names: List[str]):
+        # residuals of a coupled block and their Jacobian, flattened row-major
+        key = ('block', tuple(eqs), tuple(names))
+        if key not in self._kernels:
+            exprs = [self.residual(tag, i) for tag, i in eqs]
+            unknowns = [sp.Symbol(n) for n in names]
+            others = sorted({sym for e in exprs for sym in e.free_symbols} - set(unknowns),
+                            key=lambda sym: sym.name)
+            jac = list(self.jacobian(eqs, names))
+            fn = sp.lambdify(unknowns + others, exprs, modules='numpy')
+            jfn = sp.lambdify(unknowns + others, jac, modules='numpy')
+            self._kernels[key] = (fn, jfn, [sym.name for sym in others])
+        return self._kernels[key]
+
+    # ---------------- Jacobians ----------------
+
+    def _refs(self, eqs) -> List[EqRef]:
+        # a tag (all its lines), one (tag, i) or a list of (tag, i)
+        if isinstance(eqs, str):
+            if eqs not in self._records:
+                raise KeyError(f"Unknown tag {eqs!r}. Available: {self.tags()}")
+            return [(eqs, i) for i in range(len(self._records[eqs]))]
+        if isinstance(eqs, tuple) and len(eqs) == 2 and isinstance(eqs[0], str):
+            return [eqs]
+        return [tuple(ref) for ref in eqs]
+
+    def jacobian(self, eqs, wrt=None) -> sp.Matrix:
+        """
+        d(residual)/d(wrt) as a SymPy Matrix with one row per residual.
+
+        ``eqs`` is a tag (all its lines), one ``(tag, i)`` or a list of them, such as
+        the equations of a plan() step; ``wrt`` lists symbols or names and defaults to
+        every symbol of those residuals. Derived once per (eqs, wrt) and cached.
+        """
+        refs = self._refs(eqs)
+        names = self._wrt_names(refs, wrt)
+        key = (tuple(refs), tuple(names))
+        if key not in self._jacobians:
+            exprs = [self.residual(tag, i) for tag, i in refs]
+            self._jacobians[key] = sp.Matrix([[sp.diff(e, sp.Symbol(n)) for n in names] for e in exprs])
+        return self._jacobians[key]
+
+    def _wrt_names(self, refs: List[EqRef], wrt) -> List[str]:
+        if wrt is None:
+            return sorted({n for tag, i in refs for n in self._record(tag, i).names})
+        return [getattr(v, 'name', v) for v in ([wrt] if isinstance(wrt, (str, sp.Symbol)) else wrt)]
+
+    def _jacobian_kernel(self, refs: List[EqRef], wrt):
+        names = self._wrt_names(refs, wrt)
+        key = ('jacobian', tuple(refs), tuple(names))
+        if key not in self._kernels:
+            jac = self.jacobian(refs, names)
+            args = sorted({sym for tag, i in refs for sym in self._record(tag, i).symbols},
+                          key=lambda s: s.name)
+            fn = sp.lambdify(args, list(jac), modules='numpy')
+            self._kernels[key] = (fn, [s.name for s in args], jac.shape)
+        return self._kernels[key]
+
+    def evaluate_jacobian(self, eqs, wrt=None, **arrays):
+        """
+        ``jacobian(eqs, wrt)`` evaluated over NumPy arrays, compiled once and cached.
+
+        Returns shape ``(rows, len(wrt)) + broadcast shape``; keyword names are symbol
+        names as in evaluate(), and every symbol of the residuals needs a value.
+        """
+        import numpy as np
+        t0 = time.perf_counter()
+        refs = self._refs(eqs)
+        fn, names, (m, k) = self._jacobian_kernel(refs, wrt)
+        args, shape = _kernel_args(names, arrays, str(refs))
+        out = np.stack([np.broadcast_to(np.asarray(v, dtype=float), shape) for v in fn(*args)])
+        self.stats.record_call('jacobian', refs[0][0], t0)
+        return out.reshape((m, k) + shape)
+
+    # ---------------- compiled batch evaluation ----------------
+
+    def _kernel(self, tag: str, i: int):
+        key = (tag, i)
+        if key not in self._kernels:
+            rec = self._record(tag, i)
+            syms = rec.symbols
+            fn = sp.lambdify(syms, rec.residual, modules='numpy')
+            self._kernels[key] = (fn, [s.name for s in syms])
+        return self._kernels[key]
+
+    def evaluate(self, tag: str, i: int, **arrays):
+        """
+        Evaluate residual ``i`` of ``tag`` numerically over NumPy arrays.
+
+        Keyword names are the SymPy symbol names (use ``**{'p_{cns}': ...}`` for
+        braced names); inputs broadcast against each other and extra keys are
+        ignored. The residual is lambdified once and the kernel is cached.
+        """
+        import numpy as np
+        t0 = time.perf_counter()
+        fn, names = self._kernel(tag, i)
+        args, shape = _kernel_args(names, arrays, f"tag {tag!r} i={i}")
+        out = np.asarray(fn(*args), dtype=float)
+        if out.shape != shape:
+            out = np.broadcast_to(out, shape).copy()
+        self.stats.record_call('evaluate', tag, t0)
+        return out
+
+# --------------------------------------------------------------------------------------
+# Process-pool block parsing (CoreEqs.from_tex(workers=N))
+# --------------------------------------------------------------------------------------
+
+_WORKER_CACHE: Optional[ParseCache] = None
+
+def _parse_worker_init(cache_path: Optional[str], max_entries: int) -> None:
+    global _WORKER_CACHE
+    _WORKER_CACHE = None
+    if cache_path:
+        try:
+            _WORKER_CACHE = ParseCache(cache_path, max_entries)
+        except (OSError, sqlite3.Error) as e:
+            print(f"[core_eqs] Parse cache disabled ({cache_path}): {e}", file=sys.stderr)
+
+def _parse_block_worker(job: Tuple[str, List[str]]):
+    # Results travel back as srepr strings (cheap to pickle) together with the
+    # captured log, which the parent replays in block order, and the parse-path
+    # counts, stage times and per-line timings this block added.
+    import io
+    import contextlib
+    tag, lines = job
+    before = parse_path_counts()
+    stages_before = stage_times()
+    stats = CoreStats()
+    buf = io.StringIO()
+    with contextlib.redirect_stderr(buf):
+        exprs = CoreEqs._parse_block(tag, lines, _WORKER_CACHE, stats)
+    if _WORKER_CACHE is not None:
+        t0 = time.perf_counter()
+        _WORKER_CACHE.flush()
+        _clock('cache', t0)
+    counts = {k: v - before[k] for k, v in _PARSE_COUNTS.items()}
+    stages = {}
+    for k, (n, t) in stage_times().items():
+        n0, t0 = stages_before.get(k, (0, 0.0))
+        if n > n0:
+            stages[k] = (n - n0, t - t0)
+    return [sp.srepr(e) for e in exprs], buf.getvalue(), counts, stages, stats.lines
+
+def _parse_blocks_parallel(blocks: List[Tuple[str, List[str]]], workers: int,
+                           cache: Optional[ParseCache], stats: Optional[CoreStats] = None):
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor
+    # fork keeps this working when the module was loaded by path (core-eq.sh),
+    # where spawned children could not re-import it by name.
+    methods = mp.get_all_start_methods()
+    ctx = mp.get_context('fork') if 'fork' in methods else None
+    initargs = (cache.path, cache.max_entries) if cache is not None else (None, 0)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_parse_worker_init, initargs=initargs) as pool:
+        results = pool.map(_parse_block_worker, blocks)
+        for (tag, _), (reps, log, counts, stages, lines) in zip(blocks, results):
+            if log:
+                sys.stderr.write(log)
+            for k, v in counts.items():
+                _PARSE_COUNTS[k] += v
+            for k, (n, t) in stages.items():
+                rec = _STAGE_TIMES.setdefault(k, [0, 0.0])
+                rec[0] += n
+                rec[1] += t
+            t0 = time.perf_counter()
+            exprs = [_from_srepr(r) for r in reps]
+            if stats is not None:
+                stats.lines.extend(lines)
+                stats.skipped += len(lines) - len(reps)
+                stats.tags[tag] = sum(ln[0] for ln in lines) + time.perf_counter() - t0
+            yield tag, exprs
+
+# --------------------------------------------------------------------------------------
+# Warm daemon (core_eqs.py --serve, core_client.py)
+# --------------------------------------------------------------------------------------
+#
+# One JSON object per line over a Unix socket. A request is {"op": ..., "id": ...,
+# args...}; the reply is {"id": ..., "ok": true, "result": ...} or {"id": ...,
+# "ok": false, "error": "Type: message"}. Requests on one connection are answered in
+# order; connections are served concurrently.
+#
+#   ping                                  pid, uptime, loaded documents, request count
+#   load      tex [jobs]                  parse a document (kept until its mtime changes)
+#   parse     lines                       srepr of each LaTeX line, or null if unparsable
+#   evaluate  tex tag i values            CoreEqs.evaluate, arrays as nested lists
+#   solve     tex tag var [params numeric guess line tol maxiter timeout]
+#   solve_system  tex known targets [tags numeric guess max_block tol maxiter timeout]
+#   stats     tex [top]                   CoreStats.as_dict of that document
+#   generate  core_eqs_py tex out_py name out_num manifest [source codegen cwd env]
+#             core_codegen.py's generate() (build(), extracting tex first, with a source
+#             .tex) in a process forked from this one, so SymPy and the parsers are warm,
+#             with the caller's cwd and environment; the result is {"status": its exit
+#             status, "output": what it printed}
+#   shutdown
+#
+# Requests run on a pool of worker threads (CoreDaemon.WORKERS), so the event loop
+# stays free and a long load of one document does not hold up calls on another.
+# Requests on the same document (the same ``tex``) wait for each other, since CoreEqs
+# memoizes into plain dicts; each worker thread has its own parse cache connection, as
+# a sqlite connection belongs to the thread that opened it. `core-eq.sh` with
+# CORE_EQS_SOCKET set builds through `generate` (core_client.py build) and falls back
+# to its own interpreter when no daemon answers.
+
+def default_socket_path() -> str:
+    env = os.environ.get('CORE_EQS_SOCKET')
+    if env:
+        return env
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'core_eqs', 'daemon.sock')
+
+def _jsonable(obj):
+    # numbers stay numbers, arrays become nested lists, anything symbolic goes out as srepr
+    import numpy as np
+    if isinstance(obj, dict):
+        return {getattr(k, 'name', str(k)): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, NumericSolution):
+        return {'var': obj.var, 'root': obj.root.tolist(), 'converged': obj.converged.tolist(),
+                'residual': obj.residual.tolist(), 'iterations': obj.iterations.tolist()}
+    if isinstance(obj, SolveResult):
+        return {'status': obj.status, 'var': obj.var, 'solutions': _jsonable(obj.solutions),
+                'numeric': _jsonable(obj.numeric), 'reason': obj.reason, 'seconds': obj.seconds}
+    if isinstance(obj, sp.Basic):
+        if obj.is_Number and obj.is_real:
+            return int(obj) if obj.is_Integer else float(obj)
+        return sp.srepr(obj)
+    return obj
+
+def _generate_child(conn, warm: bool, codegen: str, args: tuple, source: Optional[str],
+                    cwd: Optional[str], env: Optional[dict]) -> None:
+    # the forked side of the daemon's generate op: the caller's cwd and environment,
+    # this module as the codegen's core_eqs if it is the same, unchanged file
+    import io
+    import traceback
+    import contextlib
+    import importlib.util
+    global _SOLVE_WORKER
+    _SOLVE_WORKER = None   # the daemon's; this process starts its own if it needs one
+    if warm:
+        sys.modules['core_eqs'] = sys.modules[__name__]
+    else:
+        sys.modules.pop('core_eqs', None)
+    out = io.StringIO()
+    status = 0
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+        try:
+            if cwd:
+                os.chdir(cwd)
+            if env is not None:
+                os.environ.clear()
+                os.environ.update(env)
+            spec = importlib.util.spec_from_file_location('core_codegen', codegen)
+            mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(mod)
+            if source:
+                core_eqs_py, tex, out_py, name, out_num, manifest = args
+                mod.build(source, tex, name, core_eqs_py, out_py, out_num, manifest)
+            else:
+                mod.generate(*args)
+        except SystemExit as e:
+            status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if not isinstance(e.code, (int, type(None))):
+                print(e.code)
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+    conn.send((status, out.getvalue()))
+    conn.close()
+
+def _guess_arg(guess):
+    # JSON has no tuples: a two-element list is a (lo, hi) bracket
+    if isinstance(guess, list) and len(guess) == 2 and not isinstance(guess[0], list):
+        return tuple(guess)
+    return guess
+
+class CoreDaemon:
+    """
+    State behind ``core_eqs.py --serve``: loaded documents (LRU, at most
+    ``MAX_DOCUMENTS``, reloaded when the file changes) and with them their compiled
+    kernels and solve caches, plus the parse cache. Requests run on ``workers``
+    threads (default ``WORKERS``), one at a time per document. See the protocol above.
+    """
+
+    MAX_DOCUMENTS = 16
+    WORKERS = 4
+
+    def __init__(self, path: str, cache: bool = True, workers: Optional[int] = None):
+        import threading
+        import weakref
+        from concurrent.futures import ThreadPoolExecutor
+        self.path = path
+        self.use_cache = cache
+        self.started = time.time()
+        self.requests = 0
+        self._docs: OrderedDict[str, Tuple[Tuple[int, int], CoreEqs]] = OrderedDict()
+        self._docs_mutex = threading.Lock()   # _docs itself; loading runs outside it
+        self._local = threading.local()       # per worker thread: its ParseCache
+        self._pool = ThreadPoolExecutor(max_workers=workers or self.WORKERS,
+                                        thread_name_prefix='core_eqs-doc')
+        # document path -> asyncio.Lock, alive while a request on it holds or waits for it
+        self._doc_locks = weakref.WeakValueDictionary()
+        self._server = None
+        st = os.stat(__file__)
+        self._source_stamp = (st.st_mtime_ns, st.st_size)   # see _op_generate
+
+    # ---------------- document side (worker threads) ----------------
+
+    def _parse_cache(self) -> Optional[ParseCache]:
+        # one connection per thread; loads and parse requests flush it when done
+        if not hasattr(self._local, 'cache'):
+            self._local.cache = ParseCache.default() if self.use_cache else None
+        return self._local.cache
+
+    def _document(self, tex: str, jobs: int = 0) -> Tuple[CoreEqs, bool]:
+        tex = os.path.abspath(tex)
+        st = os.stat(tex)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._docs_mutex:
+            hit = self._docs.get(tex)
+            if hit is not None and hit[0] == stamp:
+                self._docs.move_to_end(tex)
+                return hit[1], True
+        ce = CoreEqs.from_tex(tex, cache=self._parse_cache(), workers=jobs)
+        with self._docs_mutex:
+            self._docs[tex] = (stamp, ce)
+            self._docs.move_to_end(tex)
+            while len(self._docs) > self.MAX_DOCUMENTS:
+                self._docs.popitem(last=False)
+        return ce, False
+
+    def _op_load(self, tex: str, jobs: int = 0):
+        ce, warm = self._document(tex, jobs)
+        return {'tags': ce.tags(), 'lines': sum(1 for _ in ce.records()),
+                'skipped': ce.stats.skipped, 'seconds': ce.stats.total, 'warm': warm}
+
+    def _op_parse(self, lines: List[str]):
+        cache = self._parse_cache()
+        out = []
+        for line in lines:
+            try:
+                out.append(sp.srepr(CoreEqs._parse_line(line, cache)))
+            except Exception:
+                out.append(None)
+        if cache is not None:
+            cache.flush()
+        return out
+
+    def _op_evaluate(self, tex: str, tag: str, i: int, values: dict):
+        ce, _ = self._document(tex)
+        return ce.evaluate(tag, int(i), **values)
+
+    def _op_solve(self, tex: str, tag: str, var: str, params: Optional[dict] = None,
+                  numeric: bool = False, guess=None, line: Optional[int] = None,
+                  tol: float = 1e-10, maxiter: int = 50, timeout: Optional[float] = None):
+        ce, _ = self._document(tex)
+        params = params or {}
+        if not numeric:
+            params = {sp.Symbol(k): v for k, v in params.items()}
+        return ce.solve_for(tag, var, params, numeric=numeric, guess=_guess_arg(guess),
+                            line=line, tol=tol, maxiter=maxiter, timeout=timeout)
+
+    def _op_solve_system(self, tex: str, known: dict, targets, tags: Optional[List[str]] = None,
+                         numeric: bool = False, guess=None, max_block: int = 3,
+                         tol: float = 1e-10, maxiter: int = 50, timeout: Optional[float] = None):
+        ce, _ = self._document(tex)
+        if isinstance(guess, dict):
+            guess = {k: _guess_arg(v) for k, v in guess.items()}
+        else:
+            guess = _guess_arg(guess)
+        return ce.solve_system(known, targets, tags=tags, numeric=numeric, guess=guess,
+                               max_block=max_block, tol=tol, maxiter=maxiter, timeout=timeout)
+
+    def _op_stats(self, tex: str, top: int = 10):
+        ce, _ = self._document(tex)
+        return ce.stats.as_dict(top)
+
+    def _op_generate(self, core_eqs_py: str, tex: str, out_py: str, name: str, out_num: str,
+                     manifest: str, source: Optional[str] = None, codegen: Optional[str] = None,
+                     cwd: Optional[str] = None, env: Optional[dict] = None):
+        import multiprocessing as mp
+        codegen = codegen or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                          'core_codegen.py')
+        # the child reuses this module only if core_eqs_py is this file, unedited since
+        # the daemon started; otherwise the codegen loads core_eqs_py itself
+        path = os.path.join(cwd or '', core_eqs_py)
+        st = os.stat(path)
+        warm = (os.path.samefile(path, __file__)
+                and (st.st_mtime_ns, st.st_size) == self._source_stamp)
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork') if 'fork' in methods else mp.get_context()
+        parent, child = ctx.Pipe()
+        # not a daemonic process: the codegen may start parse workers of its own
+        proc = ctx.Process(target=_generate_child, name='core_eqs-generate',
+                           args=(child, warm, codegen,
+                                 (core_eqs_py, tex, out_py, name, out_num, manifest),
+                                 source, cwd, env))
+        proc.start()
+        child.close()
+        try:
+            status, output = parent.recv()
+        except EOFError:
+            proc.join()
+            raise RuntimeError(f'the codegen process died (exit code {proc.exitcode})') from None
+        finally:
+            parent.close()
+            proc.join()
+        return {'status': status, 'output': output}
+
+    def _op_ping(self):
+        with self._docs_mutex:
+            docs = list(self._docs)
+        return {'pid': os.getpid(), 'uptime': time.time() - self.started,
+                'documents': docs, 'requests': self.requests}
+
+    # ---------------- connections ----------------
+
+    _DOC_OPS = ('load', 'parse', 'evaluate', 'solve', 'solve_system', 'stats', 'generate')
+
+    @staticmethod
+    async def _send(writer, msg: dict) -> None:
+        import json
+        writer.write(json.dumps(msg).encode('utf-8') + b'\n')
+        await writer.drain()
+
+    async def _handle(self, req: dict, writer):
+        import asyncio
+        op = req.pop('op', None)
+        req_id = req.pop('id', None)
+        self.requests += 1
+        try:
+            if op == 'ping':
+                result = self._op_ping()
+            elif op == 'shutdown':
+                self._server.close()
+                result = {'pid': os.getpid()}
+            elif op in self._DOC_OPS:
+                fn = getattr(self, f'_op_{op}')
+                loop = asyncio.get_running_loop()
+                if 'tex' in req:
+                    key = os.path.abspath(os.path.join(str(req.get('cwd') or ''), str(req['tex'])))
+                    lock = self._doc_locks.get(key)
+                    if lock is None:
+                        lock = self._doc_locks[key] = asyncio.Lock()
+                    async with lock:
+                        result = await loop.run_in_executor(
+                            self._pool, lambda: _jsonable(fn(**req)))
+                else:
+                    result = await loop.run_in_executor(self._pool, lambda: _jsonable(fn(**req)))
+            else:
+                raise ValueError(f'Unknown op {op!r}')
+            reply = {'id': req_id, 'ok': True, 'result': result}
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            reply = {'id': req_id, 'ok': False, 'error': f'{type(e).__name__}: {e}'}
+        await self._send(writer, reply)
+
+    async def _connection(self, reader, writer):
+        import json
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    req = json.loads(line)
+                    if not isinstance(req, dict):
+                        raise ValueError('request must be a JSON object')
+                except ValueError as e:
+                    await self._send(writer, {'id': None, 'ok': False,
+                                              'error': f'ValueError: bad request: {e}'})
+                    continue
+                await self._handle(req, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        import asyncio
+        import signal
+        import socket
+        loop = asyncio.get_running_loop()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        if os.path.exists(self.path):
+            probe = socket.socket(socket.AF_UNIX)
+            try:
+                probe.connect(self.path)
+            except OSError:
+                os.unlink(self.path)   # left behind by a daemon that died
+            else:
+                raise RuntimeError(f'A daemon is already listening on {self.path}')
+            finally:
+                probe.close()
+        # requests read any document the daemon can: owner only
+        old_mask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(self._connection, path=self.path,
+                                                           limit=64 * 1024 * 1024)
+        finally:
+            os.umask(old_mask)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._server.close)
+        print(f'[core_eqs] Serving on {self.path} (pid {os.getpid()})', file=sys.stderr)
+        try:
+            await self._server.wait_closed()
+        finally:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            self._pool.shutdown(wait=True)
+
+def serve(path: Optional[str] = None, cache: bool = True, workers: Optional[int] = None) -> None:
+    """Run the daemon on ``path`` (default: default_socket_path()) until shutdown or SIGTERM."""
+    import asyncio
+    # imported once here so every request and forked script starts warm
+    import numpy
+    try:
+        import latex2sympy2
+    except ImportError:
+        pass
+    asyncio.run(CoreDaemon(path or default_socket_path(), cache=cache, workers=workers).serve())
 
 # --------------------------------------------------------------------------------------
 # CLI utility
@@ -319,19 +2429,46 @@ def main():
     ap = argparse.ArgumentParser(description='Load core equations into SymPy.')
     ap.add_argument('--tex', default=None, help='Path to *-equations.tex (defaults to sibling)')
     ap.add_argument('--show', action='store_true', help='Pretty-print tags and equations')
+    ap.add_argument('--no-cache', action='store_true', help='Bypass the on-disk parse cache')
+    ap.add_argument('--rebuild-cache', action='store_true',
+                    help='Clear the on-disk parse cache and re-parse every line')
+    ap.add_argument('--jobs', '-j', type=int, default=0, metavar='N',
+                    help='Parse equation blocks in N worker processes')
+    ap.add_argument('--stats', type=int, nargs='?', const=10, default=None, metavar='N',
+                    help='Print stage timings, per-tag cost and the N slowest lines')
+    ap.add_argument('--serve', nargs='?', const='', default=None, metavar='SOCKET',
+                    help='Run the warm daemon on a Unix socket (default: $CORE_EQS_SOCKET '
+                         'or ~/.cache/core_eqs/daemon.sock); see core_client.py')
+    ap.add_argument('--serve-workers', type=int, default=None, metavar='N',
+                    help=f'Daemon worker threads (default: {CoreDaemon.WORKERS})')
     args = ap.parse_args()
 
+    if args.serve is not None:
+        serve(args.serve or None, cache=not args.no_cache, workers=args.serve_workers)
+        return
     tex = args.tex or _default_equations_path()
-    ce = CoreEqs.from_tex(tex)
+    cache = None if args.no_cache else ParseCache.default()
+    if cache is not None and args.rebuild_cache:
+        cache.clear()
+    ce = CoreEqs.from_tex(tex, cache=cache, workers=args.jobs)
 
     print('Loaded tags:', ', '.join(ce.tags()))
+    counts = parse_path_counts()
+    if sum(counts.values()):
+        # fast-path hits never reach the recursive-descent parser
+        slow = counts['rd'] + counts['latex2sympy2'] + counts['sympy'] + counts['failed']
+        rate = f"{100.0 * counts['rd'] / slow:.0f}%" if slow else 'n/a'
+        print('Parse paths:', ', '.join(f'{k} {v}' for k, v in counts.items()),
+              f'(recursive-descent hit rate {rate})')
+    if args.stats is not None:
+        print(ce.stats.report(top=args.stats))
     if args.show:
         for tag in ce.tags():
             print(f'\nTag {tag}:')
-            for i, (obj, rr, syms) in enumerate(zip(ce.eqs[tag], ce.residuals[tag], ce.symbols[tag])):
-                print(f'  [{i}] sympy: {obj!s}')
-                print(f'      residual: {rr!s}')
-                print(f'      symbols: {[s.name for s in syms]}')
+            for rec in ce.records([tag]):
+                print(f'  [{rec.i}] sympy: {rec.obj!s}')
+                print(f'      residual: {rec.residual!s}')
+                print(f'      symbols: {rec.names}')
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+# core_library.py
+# Usage:
+#   python core_library.py add eqs.sqlite3 ~/classes/AE-4310 ~/classes/AE-4320/2026*/asdf-equations.tex
+#   python core_library.py list eqs.sqlite3
+#   python core_library.py show eqs.sqlite3 AE-4310/202610170445/asdf 1.24
+#   python core_library.py find eqs.sqlite3 M_x
+#
+# One on-disk store (sqlite) for the equations of many documents: generated
+# <name>_core.py modules (their _SREPR table is read with ast, nothing is imported),
+# the *-equations.tex files core-eq.sh writes (parsed with core_eqs.py) or CoreEqs
+# objects.
+# Directories are searched recursively for <name>_core.py. Every line is stored as
+# (document, tag, i) -> residual, and residuals are stored once per distinct canonical
+# form (the srepr of the evaluated expression, so x - 1 and -1 + x are one residual),
+# so the isentropic relations every entry folder repeats take the space of one copy.
+# The srepr kept for display is the first one added, as the parser wrote it.
+# Re-adding a document replaces its lines (unchanged documents are skipped by digest).
+#
+# Opening a Library only opens the database: SymPy (and core_eqs.py) are imported the
+# first time a residual is added or an expression is asked for, and expressions are rebuilt per tag and kept
+# per residual, so a document sharing a residual with another reuses its expression.
+import os
+import re
+import sys
+import ast
+import json
+import time
+import hashlib
+import sqlite3
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS document (
+    id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL, source TEXT NOT NULL,
+    kind TEXT NOT NULL, digest TEXT NOT NULL, added REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS residual (
+    id INTEGER PRIMARY KEY, hash TEXT UNIQUE NOT NULL, srepr TEXT NOT NULL,
+    symbols TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS line (
+    doc INTEGER NOT NULL, tag TEXT NOT NULL, i INTEGER NOT NULL, residual INTEGER NOT NULL,
+    PRIMARY KEY (doc, tag, i));
+CREATE INDEX IF NOT EXISTS line_residual ON line (residual);
+CREATE TABLE IF NOT EXISTS occurs (
+    name TEXT NOT NULL, residual INTEGER NOT NULL, PRIMARY KEY (name, residual));
+'''
+
+_SYMBOL_RE = re.compile(r"Symbol\('((?:[^'\\]|\\.)*)'")
+
+def _symbol_names(srepr: str) -> List[str]:
+    # free symbols straight from the srepr, without SymPy
+    return sorted(set(_SYMBOL_RE.findall(srepr)))
+
+def _canonical_srepr(srepr: str) -> str:
+    # the parser's evaluate=False tree, evaluated: argument order and trivially equal
+    # spellings no longer tell residuals apart
+    sp = _core_eqs().sp
+    return sp.srepr(eval(srepr, {}, vars(sp)))
+
+def _residual_hash(canonical: str) -> str:
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+# PRAGMA user_version: 1 = residual.hash is over the canonical srepr (0: the raw one)
+_HASH_VERSION = 1
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+def tag_key(tag: str) -> list:
+    """Sort key putting tags in document order: 1.2 before 1.10, digit runs compare as numbers."""
+    return [(0, int(p)) if p.isdigit() else (1, p) for p in _DIGITS_RE.split(tag) if p]
+
+def _line_key(ref: Tuple[str, str, int]):
+    return ref[0], tag_key(ref[1]), ref[2]
+
+def _blocks_digest(blocks: Dict[str, List[str]]) -> str:
+    return hashlib.sha256(json.dumps(blocks, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _core_eqs():
+    # expression rebuilding (_from_srepr) and .tex parsing live in core_eqs.py
+    if 'core_eqs' not in sys.modules:
+        spec = importlib.util.spec_from_file_location('core_eqs', os.path.join(HERE, 'core_eqs.py'))
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        sys.modules['core_eqs'] = mod
+    return sys.modules['core_eqs']
+
+# --------------------------------------------------------------------------------------
+# Sources
+# --------------------------------------------------------------------------------------
+
+def module_blocks(path: str) -> Dict[str, List[str]]:
+    """The _SREPR table (tag -> [srepr, ...]) of a generated <name>_core.py, via ast."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for stmt in node.body:
+            target = stmt.target if isinstance(stmt, ast.AnnAssign) else (
+                stmt.targets[0] if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1 else None)
+            if isinstance(target, ast.Name) and target.id == '_SREPR' and stmt.value is not None:
+                return ast.literal_eval(stmt.value)
+    raise ValueError(f'{path}: no _SREPR table (not generated by core-eq.sh?)')
+
+def core_eqs_blocks(ce) -> Dict[str, List[str]]:
+    import sympy as sp
+    blocks: Dict[str, List[str]] = {}
+    for rec in ce.records():
+        blocks.setdefault(rec.tag, []).append(sp.srepr(rec.residual))
+    return blocks
+
+def document_name(path: str, root: Optional[str] = None) -> str:
+    """
+    Default document name: the path below ``root`` (default: cwd), or else its entry
+    folder and file name, without the suffix.
+    """
+    path = os.path.abspath(path)
+    rel = os.path.relpath(path, os.path.abspath(root or os.getcwd()))
+    if rel.startswith('..'):
+        rel = os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path))
+    return re.sub(r'(_core\.py|-equations\.tex|\.tex)$', '', rel).replace(os.sep, '/')
+
+# --------------------------------------------------------------------------------------
+# Library
+# --------------------------------------------------------------------------------------
+
+class Library:
+    """
+    Equations of many documents in one sqlite file, deduplicated per residual.
+
+        lib = Library('eqs.sqlite3')
+        lib.add_path('~/classes/AE-4310')          # every <name>_core.py below it
+        lib.documents()                            # ['AE-4310/202610170445/asdf', ...]
+        lib.residuals('AE-4310/202610170445/asdf', '1.24')   # SymPy, built on first use
+        lib.equations_with('M_x')                  # [(document, tag, i), ...]
+        ce = lib.core_eqs('AE-4310/202610170445/asdf', tags=['1.24', '1.25'])
+
+    Residual ids are stable for the life of the file; residuals no document uses any
+    more are dropped when a document is replaced or removed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.executescript(_SCHEMA)
+        self._exprs: Dict[int, object] = {}   # residual id -> sp.Expr
+        self._canonical: Dict[str, str] = {}  # srepr -> canonical srepr
+        (version,) = self._db.execute('PRAGMA user_version').fetchone()
+        if version < _HASH_VERSION:
+            self._rehash()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'Library':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ---------------- adding documents ----------------
+
+    def add_blocks(self, name: str, blocks: Dict[str, List[str]], source: str = '',
+                   kind: str = 'srepr') -> bool:
+        """
+        Store ``blocks`` (tag -> [residual srepr, ...]) as document ``name``, replacing
+        any earlier version. Returns False if the stored version was identical.
+        """
+        digest = _blocks_digest(blocks)
+        db = self._db
+        row = db.execute('SELECT id, digest FROM document WHERE name = ?', (name,)).fetchone()
+        if row is not None and row[1] == digest:
+            return False
+        with db:
+            if row is not None:
+                db.execute('DELETE FROM line WHERE doc = ?', (row[0],))
+                db.execute('UPDATE document SET source = ?, kind = ?, digest = ?, added = ? '
+                           'WHERE id = ?', (source, kind, digest, time.time(), row[0]))
+                doc = row[0]
+            else:
+                doc = db.execute('INSERT INTO document (name, source, kind, digest, added) '
+                                 'VALUES (?, ?, ?, ?, ?)',
+                                 (name, source, kind, digest, time.time())).lastrowid
+            for tag, reps in blocks.items():
+                for i, rep in enumerate(reps):
+                    db.execute('INSERT INTO line (doc, tag, i, residual) VALUES (?, ?, ?, ?)',
+                               (doc, tag, i, self._residual_id(rep)))
+            if row is not None:
+                self._drop_orphans()
+        return True
+
+    def _canonical_srepr(self, rep: str) -> str:
+        out = self._canonical.get(rep)
+        if out is None:
+            out = self._canonical[rep] = _canonical_srepr(rep)
+        return out
+
+    def _residual_id(self, rep: str) -> int:
+        canonical = self._canonical_srepr(rep)
+        h = _residual_hash(canonical)
+        row = self._db.execute('SELECT id FROM residual WHERE hash = ?', (h,)).fetchone()
+        if row is not None:
+            return row[0]
+        names = _symbol_names(canonical)
+        rid = self._db.execute('INSERT INTO residual (hash, srepr, symbols) VALUES (?, ?, ?)',
+                               (h, rep, json.dumps(names))).lastrowid
+        self._db.executemany('INSERT INTO occurs (name, residual) VALUES (?, ?)',
+                             [(n, rid) for n in names])
+        return rid
+
+    def _rehash(self) -> None:
+        # a library written before hashes were canonical: rehash, merging residuals
+        # that only differed in how they were spelled
+        db = self._db
+        keep: Dict[str, int] = {}
+        rehashed = []
+        with db:
+            for rid, rep in db.execute('SELECT id, srepr FROM residual ORDER BY id').fetchall():
+                canonical = self._canonical_srepr(rep)
+                h = _residual_hash(canonical)
+                if h in keep:
+                    db.execute('UPDATE line SET residual = ? WHERE residual = ?', (keep[h], rid))
+                    db.execute('DELETE FROM occurs WHERE residual = ?', (rid,))
+                    db.execute('DELETE FROM residual WHERE id = ?', (rid,))
+                else:
+                    keep[h] = rid
+                    rehashed.append((h, rid))
+            db.executemany('UPDATE residual SET hash = ? WHERE id = ?', rehashed)
+            db.execute(f'PRAGMA user_version = {_HASH_VERSION}')
+
+    def _drop_orphans(self) -> None:
+        gone = [r for (r,) in self._db.execute(
+            'SELECT id FROM residual WHERE id NOT IN (SELECT residual FROM line)')]
+        self._db.executemany('DELETE FROM occurs WHERE residual = ?', [(r,) for r in gone])
+        self._db.executemany('DELETE FROM residual WHERE id = ?', [(r,) for r in gone])
+        for r in gone:
+            self._exprs.pop(r, None)
+
+    def add_core_eqs(self, name: str, ce, source: str = '') -> bool:
+        return self.add_blocks(name, core_eqs_blocks(ce), source, 'core_eqs')
+
+    def add_module(self, path: str, name: Optional[str] = None, root: Optional[str] = None) -> bool:
+        """Add a generated <name>_core.py (read, not imported)."""
+        return self.add_blocks(name or document_name(path, root), module_blocks(path),
+                               os.path.abspath(path), 'module')
+
+    def add_tex(self, path: str, name: Optional[str] = None, root: Optional[str] = None,
+                cache=True, workers: int = 0) -> bool:
+        """Parse a *-equations.tex written by core-eq.sh with core_eqs.py and add it."""
+        ce = _core_eqs().CoreEqs.from_tex(path, cache=cache, workers=workers)
+        if not ce.tags():
+            raise ValueError(f'{path}: no tagged equations (expected a *-equations.tex from core-eq.sh)')
+        return self.add_blocks(name or document_name(path, root), core_eqs_blocks(ce),
+                               os.path.abspath(path), 'tex')
+
+    def add_path(self, path: str, name: Optional[str] = None, root: Optional[str] = None,
+                 workers: int = 0) -> List[Tuple[str, bool]]:
+        """
+        Add a <name>_core.py, a .tex file, or every <name>_core.py below a directory
+        (named relative to ``root``, default the directory's parent). Returns
+        [(document, added), ...].
+        """
+        path = os.path.expanduser(path)
+        if os.path.isdir(path):
+            root = root or os.path.dirname(os.path.abspath(path))
+            out = []
+            for d, dirs, files in os.walk(path):
+                dirs.sort()
+                for fn in sorted(files):
+                    if fn.endswith('_core.py'):
+                        p = os.path.join(d, fn)
+                        out.append((document_name(p, root), self.add_module(p, root=root)))
+            return out
+        name = name or document_name(path, root)
+        if path.endswith('.tex'):
+            return [(name, self.add_tex(path, name, workers=workers))]
+        return [(name, self.add_module(path, name))]
+
+    def remove(self, name: str) -> None:
+        doc = self._doc_id(name)
+        with self._db:
+            self._db.execute('DELETE FROM line WHERE doc = ?', (doc,))
+            self._db.execute('DELETE FROM document WHERE id = ?', (doc,))
+            self._drop_orphans()
+
+    # ---------------- reading ----------------
+
+    def _doc_id(self, name: str) -> int:
+        row = self._db.execute('SELECT id FROM document WHERE name = ?', (name,)).fetchone()
+        if row is None:
+            raise KeyError(f'Unknown document {name!r}')
+        return row[0]
+
+    def documents(self) -> List[str]:
+        return [n for (n,) in self._db.execute('SELECT name FROM document ORDER BY name')]
+
+    def tags(self, doc: str) -> List[str]:
+        return sorted((t for (t,) in self._db.execute(
+            'SELECT DISTINCT tag FROM line WHERE doc = ?', (self._doc_id(doc),))), key=tag_key)
+
+    def _lines(self, doc: str, tag: str) -> List[Tuple[int, str, str]]:
+        rows = self._db.execute(
+            'SELECT r.id, r.srepr, r.symbols FROM line l JOIN residual r ON r.id = l.residual '
+            'WHERE l.doc = ? AND l.tag = ? ORDER BY l.i', (self._doc_id(doc), tag)).fetchall()
+        if not rows:
+            raise KeyError(f'Unknown tag {tag!r} in document {doc!r}')
+        return rows
+
+    def srepr(self, doc: str, tag: str) -> List[str]:
+        return [rep for _, rep, _ in self._lines(doc, tag)]
+
+    def symbols(self, doc: str, tag: str) -> List[List[str]]:
+        return [json.loads(names) for _, _, names in self._lines(doc, tag)]
+
+    def residuals(self, doc: str, tag: str) -> list:
+        """SymPy residuals of one tag; each distinct residual is built once per Library."""
+        out = []
+        for rid, rep, _ in self._lines(doc, tag):
+            expr = self._exprs.get(rid)
+            if expr is None:
+                expr = self._exprs[rid] = _core_eqs()._from_srepr(rep)
+            out.append(expr)
+        return out
+
+    def residual(self, doc: str, tag: str, i: int):
+        rs = self.residuals(doc, tag)
+        if i < 0 or i >= len(rs):
+            raise KeyError(f'Unknown equation index for tag {tag!r} i={i} in document {doc!r}')
+        return rs[i]
+
+    def equations_with(self, name: str) -> List[Tuple[str, str, int]]:
+        """Every (document, tag, i) whose residual contains the symbol ``name``."""
+        return sorted((tuple(r) for r in self._db.execute(
+            'SELECT d.name, l.tag, l.i FROM occurs o JOIN line l ON l.residual = o.residual '
+            'JOIN document d ON d.id = l.doc WHERE o.name = ?', (name,))), key=_line_key)
+
+    def same_as(self, doc: str, tag: str, i: int) -> List[Tuple[str, str, int]]:
+        """Other (document, tag, i) lines with the same residual (equal once evaluated)."""
+        row = self._db.execute('SELECT residual FROM line WHERE doc = ? AND tag = ? AND i = ?',
+                               (self._doc_id(doc), tag, i)).fetchone()
+        if row is None:
+            raise KeyError(f'Unknown equation {tag!r} i={i} in document {doc!r}')
+        return sorted((tuple(r) for r in self._db.execute(
+            'SELECT d.name, l.tag, l.i FROM line l JOIN document d ON d.id = l.doc '
+            'WHERE l.residual = ? AND NOT (d.name = ? AND l.tag = ? AND l.i = ?)',
+            (row[0], doc, tag, i))), key=_line_key)
+
+    def core_eqs(self, doc: str, tags: Optional[List[str]] = None):
+        """A core_eqs.CoreEqs over ``tags`` of ``doc`` (default: all), for solve_for/plan/..."""
+        return _core_eqs().CoreEqs.from_exprs({tag: self.residuals(doc, tag) for tag in tags or self.tags(doc)})
+
+    def stats(self) -> dict:
+        (docs,) = self._db.execute('SELECT COUNT(*) FROM document').fetchone()
+        (lines,) = self._db.execute('SELECT COUNT(*) FROM line').fetchone()
+        (unique, size) = self._db.execute(
+            'SELECT COUNT(*), COALESCE(SUM(LENGTH(srepr)), 0) FROM residual').fetchone()
+        (full,) = self._db.execute(
+            'SELECT COALESCE(SUM(LENGTH(r.srepr)), 0) FROM line l '
+            'JOIN residual r ON r.id = l.residual').fetchone()
+        return {'documents': docs, 'lines': lines, 'residuals': unique,
+                'srepr_bytes': size, 'srepr_bytes_undeduplicated': full}
+
+# --------------------------------------------------------------------------------------
+# CLI
+# --------------------------------------------------------------------------------------
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='Deduplicated multi-document equation library.')
+    sub = ap.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('add', help='add generated modules, .tex files or directories')
+    p.add_argument('library')
+    p.add_argument('sources', nargs='+')
+    p.add_argument('--name', help='document name (one source only)')
+    p.add_argument('--root', help='name documents relative to this directory')
+    p.add_argument('--jobs', '-j', type=int, default=0, help='parse .tex blocks in N processes')
+    p = sub.add_parser('remove', help='remove documents')
+    p.add_argument('library')
+    p.add_argument('names', nargs='+')
+    p = sub.add_parser('list', help='documents and deduplication totals')
+    p.add_argument('library')
+    p = sub.add_parser('show', help='residuals of a document (one tag or all)')
+    p.add_argument('library')
+    p.add_argument('document')
+    p.add_argument('tag', nargs='?')
+    p = sub.add_parser('find', help='equations containing a symbol')
+    p.add_argument('library')
+    p.add_argument('symbol')
+    args = ap.parse_args()
+
+    if args.cmd != 'add' and not os.path.exists(args.library):
+        raise SystemExit(f'core_library: no library at {args.library}')
+    if args.cmd == 'add' and args.name and len(args.sources) > 1:
+        raise SystemExit('core_library: --name needs exactly one source')
+    with Library(args.library) as lib:
+        try:
+            if args.cmd == 'add':
+                for src in args.sources:
+                    for name, added in lib.add_path(src, args.name, args.root, args.jobs):
+                        print(f'✔ Added: {name}' if added else f'ℹ Unchanged: {name}')
+            elif args.cmd == 'remove':
+                for name in args.names:
+                    lib.remove(name)
+                    print(f'✔ Removed: {name}')
+            elif args.cmd == 'list':
+                for name in lib.documents():
+                    print(f'{name}  ({len(lib.tags(name))} tags)')
+                s = lib.stats()
+                print(f"{s['documents']} documents, {s['lines']} lines, {s['residuals']} distinct "
+                      f"residuals ({s['srepr_bytes']} of {s['srepr_bytes_undeduplicated']} srepr bytes)")
+            elif args.cmd == 'show':
+                for tag in [args.tag] if args.tag else lib.tags(args.document):
+                    print(f'Tag {tag}:')
+                    for i, r in enumerate(lib.residuals(args.document, tag)):
+                        also = len(lib.same_as(args.document, tag, i))
+                        print(f'  [{i}] {r}' + (f'   (also in {also} other line(s))' if also else ''))
+            else:
+                for doc, tag, i in lib.equations_with(args.symbol):
+                    print(f'{doc}  {tag}  [{i}]')
+        except (KeyError, ValueError, OSError) as e:
+            raise SystemExit(f'core_library: {e}')
+
+if __name__ == '__main__':
+    main()
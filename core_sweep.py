@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+# core_sweep.py
+# Usage:
+#   python core_sweep.py asdf_core.py --out sweep-1 --tags 1.24 1.25 \
+#       --grid gamma=1.1:1.4:64 A_x=1:10:1000 --fixed A_t=1 M_x=2
+#   python core_sweep.py asdf_core.py --out sweep-2 --solve 1.26:0:v_x 1.24:0:M_x \
+#       --sample gamma=1.1:1.4 p_x=1e4:1e6 A_x=1:10 --n 5000000 --guess M_x=1:20 \
+#       --fixed R=287 g=1 T_{cns}=3000 p_{cns}=5e6 A_t=1 --jobs 8
+#
+# Parameter sweeps through the classes core-eq.sh generates. Points are either a full
+# grid (name=start:stop:num, or name=v1,v2,...) or uniform random samples
+# (name=lo:hi with --n), split into chunks that a process pool evaluates:
+#   --tags T ...          every residual line of the tags (<name>_numeric.py, one CSE
+#                         kernel per chunk)
+#   --solve TAG:I:VAR ... VAR from line I of TAG: the closed forms of <name>_core.py's
+#                         solve(), one column per solution branch, found once before the
+#                         workers start (sp.solve bounded by --solve-timeout where the
+#                         codegen did not invert VAR); numeric-only symbols use the
+#                         vectorized Newton of core_eqs.py (--guess VAR=x0 or VAR=lo:hi)
+# Every input and output is its own float64 .npy column in --out, created up front with
+# numpy's open_memmap; workers write their chunk's rows straight into the mapped files,
+# so no process ever holds more than one chunk. sweep.json records the columns and the
+# spec; load_sweep() maps them back (grid sweeps reshaped to the grid). Random samples
+# come from one generator per chunk (seeded by --seed and the chunk number), so results
+# do not depend on --jobs.
+import os
+import re
+import sys
+import json
+import time
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CHUNK = 65536
+DEFAULT_SOLVE_TIMEOUT = 30.0
+
+# --------------------------------------------------------------------------------------
+# Generated modules
+# --------------------------------------------------------------------------------------
+
+def _load_module(path: str, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+def module_paths(path: str) -> Tuple[str, str]:
+    """(<name>_core.py, <name>_numeric.py) for either file of a generated pair."""
+    path = os.path.abspath(path)
+    base = re.sub(r'_(core|numeric)\.py$', '', path)
+    return base + '_core.py', base + '_numeric.py'
+
+def _instance(mod):
+    # the generated modules export exactly their class
+    return getattr(mod, mod.__all__[0])()
+
+# --------------------------------------------------------------------------------------
+# Points
+# --------------------------------------------------------------------------------------
+
+def n_points(spec: dict) -> int:
+    if spec['grid']:
+        return int(np.prod([len(v) for v in spec['grid'].values()]))
+    return int(spec['n'])
+
+def chunk_inputs(spec: dict, k: int) -> Tuple[int, int, Dict[str, np.ndarray]]:
+    """Rows [start, stop) of the sweep and the input columns for them."""
+    n = n_points(spec)
+    start = k * spec['chunk']
+    stop = min(n, start + spec['chunk'])
+    if spec['grid']:
+        axes = [np.asarray(v, dtype=float) for v in spec['grid'].values()]
+        coords = np.unravel_index(np.arange(start, stop), [len(a) for a in axes])
+        cols = {name: a[c] for name, a, c in zip(spec['grid'], axes, coords)}
+    else:
+        rng = np.random.default_rng([spec['seed'], k])
+        cols = {name: rng.uniform(lo, hi, stop - start) for name, (lo, hi) in spec['sample'].items()}
+    return start, stop, cols
+
+# --------------------------------------------------------------------------------------
+# Per-process evaluator
+# --------------------------------------------------------------------------------------
+
+def closed_forms(spec: dict, timeout: float) -> List[Optional[List[str]]]:
+    """
+    The solutions (srepr) of each solve entry from <name>_core.py's solve(), None where
+    the symbol is numeric-only; sp.solve gets ``timeout`` seconds for symbols the codegen
+    did not invert. Done once, before any worker starts.
+    """
+    if not spec['solve']:
+        return []
+    import sympy as sp
+    core = _instance(_load_module(spec['core'], 'core_sweep_core'))
+    out = []
+    for tag, i, var in spec['solve']:
+        try:
+            sols = core.solve(tag, i, var, timeout=timeout)
+        except ValueError as e:
+            if not getattr(e, 'numeric_only', False):   # NumericOnlyError
+                raise
+            out.append(None)
+            continue
+        out.append([sp.srepr(s) for s in sols])
+    return out
+
+class _Evaluator:
+    """Loads the numeric class once and turns input columns into output columns."""
+
+    def __init__(self, spec: dict, closed: List[Optional[List[str]]]):
+        self.spec = spec
+        self.num = _instance(_load_module(spec['numeric'], 'core_sweep_numeric'))
+        self.solvers = []   # (tag, i, var, [(names, fn), ...] | None)
+        if spec['solve']:
+            import sympy as sp
+            for (tag, i, var), forms in zip(spec['solve'], closed):
+                if forms is None:
+                    self.solvers.append((tag, i, var, None))
+                    continue
+                fns = []
+                for rep in forms:
+                    s = sp.sympify(rep)
+                    names = sorted(x.name for x in s.free_symbols)
+                    fns.append((names, sp.lambdify([sp.Symbol(n) for n in names], s, modules='numpy')))
+                self.solvers.append((tag, i, var, fns))
+
+    def __call__(self, values: Dict[str, np.ndarray], size: int) -> Dict[str, np.ndarray]:
+        out: Dict[str, np.ndarray] = {}
+        with np.errstate(all='ignore'):
+            if self.spec['tags']:
+                for tag, rows in self.num.evaluate_tags(self.spec['tags'], **values).items():
+                    for i, r in enumerate(rows):
+                        out[residual_column(tag, i)] = r
+            for tag, i, var, fns in self.solvers:
+                if fns is None:
+                    out[solve_column(tag, i, var)] = self._newton(tag, i, var, values, size)
+                    continue
+                for b, (names, fn) in enumerate(fns):
+                    missing = [n for n in names if n not in values]
+                    if missing:
+                        raise KeyError(f"Missing values for {missing} to solve {var!r} from tag {tag!r} i={i}")
+                    col = solve_column(tag, i, var, b if len(fns) > 1 else None)
+                    out[col] = _real(fn(*[values[n] for n in names]))
+        return {c: np.broadcast_to(v, (size,)) for c, v in out.items()}
+
+    def _newton(self, tag: str, i: int, var: str, values: Dict[str, np.ndarray], size: int):
+        k = self.num.symbols(tag, i).index(var)
+        guess = self.spec['guess'].get(var, 1.0)
+        if isinstance(guess, list):
+            guess = tuple(guess)   # a (lo, hi) bracket
+
+        def f(x):
+            return self.num.evaluate(tag, i, **{**values, var: x})
+
+        def df(x):
+            return self.num.evaluate_gradient(tag, i, **{**values, var: x})[k]
+
+        return _core_eqs().find_roots(f, df, guess, (size,), self.spec['tol'],
+                                      self.spec['maxiter'], var).root
+
+def _real(v) -> np.ndarray:
+    # closed forms can go complex outside their domain; those points become nan
+    v = np.asarray(v)
+    if np.iscomplexobj(v):
+        v = np.where(np.abs(v.imag) <= 1e-12 * np.abs(v.real), v.real, np.nan)
+    return v.astype(float)
+
+def _core_eqs():
+    # the vectorized Newton lives in core_eqs.py beside this script
+    if 'core_eqs' not in sys.modules:
+        sys.modules['core_eqs'] = _load_module(os.path.join(HERE, 'core_eqs.py'), 'core_eqs')
+    return sys.modules['core_eqs']
+
+def residual_column(tag: str, i: int) -> str:
+    return f'r[{tag}:{i}]'
+
+def solve_column(tag: str, i: int, var: str, branch: Optional[int] = None) -> str:
+    return f'{var}[{tag}:{i}]' + (f'#{branch}' if branch is not None else '')
+
+# --------------------------------------------------------------------------------------
+# Pool workers: one evaluator and one set of memmaps per process
+# --------------------------------------------------------------------------------------
+
+_WORKER: Optional[Tuple[_Evaluator, Dict[str, np.memmap]]] = None
+
+def _open_columns(out_dir: str, files: Dict[str, str]) -> Dict[str, np.memmap]:
+    return {c: np.lib.format.open_memmap(os.path.join(out_dir, f), mode='r+') for c, f in files.items()}
+
+def _sweep_worker_init(spec: dict, closed: List[Optional[List[str]]], out_dir: str,
+                       files: Dict[str, str]) -> None:
+    global _WORKER
+    _WORKER = (_Evaluator(spec, closed), _open_columns(out_dir, files))
+
+def _run_chunk(spec: dict, evaluator: _Evaluator, columns: Dict[str, np.memmap], k: int) -> int:
+    start, stop, inputs = chunk_inputs(spec, k)
+    values = {**spec['fixed'], **inputs}
+    outputs = evaluator(values, stop - start)
+    for c, mm in columns.items():
+        mm[start:stop] = inputs[c] if c in inputs else outputs[c]
+    for mm in columns.values():
+        mm.flush()
+    return stop - start
+
+def _sweep_worker(k: int) -> int:
+    evaluator, columns = _WORKER
+    return _run_chunk(evaluator.spec, evaluator, columns, k)
+
+# --------------------------------------------------------------------------------------
+# Driver
+# --------------------------------------------------------------------------------------
+
+def _file_name(column: str, taken: set) -> str:
+    base = re.sub(r'[^0-9A-Za-z_.-]+', '_', column).strip('_') or 'col'
+    name, k = base, 1
+    while name in taken:
+        name, k = f'{base}_{k}', k + 1
+    taken.add(name)
+    return name + '.npy'
+
+def sweep(module: str, out_dir: str, grid: Optional[Dict[str, List[float]]] = None,
+          sample: Optional[Dict[str, Tuple[float, float]]] = None, n: int = 0,
+          fixed: Optional[Dict[str, float]] = None, tags: Optional[List[str]] = None,
+          solve: Optional[List[Tuple[str, int, str]]] = None, guess: Optional[dict] = None,
+          jobs: int = 0, chunk: int = DEFAULT_CHUNK, seed: int = 0, tol: float = 1e-10,
+          maxiter: int = 50, solve_timeout: float = DEFAULT_SOLVE_TIMEOUT,
+          quiet: bool = False) -> str:
+    """
+    Run a sweep through the generated classes of ``module`` (either file of the pair)
+    and write its columns to ``out_dir``; returns ``out_dir``.
+
+    ``grid`` (name -> values, full Cartesian product in the given order) or ``sample``
+    (name -> (lo, hi), ``n`` uniform points) give the varying inputs, ``fixed`` the
+    constants. ``tags`` are evaluated, ``solve`` entries (tag, i, var) solved; ``guess``
+    maps a numeric-only var to a start value or a [lo, hi] bracket; ``solve_timeout``
+    bounds sp.solve for solve entries the codegen did not invert. ``jobs`` worker
+    processes (default: all cores; 1 runs in this process) take ``chunk`` rows each.
+    """
+    if bool(grid) == bool(sample):
+        raise ValueError('Give exactly one of grid= and sample=')
+    if not tags and not solve:
+        raise ValueError('Nothing to compute: give tags= and/or solve=')
+    core_path, num_path = module_paths(module)
+    if solve and not os.path.exists(core_path):
+        raise FileNotFoundError(f'solve= needs the generated class module: {core_path}')
+    spec = {
+        'core': core_path, 'numeric': num_path,
+        'grid': {k: [float(x) for x in v] for k, v in (grid or {}).items()},
+        'sample': {k: [float(lo), float(hi)] for k, (lo, hi) in (sample or {}).items()},
+        'n': int(n), 'seed': int(seed), 'chunk': int(chunk),
+        'fixed': {k: float(v) for k, v in (fixed or {}).items()},
+        'tags': list(tags or []),
+        'solve': [[tag, int(i), var] for tag, i, var in (solve or [])],
+        'guess': {k: (list(map(float, v)) if isinstance(v, (list, tuple)) else float(v))
+                  for k, v in (guess or {}).items()},
+        'tol': tol, 'maxiter': maxiter, 'solve_timeout': float(solve_timeout),
+    }
+    total = n_points(spec)
+    if total <= 0:
+        raise ValueError('The sweep has no points')
+
+    # Evaluate the first few points here: bad names and missing values fail before
+    # any file or process is created, and this fixes the output columns.
+    closed = closed_forms(spec, spec['solve_timeout'])
+    evaluator = _Evaluator(spec, closed)
+    probe = dict(spec, chunk=min(4, total))
+    _, stop, inputs = chunk_inputs(probe, 0)
+    outputs = evaluator({**spec['fixed'], **inputs}, stop)
+    names = list(inputs) + list(outputs)
+
+    os.makedirs(out_dir, exist_ok=True)
+    taken: set = set()
+    files = {c: _file_name(c, taken) for c in names}
+    for c, f in files.items():
+        np.lib.format.open_memmap(os.path.join(out_dir, f), mode='w+', dtype=np.float64,
+                                  shape=(total,)).flush()
+    index = dict(spec, points=total, columns=files,
+                 grid_shape=[len(v) for v in spec['grid'].values()] or None)
+    with open(os.path.join(out_dir, 'sweep.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1)
+
+    n_chunks = -(-total // spec['chunk'])
+    jobs = jobs or os.cpu_count() or 1
+    t0 = time.perf_counter()
+    done = 0
+
+    def progress(rows: int) -> None:
+        nonlocal done
+        done += rows
+        if not quiet:
+            print(f'\r  {done:,}/{total:,} points ({time.perf_counter() - t0:.1f} s)',
+                  end='', file=sys.stderr, flush=True)
+
+    if jobs <= 1 or n_chunks == 1:
+        columns = _open_columns(out_dir, files)
+        for k in range(n_chunks):
+            progress(_run_chunk(spec, evaluator, columns, k))
+        del columns
+    else:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+        methods = mp.get_all_start_methods()
+        ctx = mp.get_context('fork') if 'fork' in methods else None
+        with ProcessPoolExecutor(max_workers=min(jobs, n_chunks), mp_context=ctx,
+                                 initializer=_sweep_worker_init,
+                                 initargs=(spec, closed, out_dir, files)) as pool:
+            for rows in pool.map(_sweep_worker, range(n_chunks)):
+                progress(rows)
+    if not quiet:
+        print(file=sys.stderr)
+    return out_dir
+
+def load_sweep(out_dir: str, mmap: bool = True) -> Dict[str, np.ndarray]:
+    """Column name -> array (memory-mapped unless mmap=False), grids in grid shape."""
+    with open(os.path.join(out_dir, 'sweep.json'), encoding='utf-8') as f:
+        index = json.load(f)
+    out = {}
+    for c, fname in index['columns'].items():
+        a = np.load(os.path.join(out_dir, fname), mmap_mode='r' if mmap else None)
+        out[c] = a.reshape(index['grid_shape']) if index['grid_shape'] else a
+    return out
+
+# --------------------------------------------------------------------------------------
+# CLI
+# --------------------------------------------------------------------------------------
+
+def _float(text: str) -> float:
+    return float(text.strip())
+
+def _assignments(items: List[str], flag: str) -> Dict[str, str]:
+    out = {}
+    for item in items or []:
+        name, sep, value = item.partition('=')
+        if not sep or not name:
+            raise SystemExit(f'{flag}: expected NAME=VALUE, got {item!r}')
+        out[name] = value
+    return out
+
+def _grid_axis(text: str) -> List[float]:
+    if ':' in text:
+        start, stop, num = text.split(':')
+        return list(np.linspace(_float(start), _float(stop), int(num)))
+    return [_float(x) for x in text.split(',')]
+
+def _solve_entry(text: str) -> Tuple[str, int, str]:
+    tag, i, var = text.rsplit(':', 2) if text.count(':') >= 2 else (None, None, None)
+    if tag is None:
+        raise SystemExit(f'--solve: expected TAG:I:VAR, got {text!r}')
+    return tag, int(i), var
+
+def main():
+    import argparse
+    ap = argparse.ArgumentParser(description='Sweep parameters through generated core equations.')
+    ap.add_argument('module', help='<name>_core.py or <name>_numeric.py from core-eq.sh')
+    ap.add_argument('--out', required=True, help='output directory (.npy columns + sweep.json)')
+    ap.add_argument('--grid', nargs='+', metavar='NAME=START:STOP:NUM|V1,V2,...')
+    ap.add_argument('--sample', nargs='+', metavar='NAME=LO:HI')
+    ap.add_argument('--n', type=int, default=0, help='number of random points for --sample')
+    ap.add_argument('--fixed', nargs='+', metavar='NAME=VALUE')
+    ap.add_argument('--tags', nargs='+', help='evaluate every residual of these tags')
+    ap.add_argument('--solve', nargs='+', metavar='TAG:I:VAR')
+    ap.add_argument('--guess', nargs='+', metavar='VAR=X0|VAR=LO:HI',
+                    help='start value or bracket for numeric-only --solve symbols')
+    ap.add_argument('--jobs', type=int, default=0, help='worker processes (default: all cores)')
+    ap.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='points per task')
+    ap.add_argument('--seed', type=int, default=0)
+    ap.add_argument('--solve-timeout', type=float, default=DEFAULT_SOLVE_TIMEOUT, metavar='S',
+                    help='seconds sp.solve gets for --solve symbols the codegen did not invert')
+    args = ap.parse_args()
+
+    grid = {k: _grid_axis(v) for k, v in _assignments(args.grid, '--grid').items()}
+    sample = {}
+    for k, v in _assignments(args.sample, '--sample').items():
+        lo, _, hi = v.partition(':')
+        sample[k] = (_float(lo), _float(hi))
+    guess = {}
+    for k, v in _assignments(args.guess, '--guess').items():
+        guess[k] = [_float(x) for x in v.split(':')] if ':' in v else _float(v)
+    fixed = {k: _float(v) for k, v in _assignments(args.fixed, '--fixed').items()}
+    try:
+        out = sweep(args.module, args.out, grid=grid, sample=sample, n=args.n, fixed=fixed,
+                    tags=args.tags, solve=[_solve_entry(s) for s in args.solve or []],
+                    guess=guess, jobs=args.jobs, chunk=args.chunk, seed=args.seed,
+                    solve_timeout=args.solve_timeout)
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        raise SystemExit(f'core_sweep: {e}')
+    print(f'✔ Wrote sweep: {out}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import glob
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import core_batch
+
+from conftest import ROOT
+
+CORPUS = os.path.join(ROOT, 'bench', 'corpus', 'synthetic-10.tex')
+OUTPUTS = ['synthetic-10-equations.tex', 'synthetic-10_core.py', 'synthetic-10_numeric.py',
+           'synthetic-10_core.manifest.json']
+
+
+def _input(root) -> str:
+    # <class>/<entry>/name.tex: the outputs go to a new entry folder under <class>
+    src = root / 'class' / 'src'
+    src.mkdir(parents=True)
+    return shutil.copy(CORPUS, src)
+
+
+def _entry(tex: str) -> str:
+    class_dir = os.path.dirname(os.path.dirname(tex))
+    (entry,) = [d for d in glob.glob(os.path.join(class_dir, '*')) if not d.endswith('src')]
+    return entry
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    for name, value in {'SOURCE_DATE_EPOCH': '1735689600', 'AUTO_OPEN': 'none',
+                        'CORE_EQS_SOCKET': 'off', 'CORE_EQS_SOLVE_BUDGET': '0',
+                        'CORE_EQS_CACHE': str(tmp_path / 'cache.sqlite3')}.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv('CORE_EQS_PY', raising=False)
+    return os.environ.copy()
+
+
+def test_batch_matches_single_file(tmp_path, env):
+    single = _input(tmp_path / 'single')
+    subprocess.run(['bash', os.path.join(ROOT, 'core-eq.sh'), single], env=env, check=True,
+                   capture_output=True)
+
+    batched = _input(tmp_path / 'batch')
+    (item,) = core_batch.batch([batched], jobs=1, quiet=True)
+    assert item.status == 'built', item.log
+
+    for name in OUTPUTS:
+        with open(os.path.join(_entry(single), name), 'rb') as f:
+            expected = f.read()
+        with open(os.path.join(_entry(batched), name), 'rb') as f:
+            assert f.read() == expected, name
@@ -0,0 +1,62 @@
+"""
+The generated modules carry copies of core_eqs.BoundResidual and of the argument check
+its evaluate() shares with the other evaluate methods; the copies and CoreEqs.bind() must
+behave exactly like the originals.
+"""
+import inspect
+
+import numpy as np
+import pytest
+
+import asdf_core
+import asdf_numeric
+import core_eqs
+from core_eqs import CoreEqs
+
+
+@pytest.fixture(scope='module')
+def pair():
+    core = asdf_core.asdf_Core()
+    return core, CoreEqs.from_exprs({tag: core.eq_all(tag) for tag in core.tags()})
+
+
+def _refs(core):
+    return [(tag, i) for tag in core.tags() for i in range(len(core.eq_all(tag)))]
+
+
+def _values(names, shape=None):
+    # floats by default, arrays of ``shape`` for evaluate()
+    rng = np.random.default_rng(len(names))
+    return {n: (1.4 if n == 'gamma' else rng.uniform(1.1, 3.0, shape)) for n in names}
+
+
+def test_generated_copy_is_core_eqs_source():
+    assert inspect.getsource(asdf_core.BoundResidual) == inspect.getsource(core_eqs.BoundResidual)
+    for mod in (asdf_core, asdf_numeric):
+        assert inspect.getsource(mod._kernel_args) == inspect.getsource(core_eqs._kernel_args)
+
+
+def test_bind_matches_core_eqs(pair):
+    core, ce = pair
+    for tag, i in _refs(core):
+        names = [s.name for s in core.symbols(tag, i)]
+        fixed = dict(_values(names[::2]), unused_name=1.0)
+        got, want = core.bind(tag, i, **fixed), ce.bind(tag, i, **fixed)
+        assert (got.free, got.fixed, repr(got)) == (want.free, want.fixed, repr(want))
+        assert got.expr == want.expr
+        rest = _values(got.free)
+        assert got(**rest) == want(**rest)
+        arrays = _values(got.free, (7,))
+        with np.errstate(all='ignore'):
+            np.testing.assert_array_equal(got.evaluate(**arrays), want.evaluate(**arrays))
+
+
+def test_missing_values_raise_the_same(pair):
+    core, ce = pair
+    tag, i = _refs(core)[0]
+    errors = []
+    for bound in (core.bind(tag, i), ce.bind(tag, i)):
+        with pytest.raises(KeyError) as e:
+            bound.evaluate()
+        errors.append(str(e.value))
+    assert errors[0] == errors[1]
@@ -0,0 +1,67 @@
+"""
+The generated core module builds its expressions with constructor code (no eval of
+srepr strings): each one loads equal to the srepr it was generated from, symbols are
+shared, and warm() builds everything up front.
+"""
+import importlib.util
+import os
+
+import pytest
+import sympy as sp
+
+import core_codegen
+from core_eqs import CoreEqs
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+
+@pytest.fixture(scope='module')
+def generated(tmp_path_factory):
+    out = tmp_path_factory.mktemp('gen')
+    mp = pytest.MonkeyPatch()
+    mp.setenv('CORE_EQS_SOLVE_BUDGET', '0')
+    mp.setenv('CORE_EQS_CACHE', 'off')
+    try:
+        core_codegen.generate(f'{ROOT}/core_eqs.py', ASDF, str(out / 'asdf_core.py'), 'asdf',
+                              str(out / 'asdf_numeric.py'), str(out / 'asdf.manifest.json'))
+    finally:
+        mp.undo()
+    spec = importlib.util.spec_from_file_location('gen_asdf_core', out / 'asdf_core.py')
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod, (out / 'asdf_core.py').read_text(encoding='utf-8')
+
+
+def test_no_eval_of_srepr(generated):
+    _, src = generated
+    assert 'eval(' not in src
+
+
+def test_expressions_equal_their_srepr(generated):
+    mod, _ = generated
+    core = mod.asdf_Core()
+    ce = CoreEqs.from_tex(ASDF, cache=False)
+    assert core.tags() == ce.tags()
+    for tag in core.tags():
+        for i, rep in enumerate(core._SREPR[tag]):
+            assert sp.srepr(core._expr(tag, i)) == rep == sp.srepr(ce.residual(tag, i))
+
+
+def test_symbols_are_shared(generated):
+    mod, _ = generated
+    core = mod.asdf_Core()
+    gammas = {id(s) for tag in core.tags() for e in core.eq_all(tag)
+              for s in e.free_symbols if s.name == 'gamma'}
+    assert gammas == {id(mod._SYM['gamma'])}
+    assert all(s is mod._SYM[s.name] for s in core.symbols('1.18', 0))
+
+
+def test_warm_builds_everything(generated):
+    mod, _ = generated
+    core = mod.asdf_Core()
+    core.warm(['1.21'])
+    assert sorted(core._cache) == [('1.21', 0), ('1.21', 1)]
+    core.warm()
+    assert len(core._cache) == sum(len(v) for v in core._SREPR.values())
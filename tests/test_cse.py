@@ -0,0 +1,60 @@
+"""
+evaluate_tags()/evaluate_all() of both generated modules: the residuals computed
+together with shared subexpressions agree with evaluating each line on its own, also
+when big inputs are evaluated slice by slice.
+"""
+import numpy as np
+import pytest
+
+import asdf_core
+import asdf_numeric
+from asdf_numeric import asdf_Numeric
+
+
+def _arrays(num, tags, n):
+    names = sorted({s for tag in tags for i in range(len(num._SYMNAMES[tag]))
+                    for s in num.symbols(tag, i)})
+    rng = np.random.default_rng(n)
+    return {s: rng.uniform(1.1, 1.6 if s == 'gamma' else 3.0, n) for s in names}
+
+
+def _per_line(model, tags, arrays):
+    return {tag: [model.evaluate(tag, i, **arrays) for i in range(len(asdf_Numeric._SYMNAMES[tag]))]
+            for tag in tags}
+
+
+def _assert_same(got, want):
+    assert list(got) == list(want)
+    for tag in want:
+        assert len(got[tag]) == len(want[tag])
+        for g, w in zip(got[tag], want[tag]):
+            np.testing.assert_allclose(g, w, rtol=1e-9, atol=1e-9, err_msg=tag)
+
+
+@pytest.mark.parametrize('model', [asdf_Numeric(), asdf_core.asdf_Core()], ids=['numeric', 'core'])
+def test_evaluate_tags_matches_per_line(model):
+    tags = ['1.16', '1.18', '1.21', '1.25', '1.26']
+    arrays = _arrays(asdf_Numeric(), tags, 50)
+    with np.errstate(all='ignore'):
+        _assert_same(model.evaluate_tags(tags, **arrays), _per_line(model, tags, arrays))
+
+
+def test_evaluate_all_in_chunks():
+    num = asdf_Numeric()
+    tags = num.tags()
+    n = asdf_numeric._CHUNK * 2 + 5   # three slices, the last one short
+    arrays = _arrays(num, tags, n)
+    arrays['gamma'] = 1.4              # a scalar among the arrays
+    with np.errstate(all='ignore'):
+        got = num.evaluate_all(**arrays)
+        _assert_same(got, _per_line(num, tags, arrays))
+    assert all(v.shape == (n,) for vs in got.values() for v in vs)
+
+
+def test_shared_steps_are_only_run_when_read():
+    num = asdf_Numeric()
+    fn, names, refs = num._cse_kernel(('1.9',))
+    assert refs == [('1.9', 0)] and names == ['RT_x', 'V_x', 'p_x']
+    assert num.evaluate_tags(['1.9'], RT_x=144.0, V_x=1.0, p_x=1.0)['1.9'][0] == 0.0
+    with pytest.raises(KeyError, match='Unknown tags'):
+        num.evaluate_tags(['nope'])
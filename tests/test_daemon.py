@@ -0,0 +1,94 @@
+"""
+The warm daemon (core_eqs.py --serve) through core_client.py: a request round trip, and
+requests on different documents not waiting for each other.
+"""
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+import pytest
+
+import core_codegen
+from core_client import CoreClient, DaemonUnavailable
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+CORPUS = os.path.join(ROOT, 'bench', 'corpus', 'synthetic-100.tex')
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    sock = str(tmp_path / 'd.sock')
+    proc = subprocess.Popen([sys.executable, os.path.join(ROOT, 'core_eqs.py'), '--serve', sock,
+                             '--no-cache'], stderr=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while True:
+        try:
+            CoreClient(sock).close()
+            break
+        except DaemonUnavailable:
+            if proc.poll() is not None or time.time() > deadline:
+                proc.kill()
+                pytest.fail('the daemon did not start')
+            time.sleep(0.05)
+    yield sock
+    try:
+        with CoreClient(sock) as c:
+            c.request('shutdown')
+        proc.wait(10)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+
+
+def test_ping_load_evaluate(daemon):
+    with CoreClient(daemon) as c:
+        assert c.request('ping')['documents'] == []
+        loaded = c.request('load', tex=ASDF)
+        assert '1.12' in loaded['tags'] and not loaded['warm']
+        assert c.request('load', tex=ASDF)['warm']
+        out = c.request('evaluate', tex=ASDF, tag='1.12', i=0,
+                        values={'V_i': [1, 2], 'V_x': 1, 'gamma': 1.4, 'p_i': 1, 'p_x': 1})
+        assert out == pytest.approx([0.0, 2 ** 1.4 - 1])
+        assert c.request('ping')['documents'] == [os.path.abspath(ASDF)]
+
+
+def test_documents_do_not_wait_for_each_other(daemon, tmp_path):
+    # a slow load of one document (synthetic-100, parsed from scratch) ...
+    big = tmp_path / 'big-equations.tex'
+    core_codegen.extract(CORPUS, str(big), 'big')
+    with CoreClient(daemon) as fast, CoreClient(daemon) as slow:
+        fast.request('load', tex=ASDF)
+        slow._send('load', {'tex': str(big)})
+        time.sleep(0.2)
+        # ... does not hold up a call on another one
+        t0 = time.perf_counter()
+        fast.request('evaluate', tex=ASDF, tag='1.12', i=0,
+                     values={'V_i': 1, 'V_x': 1, 'gamma': 1.4, 'p_i': 1, 'p_x': 1})
+        waited = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        assert slow._result(next(slow._replies()))['lines'] > 0
+        assert time.perf_counter() - t0 > waited
+
+
+def test_core_eq_sh_builds_in_the_daemon(daemon, tmp_path):
+    corpus = os.path.join(ROOT, 'bench', 'corpus', 'synthetic-10.tex')
+    outputs = {}
+    for run_name, socket in (('fresh', 'off'), ('daemon', daemon)):
+        src = tmp_path / run_name / 'class' / 'src'
+        src.mkdir(parents=True)
+        tex = shutil.copy(corpus, src)
+        env = dict(os.environ, SOURCE_DATE_EPOCH='1735689600', AUTO_OPEN='none',
+                   CORE_EQS_SOCKET=socket, CORE_EQS_SOLVE_BUDGET='0',
+                   CORE_EQS_CACHE=str(tmp_path / f'{run_name}.sqlite3'))
+        env.pop('CORE_EQS_PY', None)
+        run = subprocess.run(['bash', os.path.join(ROOT, 'core-eq.sh'), tex], env=env,
+                             check=True, capture_output=True, text=True)
+        assert ('Built in the core_eqs daemon' in run.stdout) == (socket != 'off')
+        (entry,) = [p for p in (src.parent).iterdir() if p.name != 'src']
+        outputs[run_name] = {p.name: p.read_bytes() for p in entry.iterdir() if p.is_file()}
+    assert len(outputs['fresh']) == 4
+    assert outputs['daemon'] == outputs['fresh']
@@ -0,0 +1,69 @@
+"""
+Compiled batch evaluate(): CoreEqs and the generated class give, point by point, the
+residual SymPy computes, and inputs broadcast against each other.
+"""
+import os
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import asdf_core
+from core_eqs import CoreEqs
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+
+@pytest.fixture(scope='module')
+def ce():
+    return CoreEqs.from_tex(ASDF, cache=False)
+
+
+def _values(names, shape):
+    rng = np.random.default_rng(len(names))
+    return {n: rng.uniform(1.1, 1.6 if n == 'gamma' else 3.0, shape) for n in names}
+
+
+def test_evaluate_matches_sympy_per_point(ce):
+    for rec in ce.records():
+        arrays = _values(rec.names, (5,))
+        with np.errstate(all='ignore'):
+            got = ce.evaluate(rec.tag, rec.i, **arrays)
+        assert got.shape == (5,)
+        for k in range(5):
+            want = complex(rec.residual.subs({s: arrays[s.name][k] for s in rec.symbols}).evalf())
+            if abs(want.imag) < 1e-12:
+                assert got[k] == pytest.approx(want.real, rel=1e-9, abs=1e-12), (rec.tag, rec.i)
+            else:
+                assert np.isnan(got[k]), (rec.tag, rec.i)
+
+
+def test_inputs_broadcast(ce):
+    # 1.12: p_i V_i^gamma - p_x V_x^gamma over a grid of V_i and gamma
+    V_i = np.linspace(1, 2, 4)[:, None]
+    gamma = np.array([1.2, 1.3, 1.4])
+    out = ce.evaluate('1.12', 0, V_i=V_i, gamma=gamma, V_x=1, p_i=2.0, p_x=1.0, unused=7)
+    assert out.shape == (4, 3)
+    np.testing.assert_allclose(out, 2.0 * V_i ** gamma - 1.0)
+    # scalars in, 0-d array out
+    assert ce.evaluate('1.12', 0, V_i=1, gamma=1.4, V_x=1, p_i=1, p_x=1).shape == ()
+
+
+def test_missing_values_raise(ce):
+    with pytest.raises(KeyError, match=r"Missing values for \['p_x'\]"):
+        ce.evaluate('1.12', 0, V_i=1, V_x=1, gamma=1.4, p_i=1)
+
+
+def test_generated_class_matches_core_eqs():
+    core = asdf_core.asdf_Core()
+    ce = CoreEqs.from_exprs({tag: core.eq_all(tag) for tag in core.tags()})
+    for tag in core.tags():
+        for i, syms in enumerate(ce.symbols[tag]):
+            arrays = _values([s.name for s in syms], (6,))
+            with np.errstate(all='ignore'):
+                np.testing.assert_allclose(core.evaluate(tag, i, **arrays),
+                                           ce.evaluate(tag, i, **arrays), rtol=1e-12)
+    assert core.evaluate('1.9', 0, RT_x=0.0, V_x=1.0, p_x=np.arange(3.0)).tolist() == [0, 144, 288]
+    assert sp.srepr(core.residual('1.9', 0)) == sp.srepr(ce.residual('1.9', 0))
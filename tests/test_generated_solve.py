@@ -0,0 +1,66 @@
+"""
+The generated class's solve() for symbols the codegen did not invert: sp.solve runs in a
+SolveWorker for at most `timeout` seconds, and a timeout raises NumericOnlyError.
+"""
+import importlib.util
+
+import pytest
+import sympy as sp
+
+import core_codegen
+
+from conftest import ROOT
+
+TEX = r'''
+\begin{equation}
+\begin{aligned}
+y = x^{3} + x
+\end{aligned}
+\tag{1}
+\end{equation}
+'''
+
+
+class _Worker:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def solve(self, expr, sym, timeout):
+        self.calls += 1
+        return self.reply
+
+
+@pytest.fixture
+def core(tmp_path, monkeypatch):
+    monkeypatch.setenv('CORE_EQS_SOLVE_BUDGET', '0')   # nothing inverted at codegen
+    monkeypatch.setenv('CORE_EQS_CACHE', 'off')
+    tex = tmp_path / 'cubic-equations.tex'
+    tex.write_text(TEX, encoding='utf-8')
+    out = tmp_path / 'cubic_core.py'
+    core_codegen.generate(f'{ROOT}/core_eqs.py', str(tex), str(out), 'cubic',
+                          str(tmp_path / 'cubic_numeric.py'), str(tmp_path / 'cubic.manifest.json'))
+    spec = importlib.util.spec_from_file_location('cubic_core', out)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_solve_runs_bounded(core):
+    assert core.cubic_Core().solve('1', 0, 'y') == [sp.Symbol('x') ** 3 + sp.Symbol('x')]
+
+
+def test_timeout_raises_numeric_only_and_is_remembered(core, monkeypatch):
+    worker = _Worker(('timeout', None))
+    monkeypatch.setattr(core, 'solve_worker', lambda: worker)
+    eqs = core.cubic_Core()
+    with pytest.raises(core.NumericOnlyError, match='timed out after 0.5s'):
+        eqs.solve('1', 0, 'x', timeout=0.5)
+    with pytest.raises(core.NumericOnlyError):
+        eqs.solve('1', 0, 'x', timeout=0.5)
+    assert worker.calls == 1
+    # a larger budget tries again
+    x = sp.Symbol('x')
+    worker.reply = ('ok', [{x: sp.Integer(2)}])
+    assert eqs.solve('1', 0, 'x') == [2]
+    assert worker.calls == 2
@@ -0,0 +1,46 @@
+from core_library import Library, tag_key
+
+
+def test_tag_key_is_document_order():
+    tags = ['1.10', '2.1', '1.2', 'A.3', '1.9', '10.1', '1.2a', '1.1']
+    assert sorted(tags, key=tag_key) == ['1.1', '1.2', '1.2a', '1.9', '1.10', '2.1', '10.1', 'A.3']
+
+
+def test_tags_and_lookups_in_document_order(tmp_path):
+    rep = "Add(Symbol('x'), Integer(-1))"
+    with Library(str(tmp_path / 'eqs.sqlite3')) as lib:
+        lib.add_blocks('doc', {'1.10': [rep], '1.2': [rep], '1.1': [rep, rep]})
+        assert lib.tags('doc') == ['1.1', '1.2', '1.10']
+        assert lib.equations_with('x') == [('doc', '1.1', 0), ('doc', '1.1', 1),
+                                           ('doc', '1.2', 0), ('doc', '1.10', 0)]
+        assert lib.same_as('doc', '1.10', 0) == [('doc', '1.1', 0), ('doc', '1.1', 1),
+                                                 ('doc', '1.2', 0)]
+
+
+def test_residuals_dedupe_on_the_evaluated_form(tmp_path):
+    first = "Add(Symbol('x'), Integer(-1))"
+    other = "Add(Integer(-1), Symbol('x'))"
+    with Library(str(tmp_path / 'eqs.sqlite3')) as lib:
+        lib.add_blocks('a', {'1': [first]})
+        lib.add_blocks('b', {'1': [other]})
+        assert lib.stats()['residuals'] == 1
+        assert lib.same_as('b', '1', 0) == [('a', '1', 0)]
+        assert lib.srepr('b', '1') == [first]
+
+
+def test_raw_hashed_library_is_rehashed(tmp_path):
+    path = str(tmp_path / 'eqs.sqlite3')
+    with Library(path) as lib:
+        lib.add_blocks('a', {'1': ["Add(Symbol('x'), Integer(-1))"]})
+        lib.add_blocks('b', {'1': ["Add(Integer(-1), Symbol('x'))"]})
+        # as written before residual hashes were canonical: one row per spelling
+        lib._db.execute("INSERT INTO residual (hash, srepr, symbols) VALUES "
+                        "('raw', 'Add(Integer(-1), Symbol(''x''))', '[\"x\"]')")
+        lib._db.execute("UPDATE line SET residual = last_insert_rowid() WHERE doc = "
+                        "(SELECT id FROM document WHERE name = 'b')")
+        lib._db.execute('PRAGMA user_version = 0')
+        lib._db.commit()
+        assert lib.stats()['residuals'] == 2
+    with Library(path) as lib:
+        assert lib.stats()['residuals'] == 1
+        assert lib.same_as('b', '1', 0) == [('a', '1', 0)]
@@ -0,0 +1,117 @@
+"""
+The single-pass normalizer in core_eqs against the multi-pass regex implementation it
+replaced, on the lines of a real equations file and on randomly glued fragments.
+"""
+import os
+import random
+import re
+
+import pytest
+
+from core_eqs import _EQN_BLOCK_RE, CoreEqs, _is_normal, _normalize_for_parsers
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+N_RANDOM = 10_000
+
+# --- reference implementation ---------------------------------------------------------
+
+_SPACING_CMDS = r'(?:\\,|\\!|\\;|\\:|\\quad|\\qquad)'
+_SUB_BARE = re.compile(r'_(?!\{)([A-Za-z0-9])')     # x_i  -> x_{i}
+_EXP_BARE = re.compile(r'\^([A-Za-z0-9])')          # M^2  -> M^{2}
+_BRACK_GROUP = re.compile(r'\[([^\[\]]+)\]')        # [ ... ] -> ( ... )
+
+def _normalize_text_subscripts(s: str) -> str:
+    # (BASE)_{\text{ns}} -> BASE_{ns}
+    s = re.sub(
+        r'\(\s*([A-Za-z\\]+(?:_\{[^}]+\})?)\s*\)_\{\\text\{([^}]+)\}\}',
+        r'\1_{\2}', s
+    )
+    # (BASE)_{ns} -> BASE_{ns}
+    s = re.sub(
+        r'\(\s*([A-Za-z\\]+(?:_\{[^}]+\})?)\s*\)_\{([^}]+)\}',
+        r'\1_{\2}', s
+    )
+    # X_{\text{inj}}  -> X_{inj}
+    s = re.sub(r'_\{\\text\{([^}]+)\}\}', r'_{\1}', s)
+    # X_{\mathrm{inj}} -> X_{inj}
+    s = re.sub(r'_\{\\mathrm\{([^}]+)\}\}', r'_{\1}', s)
+    # _{a,b} -> _{a_b}
+    while True:
+        s2 = re.sub(r'_\{([^{}]+),\s*([^{}]+)\}', r'_{\1_\2}', s)
+        if s2 == s:
+            break
+        s = s2
+    return s
+
+def _normalize_dots(s: str) -> str:
+    # \dot{W} -> Wdot ; \dot{p_c} -> p_cdot
+    return re.sub(
+        r'\\dot\{([A-Za-z](?:_[A-Za-z0-9]+|\_\{[^}]+\})?)\}',
+        r'\1dot', s
+    )
+
+def normalize_regex(s: str) -> str:
+    # strip thin/space commands
+    s = re.sub(_SPACING_CMDS, '', s)
+    # strip \left \right
+    s = re.sub(r'\\left\s*', '', s)
+    s = re.sub(r'\\right\s*', '', s)
+    # remove alignment tabs
+    s = s.replace('&', '')
+    # friendlier subscripts and dotted symbols
+    s = _normalize_text_subscripts(s)
+    s = _normalize_dots(s)
+    # brace bare subscripts/exponents
+    s = _SUB_BARE.sub(r'_{\1}', s)
+    s = _EXP_BARE.sub(r'^{\1}', s)
+    # treat [ ... ] as grouping if present
+    s = _BRACK_GROUP.sub(r'(\1)', s)
+    # collapse whitespace
+    s = re.sub(r'\s+', ' ', s).strip()
+    return s
+
+# --- corpus ---------------------------------------------------------------------------
+
+# Realistic pieces of equation lines, glued together at random to reach edge cases the
+# sample document does not cover.
+FRAGMENTS = (
+    'p', 'T', 'M', 'v_e', 'p_x', 'p_{t}', 'p_{cns}', r'\gamma', r'\epsilon', '1', '2', '144',
+    '=', '+', '-', r'\cdot', '/', '^2', '^{2}', r'^\gamma', '_{a,b}', '_{a, b,c}', '_{ ,x}',
+    r'_{\text{ns}}', r'_{\mathrm{inj}}', r'T_{\text{c}, \text{ns}}', r'(p)_{\text{c}}',
+    r'(T_{c})_{ns}', r'( \gamma )_{\mathrm{t}}', r'(p_{a,b})_{x}', r'\left( T \right)_{\text{ns}}',
+    r'\dot{W}', r'\dot{m}', r'\dot{p_c}', r'\dot{p_{\text{c}}}', r'\dot{m}_{ox}', r'\dot{p_{a,b}}',
+    r'\frac{', '}{', '}', r'\sqrt{', r'\sqrt[3]{', '(', ')', '[', ']', r'\left(', r'\right)',
+    r'\left[', r'\right]', r'\,', r'\;', r'\!', r'\:', r'\quad', r'\qquad', '&', ' ', '  ', '\t',
+    r'_\,x', r'^\;2',
+)
+
+def _document_lines():
+    with open(ASDF, encoding='utf-8') as f:
+        src = f.read()
+    return [ln for m in _EQN_BLOCK_RE.finditer(src)
+            for ln in CoreEqs._lines_from_block(m.group('body'))]
+
+def _fuzzed_lines(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 25))) for _ in range(n)]
+
+CASES = _document_lines() + _fuzzed_lines(N_RANDOM)
+
+def test_document_has_lines():
+    assert len(_document_lines()) > 10
+
+@pytest.mark.parametrize('chunk', range(10))
+def test_matches_reference(chunk):
+    for line in CASES[chunk::10]:
+        assert _normalize_for_parsers(line) == normalize_regex(line), line
+
+@pytest.mark.parametrize('chunk', range(10))
+def test_normal_output_is_a_fixpoint(chunk):
+    # the parser skips the second round for sides _is_normal() accepts
+    for line in CASES[chunk::10]:
+        got = _normalize_for_parsers(line)
+        if _is_normal(got):
+            for side in got.split('=', 1):
+                assert _normalize_for_parsers(side) == side.strip(), line
@@ -0,0 +1,69 @@
+"""
+The SymPy-free numeric companion (asdf_numeric.py) agrees with the SymPy residuals of
+asdf_core.py, has the same surface, and imports neither SymPy nor NumPy.
+"""
+import math
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import asdf_core
+from asdf_numeric import asdf_Numeric
+
+from conftest import ROOT
+
+
+@pytest.fixture(scope='module')
+def pair():
+    return asdf_core.asdf_Core(), asdf_Numeric()
+
+
+def _refs(core):
+    return [(tag, i) for tag in core.tags() for i in range(len(core.eq_all(tag)))]
+
+
+def _values(names):
+    rng = np.random.default_rng(len(names))
+    return {n: float(rng.uniform(1.1, 1.6 if n == 'gamma' else 3.0)) for n in names}
+
+
+def test_same_surface(pair):
+    core, num = pair
+    assert num.tags() == core.tags()
+    for tag, i in _refs(core):
+        assert num.symbols(tag, i) == [s.name for s in core.symbols(tag, i)]
+    assert num.eq_t_1_12_0(V_i=2, V_x=1, gamma=1, p_i=1, p_x=1) == 1.0
+
+
+def test_residuals_match_sympy(pair):
+    core, num = pair
+    checked = 0
+    for tag, i in _refs(core):
+        values = _values(num.symbols(tag, i))
+        want = complex(core.residual(tag, i, **values).evalf())
+        if abs(want.imag) > 1e-12:
+            with pytest.raises(ValueError):   # math.sqrt / math.pow outside their domain
+                num.residual(tag, i, **values)
+            continue
+        assert num.residual(tag, i, **values) == pytest.approx(want.real, rel=1e-9, abs=1e-12)
+        np.testing.assert_allclose(num.evaluate(tag, i, **values), want.real, rtol=1e-9, atol=1e-12)
+        checked += 1
+    assert checked > len(_refs(core)) // 2
+
+
+def test_missing_values_raise(pair):
+    _, num = pair
+    with pytest.raises(KeyError, match=r"Missing values for \['p_x'\]"):
+        num.residual('1.9', 0, RT_x=1, V_x=1)
+    assert math.isclose(num.residual('1.9', 0, RT_x=144, V_x=1, p_x=1), 0.0)
+
+
+def test_imports_without_sympy_or_numpy():
+    code = ('import sys, asdf_numeric; '
+            'print(sorted(m for m in ("sympy", "numpy") if m in sys.modules))')
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True, capture_output=True,
+                         text=True).stdout
+    assert out.strip() == '[]'
@@ -0,0 +1,66 @@
+"""
+solve_for(numeric=True): a vectorized Newton over arrays of parameters, with start
+values or brackets, reporting convergence per point; and find_roots for residuals
+compiled elsewhere.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core_eqs import CoreEqs, NumericSolution, find_roots
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+
+@pytest.fixture(scope='module')
+def ce():
+    return CoreEqs.from_tex(ASDF, cache=False)
+
+
+def test_arrays_of_parameters(ce):
+    V_i = np.linspace(1.0, 3.0, 1000)
+    sol = ce.solve_for('1.12', 'p_x', {'V_i': V_i, 'V_x': 1.0, 'gamma': 1.4, 'p_i': 2.0},
+                       numeric=True)
+    assert isinstance(sol, NumericSolution) and sol.all_converged
+    np.testing.assert_allclose(sol.root, 2.0 * V_i ** 1.4, rtol=1e-10)
+    assert sol.root.shape == sol.converged.shape == sol.iterations.shape == (1000,)
+
+
+def test_bracket_on_a_transcendental_line(ce):
+    # 1.25 for the exit pressure at given area ratios: no closed form, one root per
+    # bracket on the supersonic branch
+    params = {'A_t': 1.0, 'A_x': np.array([2.0, 4.0, 8.0]), 'gamma': 1.25, 'p_{cns}': 1.0}
+    sol = ce.solve_for('1.25', 'p_x', params, numeric=True, guess=(1e-6, 0.5))
+    assert sol.all_converged
+    with np.errstate(all='ignore'):
+        r = ce.evaluate('1.25', 0, p_x=sol.root, **params)
+    np.testing.assert_allclose(r, 0.0, atol=1e-9)
+    assert (np.diff(sol.root) < 0).all()   # larger area ratio, lower exit pressure
+
+
+def test_points_without_a_root_are_reported(ce):
+    # no sign change in the bracket for the negative p_i
+    sol = ce.solve_for('1.12', 'p_x', {'V_i': 1, 'V_x': 1, 'gamma': 1.4, 'p_i': np.array([2.0, -2.0])},
+                       numeric=True, guess=(0.0, 10.0))
+    assert sol.converged.tolist() == [True, False]
+    assert sol.root[0] == pytest.approx(2.0) and np.isnan(sol.root[1])
+
+
+def test_ambiguous_or_unknown_variable(ce):
+    with pytest.raises(ValueError, match='pass line='):
+        ce.solve_for('1.21', 'gamma', {'p_t': 1, 'p_{cns}': 2}, numeric=True)
+    sol = ce.solve_for('1.21', 'gamma', {'p_t': 0.53, 'p_{cns}': 1.0}, numeric=True, line=0,
+                       guess=(1.05, 2.0))
+    assert sol.all_converged
+    with pytest.raises(KeyError):
+        ce.solve_for('1.21', 'p_x', {}, numeric=True)
+
+
+def test_find_roots():
+    a = np.array([2.0, 9.0, 16.0])
+    sol = find_roots(lambda x: x * x - a, lambda x: 2 * x, guess=1.0, shape=a.shape, var='s')
+    np.testing.assert_allclose(sol.root, np.sqrt(a))
+    assert sol.var == 's' and sol.all_converged
@@ -0,0 +1,56 @@
+import os
+
+import sympy as sp
+
+import core_codegen
+from core_eqs import CoreEqs, ParseCache
+
+from conftest import ROOT
+
+CORPUS = os.path.join(ROOT, 'bench', 'corpus', 'synthetic-100.tex')
+
+
+def _equations(tmp_path) -> str:
+    # the corpus is in core-eq.sh's input format; parse what it would extract
+    with open(CORPUS, encoding='utf-8') as f:
+        blocks = list(core_codegen.core_blocks(f.read()))
+    path = tmp_path / 'synthetic-equations.tex'
+    path.write_text(core_codegen.equations_tex('synthetic', blocks, '2025-01-01'), encoding='utf-8')
+    return str(path)
+
+
+def _dump(ce: CoreEqs):
+    return [(tag, [sp.srepr(obj) for obj in ce.eqs[tag]]) for tag in ce.tags()]
+
+
+def _skipped(log: str):
+    return [ln for ln in log.splitlines() if 'Skipping unparsable line' in ln]
+
+
+def test_parallel_shared_cache_matches_serial(tmp_path, capfd):
+    tex = _equations(tmp_path)
+    serial = _dump(CoreEqs.from_tex(tex, cache=False))
+    serial_log = _skipped(capfd.readouterr().err)
+    assert serial_log, 'the corpus should exercise skip-and-log'
+
+    path = str(tmp_path / 'cache.sqlite3')
+    for _ in ('cold', 'warm'):
+        cache = ParseCache(path)
+        try:
+            assert _dump(CoreEqs.from_tex(tex, cache=cache, workers=3)) == serial
+        finally:
+            cache.close()
+        assert _skipped(capfd.readouterr().err) == serial_log
+
+
+def test_broken_cache_parses_uncached(tmp_path, capfd):
+    tex = _equations(tmp_path)
+    serial = _dump(CoreEqs.from_tex(tex, cache=False))
+    serial_log = _skipped(capfd.readouterr().err)
+
+    cache = ParseCache(str(tmp_path / 'cache.sqlite3'))
+    cache._db.close()   # every lookup now raises sqlite3.Error
+    assert _dump(CoreEqs.from_tex(tex, cache=cache)) == serial
+    err = capfd.readouterr().err
+    assert _skipped(err) == serial_log
+    assert 'Parse cache lookup failed' in err
@@ -0,0 +1,82 @@
+"""
+The symbol index, plan() and solve_system(): equations are chained in block-triangular
+order, steps the targets do not need are dropped, and coupled blocks are solved together.
+"""
+import os
+
+import numpy as np
+import pytest
+
+from core_eqs import CoreEqs
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+COUPLED = r'''
+\begin{equation}
+\begin{aligned}
+x + y = s
+\end{aligned}
+\tag{a}
+\end{equation}
+
+\begin{equation}
+\begin{aligned}
+x - y = d
+\end{aligned}
+\tag{b}
+\end{equation}
+'''
+
+
+@pytest.fixture(scope='module')
+def ce():
+    return CoreEqs.from_tex(ASDF, cache=False)
+
+
+@pytest.fixture
+def coupled(tmp_path):
+    path = tmp_path / 'coupled-equations.tex'
+    path.write_text(COUPLED, encoding='utf-8')
+    return CoreEqs.from_tex(str(path), cache=False)
+
+
+def test_index(ce):
+    assert sorted(ce.equations_with('T_{cns}')) == [('1.18', 0), ('1.19', 0), ('1.21', 1), ('1.26', 0)]
+    assert ce.equations_with('nothing') == []
+    for name, refs in ce.index.items():
+        assert all(name in [s.name for s in ce.symbols[tag][i]] for tag, i in refs)
+
+
+def test_plan_chains_and_prunes(ce):
+    known = {'p_i', 'V_i', 'V_x', 'gamma'}
+    assert ce.plan(known, 'RT_x') == [([('1.12', 0)], ['p_x']), ([('1.9', 0)], ['RT_x'])]
+    # 1.21 line 0 could be solved too, but v_t does not need it
+    assert ce.plan({'gamma', 'R', 'T_{cns}', 'g', 'p_{cns}'}, ['v_t']) == [([('1.21', 1)], ['v_t'])]
+    with pytest.raises(ValueError, match=r"Cannot determine \['RT_x'\]"):
+        ce.plan({'V_x'}, ['RT_x'])
+
+
+def test_solve_system_symbolic(ce):
+    out = ce.solve_system({'p_i': 2, 'V_i': 2, 'V_x': 1, 'gamma': 1}, ['RT_x'])
+    assert (float(out['p_x']), float(out['RT_x'])) == (4.0, 576.0)
+
+
+def test_solve_system_numeric_chain(ce):
+    known = {'A_t': 1.0, 'A_x': np.array([2.0, 4.0, 8.0]), 'gamma': 1.25, 'p_{cns}': 1.0,
+             'g': 32.174, 'R': 65.0, 'T_{cns}': 5000.0}
+    out = ce.solve_system(known, ['v_x'], numeric=True, guess={'p_x': (1e-6, 0.5), 'v_x': 1.0})
+    with np.errstate(all='ignore'):
+        for tag in ('1.25', '1.26'):
+            np.testing.assert_allclose(ce.evaluate(tag, 0, **known, **out), 0.0, atol=1e-6)
+    assert (np.diff(out['v_x']) > 0).all()
+
+
+def test_coupled_block(coupled):
+    assert coupled.plan({'s', 'd'}, ['x']) == [([('a', 0), ('b', 0)], ['x', 'y'])]
+    out = coupled.solve_system({'s': 3, 'd': 1}, ['x'])
+    assert (out['x'], out['y']) == (2, 1)
+    out = coupled.solve_system({'s': np.array([3.0, 5.0]), 'd': 1.0}, ['x'], numeric=True)
+    np.testing.assert_allclose(out['x'], [2.0, 3.0])
+    np.testing.assert_allclose(out['y'], [1.0, 2.0])
@@ -0,0 +1,39 @@
+"""
+CoreEqs keeps each line as an EqRecord: dumps()/loads() round-trip the records and the
+symbol table, and residual(tag, i) derives one line's residual, like the residuals view.
+"""
+import os
+
+import sympy as sp
+
+from core_eqs import CoreEqs
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+
+def _load():
+    return CoreEqs.from_tex(ASDF, cache=False)
+
+
+def test_dumps_loads_round_trip():
+    ce = _load()
+    back = CoreEqs.loads(ce.dumps())
+    assert back.tags() == ce.tags()
+    for tag in ce.tags():
+        assert [sp.srepr(e) for e in back.eqs[tag]] == [sp.srepr(e) for e in ce.eqs[tag]]
+        assert back.symbols[tag] == ce.symbols[tag]
+    assert back.index == ce.index
+    assert back.dumps() == ce.dumps()
+
+
+def test_residual_per_line_matches_the_view():
+    ce = _load()
+    for tag in ce.tags():
+        view = ce.residuals[tag]
+        assert [ce.residual(tag, i) for i in range(len(view))] == view
+        for i, r in enumerate(view):
+            assert sorted(s.name for s in r.free_symbols) == [s.name for s in ce.symbols[tag][i]]
+    rec = next(rec for rec in ce.records() if isinstance(rec.obj, sp.Eq))
+    assert ce.residual(rec.tag, rec.i) == rec.obj.lhs - rec.obj.rhs
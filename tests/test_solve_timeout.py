@@ -0,0 +1,98 @@
+"""
+Time-bounded solves: when the SolveWorker times out, fails or answers with nothing
+usable, solve_for and solve_system fall back to the vectorized Newton; a worker that
+runs out of time is killed and replaced.
+"""
+import time
+
+import numpy as np
+import pytest
+import sympy as sp
+
+import core_eqs
+from core_eqs import CoreEqs
+
+TEX = r'''
+\begin{equation}
+\begin{aligned}
+y = x^{3} + x
+\end{aligned}
+\tag{1}
+\end{equation}
+'''
+
+
+class _Worker:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def solve(self, eqs, unknowns, timeout):
+        self.calls += 1
+        return self.reply
+
+
+@pytest.fixture
+def ce(tmp_path):
+    path = tmp_path / 'cubic-equations.tex'
+    path.write_text(TEX, encoding='utf-8')
+    return CoreEqs.from_tex(str(path), cache=False)
+
+
+@pytest.mark.parametrize('reply', [('ok', []), ('timeout', None), ('error', 'NotImplementedError: x')],
+                         ids=['no-solution', 'timeout', 'error'])
+def test_solve_system_falls_back(ce, monkeypatch, reply):
+    worker = _Worker(reply)
+    monkeypatch.setattr(core_eqs, 'solve_worker', lambda: worker)
+    out = ce.solve_system({'y': 10.0}, ['x'], timeout=1.0)
+    assert worker.calls == 1
+    np.testing.assert_allclose(out['x'], 2.0)
+
+
+def test_solve_system_without_timeout_still_raises(ce, monkeypatch):
+    monkeypatch.setattr(core_eqs.sp, 'solve', lambda *a, **k: [])
+    with pytest.raises(ValueError, match='No real solution'):
+        ce.solve_system({'y': 10}, ['x'])
+
+
+def test_solve_for_closed_form(ce, monkeypatch):
+    x = sp.Symbol('x')
+    worker = _Worker(('ok', [{x: sp.Integer(2)}]))
+    monkeypatch.setattr(core_eqs, 'solve_worker', lambda: worker)
+    res = ce.solve_for('1', 'x', {'y': 10}, timeout=1.0)
+    assert (res.status, res.solutions, res.reason) == ('closed_form', [{x: 2}], None)
+
+
+def test_solve_for_timeout_falls_back_and_is_remembered(ce, monkeypatch):
+    worker = _Worker(('timeout', None))
+    monkeypatch.setattr(core_eqs, 'solve_worker', lambda: worker)
+    res = ce.solve_for('1', 'x', {'y': 10.0}, timeout=0.5)
+    assert res.status == 'numeric' and res.reason == 'sp.solve timed out after 0.5s'
+    np.testing.assert_allclose(res.numeric.root, 2.0)
+    again = ce.solve_for('1', 'x', {'y': 10.0}, timeout=0.5)
+    assert again.status == 'numeric' and 'before' in again.reason
+    assert worker.calls == 1
+    ce.solve_for('1', 'x', {'y': 10.0}, timeout=2.0)   # a larger budget tries again
+    assert worker.calls == 2
+
+
+def test_solve_for_without_values_has_no_fallback(ce, monkeypatch):
+    monkeypatch.setattr(core_eqs, 'solve_worker', lambda: _Worker(('error', 'NotImplementedError: x')))
+    res = ce.solve_for('1', 'x', timeout=1.0)
+    assert res.status == 'no_closed_form' and not res.ok
+    assert res.reason.startswith('sp.solve failed: NotImplementedError: x; no numeric fallback')
+
+
+def test_worker_is_killed_and_replaced(monkeypatch):
+    x = sp.Symbol('x')
+    worker = core_eqs.SolveWorker()
+    try:
+        # the child is forked from this process, patched sp.solve included
+        monkeypatch.setattr(core_eqs.sp, 'solve', lambda *a, **k: time.sleep(30))
+        t0 = time.perf_counter()
+        assert worker.solve(x - 1, x, 0.3) == ('timeout', None)
+        assert time.perf_counter() - t0 < 5 and worker.restarts == 1
+        monkeypatch.undo()
+        assert worker.solve(x - 1, x, 30.0) == ('ok', [{x: 1}])
+    finally:
+        worker.close()
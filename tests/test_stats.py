@@ -0,0 +1,58 @@
+"""
+Load and call instrumentation: CoreEqs.stats accounts for every source line, tag and
+stage, counts calls, and is printed by core_eqs.py --stats; the generated class times
+its calls when asked to.
+"""
+import os
+import subprocess
+import sys
+
+import asdf_core
+from core_eqs import CoreEqs
+
+from conftest import ROOT
+
+ASDF = os.path.join(ROOT, 'tests', 'data', 'asdf-equations.tex')
+
+
+def test_load_stats_cover_every_line():
+    ce = CoreEqs.from_tex(ASDF, cache=False)
+    st = ce.stats
+    parsed = sum(1 for _ in ce.records())
+    assert len(st.lines) == parsed + st.skipped
+    assert st.skipped == 2   # the two unparsable lines of the test document
+    assert sorted(st.tags) == ce.tags()
+    assert {path for _, _, path, _ in st.lines} <= set(st.paths)   # no cache: every line parsed
+    assert {'normalize', 'free_symbols'} <= set(st.stages)
+    assert 0 < sum(st.tags.values()) <= st.total
+    slowest = st.slowest_lines(3)
+    assert len(slowest) == 3 and slowest == sorted(slowest, reverse=True)
+    assert [r['line'] for r in st.as_dict(top=3)['slowest_lines']] == [ln for _, _, _, ln in slowest]
+
+
+def test_calls_are_counted():
+    ce = CoreEqs.from_tex(ASDF, cache=False)
+    for _ in range(3):
+        ce.evaluate('1.12', 0, V_i=1, V_x=1, gamma=1.4, p_i=1, p_x=1)
+    ce.solve_for('1.9', 'RT_x')
+    assert ce.stats.calls[('evaluate', '1.12')][0] == 3
+    assert ce.stats.calls[('solve_for', '1.9')][0] == 1
+    report = ce.stats.report(top=2)
+    assert 'Slowest lines (top 2):' in report and 'evaluate' in report
+
+
+def test_stats_flag_prints_the_report():
+    out = subprocess.run([sys.executable, os.path.join(ROOT, 'core_eqs.py'), '--tex', ASDF,
+                          '--no-cache', '--stats', '2'], check=True, capture_output=True,
+                         text=True).stdout
+    assert 'Slowest tags (top 2):' in out and 'Stages:' in out
+
+
+def test_generated_class_times_calls_only_when_asked():
+    assert asdf_core.asdf_Core().call_stats() == []
+    core = asdf_core.asdf_Core(stats=True)
+    core.residual('1.9', 0)
+    core.residual('1.9', 0, p_x=1)
+    core.evaluate('1.9', 0, RT_x=1.0, V_x=1.0, p_x=1.0)
+    rows = {(m, tag, i): n for m, tag, i, n, _ in core.call_stats()}
+    assert rows == {('residual', '1.9', 0): 2, ('evaluate', '1.9', 0): 1}
@@ -0,0 +1,44 @@
+"""
+core_sweep.py over the checked-in asdf_core.py/asdf_numeric.py: the columns do not depend
+on --jobs, closed forms are resolved once up front, and numeric-only symbols go through
+core_eqs.find_roots.
+"""
+import os
+
+import numpy as np
+
+from asdf_numeric import asdf_Numeric
+from core_sweep import closed_forms, load_sweep, sweep
+
+from conftest import ROOT
+
+MODULE = os.path.join(ROOT, 'asdf_core.py')
+ARGS = dict(sample={'gamma': (1.1, 1.4), 'p_e': (1e4, 1e5), 'V_i': (1, 3)}, n=5000, chunk=1000,
+            fixed={'R': 287, 'g': 1, 'T_{cns}': 3000, 'p_{cns}': 5e6, 'V_x': 1, 'p_i': 2, 'p_x': 1},
+            tags=['1.12'], solve=[('1.12', 0, 'p_x'), ('1.18', 0, 'v_e')], quiet=True)
+
+
+def test_jobs_do_not_change_the_columns(tmp_path):
+    one = load_sweep(sweep(MODULE, str(tmp_path / 'one'), jobs=1, **ARGS), mmap=False)
+    two = load_sweep(sweep(MODULE, str(tmp_path / 'two'), jobs=2, **ARGS), mmap=False)
+    assert sorted(one) == sorted(two)
+    for c in one:
+        np.testing.assert_array_equal(one[c], two[c], err_msg=c)
+    # line 1.12 solved for p_x
+    expected = one['V_i'] ** one['gamma'] * 2
+    np.testing.assert_allclose(one['p_x[1.12:0]'], expected, rtol=1e-12)
+
+
+def test_numeric_only_symbols_use_newton(tmp_path):
+    args = dict(ARGS, sample={'p_e': (1e4, 1e5)}, fixed=dict(ARGS['fixed'], v_e=2000.0),
+                tags=None, solve=[('1.18', 0, 'gamma')])
+    spec = {'core': MODULE, 'solve': [['1.18', 0, 'gamma']]}
+    assert closed_forms(spec, timeout=1.0) == [None]   # the codegen timed out on it
+    out = load_sweep(sweep(MODULE, str(tmp_path / 'g'), jobs=1, guess={'gamma': [1.01, 3.0]},
+                           **args), mmap=False)
+    g = out['gamma[1.18:0]']
+    ok = np.isfinite(g)
+    assert ok.any()
+    num = asdf_Numeric()
+    r = num.evaluate('1.18', 0, **dict(args['fixed'], p_e=out['p_e'][ok], gamma=g[ok]))
+    np.testing.assert_allclose(r, 0.0, atol=1e-6)
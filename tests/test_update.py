@@ -0,0 +1,91 @@
+"""
+core-eq.sh --update: with nothing changed the generated modules are left alone; after
+one block is edited only that block is rebuilt, and the result is what a full build of
+the edited document gives (the numeric companion up to how sp.cse shared its terms).
+"""
+import importlib.util
+import os
+import shutil
+import subprocess
+
+import numpy as np
+
+from conftest import ROOT
+
+CORPUS = os.path.join(ROOT, 'bench', 'corpus', 'synthetic-10.tex')
+EDIT = ('\\label{1.3:core}', '\\\\\nx_{new} &= y_{new} + 1\n\\label{1.3:core}')
+
+
+def _run(tex, tmp_path, *flags):
+    env = dict(os.environ, SOURCE_DATE_EPOCH='1735689600', AUTO_OPEN='none',
+               CORE_EQS_SOCKET='off', CORE_EQS_SOLVE_BUDGET='0',
+               CORE_EQS_CACHE=str(tmp_path / 'cache.sqlite3'))
+    env.pop('CORE_EQS_PY', None)
+    return subprocess.run(['bash', os.path.join(ROOT, 'core-eq.sh'), *flags, str(tex)], env=env,
+                          check=True, capture_output=True, text=True).stdout
+
+
+def _source(tmp_path, name):
+    src = tmp_path / name / 'class' / 'src'
+    src.mkdir(parents=True)
+    return src / 'doc.tex'
+
+
+def _outputs(tex):
+    (entry,) = [p for p in tex.parent.parent.iterdir() if p.name != 'src']
+    return {p.name: p for p in entry.iterdir() if p.is_file()}
+
+
+def _load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _edit(tex):
+    text = tex.read_text(encoding='utf-8')
+    assert EDIT[0] in text
+    tex.write_text(text.replace(EDIT[0], EDIT[1], 1), encoding='utf-8')
+
+
+def test_update_leaves_unchanged_modules_alone(tmp_path):
+    tex = _source(tmp_path, 'a')
+    shutil.copy(CORPUS, tex)
+    _run(tex, tmp_path)
+    outputs = _outputs(tex)
+    stamps = {name: p.stat().st_mtime_ns for name, p in outputs.items() if name.endswith('.py')}
+    assert sorted(stamps) == ['doc_core.py', 'doc_numeric.py']
+    out = _run(tex, tmp_path, '-u')
+    assert 'Up to date' in out and 'Updating entry folder' in out
+    assert {name: outputs[name].stat().st_mtime_ns for name in stamps} == stamps
+
+
+def test_update_rebuilds_one_edited_block(tmp_path):
+    tex = _source(tmp_path, 'inc')
+    shutil.copy(CORPUS, tex)
+    _run(tex, tmp_path)
+    _edit(tex)
+    out = _run(tex, tmp_path, '-u')
+    assert '✔ Incremental build: 1 changed or added block(s), 0 removed, 9 reused' in out
+
+    fresh = _source(tmp_path, 'full')
+    shutil.copy(CORPUS, fresh)
+    _edit(fresh)
+    _run(fresh, tmp_path)
+    got, want = _outputs(tex), _outputs(fresh)
+    assert sorted(got) == sorted(want)
+    for name in ('doc-equations.tex', 'doc_core.py'):
+        assert got[name].read_bytes() == want[name].read_bytes(), name
+    assert b"_SYM['y_{new}']" in got['doc_core.py'].read_bytes()
+    # the incremental companion keeps the earlier build's shared subexpressions
+    inc = _load(got['doc_numeric.py'], 'inc_numeric').doc_Numeric()
+    full = _load(want['doc_numeric.py'], 'full_numeric').doc_Numeric()
+    names = sorted({n for tag in full.tags() for i in range(len(full._SYMNAMES[tag]))
+                    for n in full.symbols(tag, i)})
+    values = {n: np.random.default_rng(k).uniform(1.1, 2.0, 20) for k, n in enumerate(names)}
+    with np.errstate(all='ignore'):
+        a, b = inc.evaluate_all(**values), full.evaluate_all(**values)
+    assert list(a) == list(b)
+    for tag in b:
+        np.testing.assert_allclose(a[tag], b[tag], rtol=1e-12, err_msg=tag)